@@ -43,7 +43,9 @@ CLI Usage:
     mcp-remote-exec                    # stdio mode (Claude Desktop)
 """
 
+from importlib import import_module
 from importlib.metadata import version, PackageNotFoundError
+from typing import TYPE_CHECKING, Any
 
 try:
     __version__ = version("mcp-remote-exec")
@@ -52,32 +54,75 @@ except PackageNotFoundError:
 
 __description__ = "SSH MCP Remote Exec for remote server management"
 
-# Package exports
-from .common import ResponseFormat
-from .config import SSHConfig, HostConfig, SecurityConfig
-from .data_access import (
-    SSHConnectionManager,
-    SFTPManager,
-    ExecutionResult,
-    FileTransferResult,
-    SSHConnectionError,
-    SFTPError,
-    AuthenticationError,
-    CommandExecutionError,
-    FileValidationError,
-)
-from .services import (
-    CommandService,
-    FileTransferService,
-    OutputFormatter,
-    FormattedResult,
-)
-from .presentation import (
-    SSHExecCommandInput,
-    SSHUploadFileInput,
-    SSHDownloadFileInput,
-    ServiceContainer,
-)
+# Package exports are resolved lazily (PEP 562) so that importing the package,
+# e.g. for __version__ or CLI --help, does not pull in paramiko, pydantic models
+# or FastMCP until one of the exported names is actually used.
+_EXPORTS: dict[str, str] = {
+    "ResponseFormat": "mcp_remote_exec.common",
+    "SSHConfig": "mcp_remote_exec.config",
+    "HostConfig": "mcp_remote_exec.config",
+    "SecurityConfig": "mcp_remote_exec.config",
+    "SSHConnectionManager": "mcp_remote_exec.data_access",
+    "SFTPManager": "mcp_remote_exec.data_access",
+    "ExecutionResult": "mcp_remote_exec.data_access",
+    "FileTransferResult": "mcp_remote_exec.data_access",
+    "SSHConnectionError": "mcp_remote_exec.data_access",
+    "SFTPError": "mcp_remote_exec.data_access",
+    "AuthenticationError": "mcp_remote_exec.data_access",
+    "CommandExecutionError": "mcp_remote_exec.data_access",
+    "FileValidationError": "mcp_remote_exec.data_access",
+    "CommandService": "mcp_remote_exec.services",
+    "FileTransferService": "mcp_remote_exec.services",
+    "OutputFormatter": "mcp_remote_exec.services",
+    "FormattedResult": "mcp_remote_exec.services",
+    "SSHExecCommandInput": "mcp_remote_exec.presentation",
+    "SSHUploadFileInput": "mcp_remote_exec.presentation",
+    "SSHDownloadFileInput": "mcp_remote_exec.presentation",
+    "ServiceContainer": "mcp_remote_exec.presentation",
+}
+
+if TYPE_CHECKING:
+    from .common import ResponseFormat
+    from .config import SSHConfig, HostConfig, SecurityConfig
+    from .data_access import (
+        SSHConnectionManager,
+        SFTPManager,
+        ExecutionResult,
+        FileTransferResult,
+        SSHConnectionError,
+        SFTPError,
+        AuthenticationError,
+        CommandExecutionError,
+        FileValidationError,
+    )
+    from .services import (
+        CommandService,
+        FileTransferService,
+        OutputFormatter,
+        FormattedResult,
+    )
+    from .presentation import (
+        SSHExecCommandInput,
+        SSHUploadFileInput,
+        SSHDownloadFileInput,
+        ServiceContainer,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name on first access and cache it on the package"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily exported names in dir()"""
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "SSHConfig",
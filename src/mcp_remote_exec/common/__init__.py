@@ -7,9 +7,11 @@ dependencies and maintain clean architecture.
 """
 
 from mcp_remote_exec.common.enums import ResponseFormat
+from mcp_remote_exec.common.json_utils import dumps
 from mcp_remote_exec.common.validators import validate_octal_permissions
 
 __all__ = [
     "ResponseFormat",
+    "dumps",
     "validate_octal_permissions",
 ]
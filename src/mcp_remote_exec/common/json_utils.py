@@ -0,0 +1,36 @@
+"""
+JSON Utilities for SSH MCP Remote Exec
+
+Serializes JSON tool responses with the standard library json module, in
+either an indented or a compact layout.
+"""
+
+import json
+from typing import Any
+
+__all__ = [
+    "dumps",
+]
+
+
+def dumps(obj: Any, pretty: bool = True) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Pretty output is indented by two spaces; compact output has no whitespace
+    between tokens. Non-ASCII text is emitted as UTF-8 instead of ``\\u``
+    escapes in both layouts.
+
+    Args:
+        obj: JSON-serializable object (dicts, lists, str, int, float, bool, None)
+        pretty: Indent by two spaces (True) or emit compact JSON (False)
+
+    Returns:
+        JSON string
+
+    Raises:
+        TypeError: If obj contains a value that cannot be serialized
+    """
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
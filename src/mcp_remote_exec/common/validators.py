@@ -4,7 +4,13 @@ Common Validators for SSH MCP Remote Exec
 Shared validation functions used across multiple layers and Pydantic models.
 """
 
-from typing import Any
+__all__ = [
+    "validate_octal_permissions",
+    "pydantic_permissions_field_validator",
+]
+
+# Translation table that deletes every octal digit; anything left over is invalid
+_DELETE_OCTAL_DIGITS = str.maketrans("", "", "01234567")
 
 
 def validate_octal_permissions(v: int | None) -> int | None:
@@ -30,43 +36,31 @@ def validate_octal_permissions(v: int | None) -> int | None:
     if v is None:
         return v
 
-    # Check each digit is valid octal (0-7)
-    for digit in str(v):
-        if int(digit) > 7:
-            raise ValueError(
-                f"Invalid octal permission value: {v}. "
-                "Each digit must be 0-7. Common values: 644 (rw-r--r--), "
-                "755 (rwxr-xr-x), 600 (rw-------), 700 (rwx------)"
-            )
+    # Check each digit is valid octal (0-7) in a single C-level pass
+    if str(v).translate(_DELETE_OCTAL_DIGITS):
+        raise ValueError(
+            f"Invalid octal permission value: {v}. "
+            "Each digit must be 0-7. Common values: 644 (rw-r--r--), "
+            "755 (rwxr-xr-x), 600 (rw-------), 700 (rwx------)"
+        )
     return v
 
 
-def pydantic_permissions_field_validator(cls: Any, v: int | None) -> int | None:
-    """
-    Pydantic-compatible field validator for octal permissions.
-
-    This is a reusable field validator that can be used with Pydantic's
-    @field_validator decorator to validate permissions fields across models.
-
-    Usage:
-        from mcp_remote_exec.common.validators import pydantic_permissions_field_validator
+pydantic_permissions_field_validator = staticmethod(validate_octal_permissions)
+"""
+Pydantic-compatible field validator for octal permissions.
 
-        class MyModel(BaseModel):
-            permissions: int | None = None
+A staticmethod alias of validate_octal_permissions, so Pydantic calls the
+validator directly instead of going through a wrapper that drops ``cls``.
 
-            # Use as field validator
-            validate_permissions = field_validator("permissions")(
-                pydantic_permissions_field_validator
-            )
+Usage:
+    from mcp_remote_exec.common.validators import pydantic_permissions_field_validator
 
-    Args:
-        cls: Pydantic model class (automatically provided by decorator)
-        v: Permission value to validate
+    class MyModel(BaseModel):
+        permissions: int | None = None
 
-    Returns:
-        The validated permission value
-
-    Raises:
-        ValueError: If any digit is > 7 (invalid octal)
-    """
-    return validate_octal_permissions(v)
+        # Use as field validator
+        validate_permissions = field_validator("permissions")(
+            pydantic_permissions_field_validator
+        )
+"""
@@ -21,6 +21,55 @@ DEFAULT_TIMEOUT = 30
 DEFAULT_SSH_PORT = 22
 """Default SSH port number"""
 
+DEFAULT_SSH_KEEPALIVE_INTERVAL = 30
+"""Seconds between SSH keepalive packets on idle transports (like ServerAliveInterval)"""
+
+# =============================================================================
+# SSH Connection Pool Constants
+# =============================================================================
+
+DEFAULT_POOL_MAX_IDLE_PER_HOST = 4
+"""Maximum number of idle SSH clients kept per (host, port, user, auth) key"""
+
+DEFAULT_POOL_IDLE_TIMEOUT = 300
+"""Seconds an idle pooled SSH client is kept before it is closed"""
+
+DEFAULT_MAX_SESSIONS_PER_TRANSPORT = 8
+"""Command sessions run on one pooled SSH transport before it is replaced"""
+
+# =============================================================================
+# SFTP Transfer Constants
+# =============================================================================
+
+DEFAULT_SFTP_MAX_UNCONFIRMED = 64
+"""Default number of SFTP read requests kept in flight during downloads"""
+
+DEFAULT_SFTP_WINDOW_SIZE = 16 * 1024 * 1024  # 16MB
+"""SSH channel window size requested for SFTP sessions
+
+Paramiko's default 2MB window caps throughput on high bandwidth-delay links;
+a larger window lets more data be in flight before waiting for window adjusts.
+"""
+
+DEFAULT_SFTP_STAT_CACHE_TTL = 1.0
+"""Seconds a successful remote stat result is reused (misses are never cached)"""
+
+DEFAULT_SFTP_PARALLEL_THRESHOLD = 4 * 1024 * 1024  # 4MB
+"""Downloads at least this large are split into ranges fetched in parallel"""
+
+DEFAULT_SFTP_PARALLEL_PARTS = 4
+"""Number of SFTP channels a single large download is split across"""
+
+# =============================================================================
+# Command Result Cache Constants
+# =============================================================================
+
+DEFAULT_COMMAND_CACHE_SIZE = 256
+"""Maximum number of command results kept in the result cache"""
+
+DEFAULT_COMMAND_CACHE_TTL = 30
+"""Seconds a cached command result is reused before the command runs again"""
+
 # =============================================================================
 # Output Formatter Constants
 # =============================================================================
@@ -55,6 +104,20 @@ __all__ = [
     "DEFAULT_MAX_FILE_SIZE",
     "DEFAULT_TIMEOUT",
     "DEFAULT_SSH_PORT",
+    "DEFAULT_SSH_KEEPALIVE_INTERVAL",
+    # SSH Connection Pool
+    "DEFAULT_POOL_MAX_IDLE_PER_HOST",
+    "DEFAULT_POOL_IDLE_TIMEOUT",
+    "DEFAULT_MAX_SESSIONS_PER_TRANSPORT",
+    # SFTP Transfers
+    "DEFAULT_SFTP_MAX_UNCONFIRMED",
+    "DEFAULT_SFTP_WINDOW_SIZE",
+    "DEFAULT_SFTP_STAT_CACHE_TTL",
+    "DEFAULT_SFTP_PARALLEL_THRESHOLD",
+    "DEFAULT_SFTP_PARALLEL_PARTS",
+    # Command Result Cache
+    "DEFAULT_COMMAND_CACHE_SIZE",
+    "DEFAULT_COMMAND_CACHE_TTL",
     # Output Formatting
     "JSON_METADATA_OVERHEAD",
     "MIN_OUTPUT_SPACE",
@@ -17,6 +17,7 @@ Configuration Pattern:
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 
 from mcp_remote_exec.common.constants import MAX_TIMEOUT
 from mcp_remote_exec.config.exceptions import ConfigError
@@ -25,10 +26,31 @@ from mcp_remote_exec.config.constants import (
     DEFAULT_MAX_FILE_SIZE,
     DEFAULT_TIMEOUT,
     DEFAULT_SSH_PORT,
+    DEFAULT_SFTP_MAX_UNCONFIRMED,
+    DEFAULT_MAX_SESSIONS_PER_TRANSPORT,
 )
 
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+"""Accepted (case-insensitive) values for boolean environment flags"""
 
-@dataclass
+
+def _env_flag(name: str, default: bool) -> bool:
+    """Read a boolean flag from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is not set
+
+    Returns:
+        True if the value is one of _TRUTHY (case-insensitive), otherwise False
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().casefold() in _TRUTHY
+
+
+@dataclass(slots=True, frozen=True)
 class HostConfig:
     """Configuration for a single SSH host"""
 
@@ -40,11 +62,15 @@ class HostConfig:
     key_path: str | None = None
 
     def has_auth(self) -> bool:
-        """Check if authentication method is configured"""
-        return bool(self.password or self.key_path)
+        """Check if authentication method is configured
+
+        Empty SSH_PASSWORD/SSH_KEY values are normalized to None when the
+        config is loaded, so a None check is sufficient here.
+        """
+        return self.password is not None or self.key_path is not None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SecurityConfig:
     """Security and limit configurations
 
@@ -58,6 +84,8 @@ class SecurityConfig:
     default_timeout: int
     max_timeout: int
     strict_host_key_checking: bool = True
+    sftp_max_unconfirmed: int = DEFAULT_SFTP_MAX_UNCONFIRMED
+    max_sessions_per_transport: int = DEFAULT_MAX_SESSIONS_PER_TRANSPORT
 
 
 class SSHConfig:
@@ -65,9 +93,11 @@ class SSHConfig:
 
     def __init__(self) -> None:
         """Initialize configuration from environment variables"""
+        env = os.environ
+
         # STEP 1: Check risk acceptance FIRST before any other initialization
         # This is the most critical validation and must fail fast
-        accept_risks = os.getenv("I_ACCEPT_RISKS", "false").lower() == "true"
+        accept_risks = _env_flag("I_ACCEPT_RISKS", default=False)
         if not accept_risks:
             raise ConfigError(
                 "You must explicitly accept the risks before using this software.\n"
@@ -84,15 +114,27 @@ class SSHConfig:
         self.security = SecurityConfig(
             accept_risks=accept_risks,
             character_limit=int(
-                os.getenv("CHARACTER_LIMIT", str(DEFAULT_CHARACTER_LIMIT))
+                env.get("CHARACTER_LIMIT", str(DEFAULT_CHARACTER_LIMIT))
             ),
-            max_file_size=int(os.getenv("MAX_FILE_SIZE", str(DEFAULT_MAX_FILE_SIZE))),
-            default_timeout=int(os.getenv("TIMEOUT", str(DEFAULT_TIMEOUT))),
+            max_file_size=int(env.get("MAX_FILE_SIZE", str(DEFAULT_MAX_FILE_SIZE))),
+            default_timeout=int(env.get("TIMEOUT", str(DEFAULT_TIMEOUT))),
             max_timeout=MAX_TIMEOUT,
-            strict_host_key_checking=os.getenv(
-                "SSH_STRICT_HOST_KEY_CHECKING", "true"
-            ).lower()
-            == "true",
+            strict_host_key_checking=_env_flag(
+                "SSH_STRICT_HOST_KEY_CHECKING", default=True
+            ),
+            sftp_max_unconfirmed=max(
+                1,
+                int(env.get("SFTP_MAX_UNCONFIRMED", str(DEFAULT_SFTP_MAX_UNCONFIRMED))),
+            ),
+            max_sessions_per_transport=max(
+                1,
+                int(
+                    env.get(
+                        "SSH_MAX_SESSIONS_PER_TRANSPORT",
+                        str(DEFAULT_MAX_SESSIONS_PER_TRANSPORT),
+                    )
+                ),
+            ),
         )
 
         # STEP 3: Load host configuration (may fail if SSH key not found, etc.)
@@ -103,17 +145,35 @@ class SSHConfig:
         if not valid:
             raise ConfigError(error or "Configuration validation failed")
 
+    @classmethod
+    @lru_cache(maxsize=1)
+    def from_env(cls) -> "SSHConfig":
+        """Get the configuration parsed from the environment, parsing it only once.
+
+        Repeated calls return the same instance. Use from_env.cache_clear() to
+        force the environment to be parsed again (e.g. in tests).
+
+        Returns:
+            Shared SSHConfig instance
+
+        Raises:
+            ConfigError: If the configuration is invalid (not cached)
+        """
+        return cls()
+
     def _load_host_config(self) -> HostConfig:
         """Load SSH host configuration from environment variables"""
-        host = os.getenv("HOST")
+        env = os.environ
+        host = env.get("HOST")
         if not host:
             raise ConfigError(
                 "No SSH host configuration found. Set HOST environment variable"
             )
 
-        port = int(os.getenv("SSH_PORT", str(DEFAULT_SSH_PORT)))
-        username = os.getenv("SSH_USERNAME", "root")
-        key_path = os.getenv("SSH_KEY")
+        port = int(env.get("SSH_PORT", str(DEFAULT_SSH_PORT)))
+        username = env.get("SSH_USERNAME", "root")
+        # Treat empty values (e.g. "SSH_KEY=" from .env.example) as unset
+        key_path = env.get("SSH_KEY") or None
 
         # Validate SSH key path exists if specified
         if key_path and not os.path.exists(key_path):
@@ -127,7 +187,7 @@ class SSHConfig:
             host=host,
             port=port,
             username=username,
-            password=os.getenv("SSH_PASSWORD"),
+            password=env.get("SSH_PASSWORD") or None,
             key_path=key_path,
         )
 
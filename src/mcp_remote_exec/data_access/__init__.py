@@ -9,6 +9,7 @@ from mcp_remote_exec.data_access.ssh_connection_manager import (
     SSHConnectionManager,
     ExecutionResult,
 )
+from mcp_remote_exec.data_access.ssh_pool import SSHConnectionPool, get_default_pool
 from mcp_remote_exec.data_access.sftp_manager import SFTPManager, FileTransferResult
 from mcp_remote_exec.data_access.exceptions import (
     SSHConnectionError,
@@ -22,6 +23,8 @@ from mcp_remote_exec.data_access.path_validator import PathValidator
 __all__ = [
     "SSHConnectionManager",
     "SFTPManager",
+    "SSHConnectionPool",
+    "get_default_pool",
     "ExecutionResult",
     "FileTransferResult",
     "SSHConnectionError",
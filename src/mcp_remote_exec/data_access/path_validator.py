@@ -5,87 +5,122 @@ Centralized path validation to prevent directory traversal and ensure file secur
 """
 
 import os
+import re
+from functools import lru_cache
 
 from mcp_remote_exec.config.constants import MSG_PATH_TRAVERSAL_ERROR
 from mcp_remote_exec.data_access.exceptions import FileValidationError
 
+__all__ = [
+    "validate_path",
+    "check_paths_for_traversal",
+    "PathValidator",
+]
 
-class PathValidator:
-    """Validates file paths for security and correctness"""
-
-    @staticmethod
-    def validate_path(
-        path: str,
-        *,
-        check_traversal: bool = True,
-        check_exists: bool = False,
-        path_type: str = "path",
-    ) -> None:
-        """
-        Validate a file path for security and correctness.
-
-        Args:
-            path: The file path to validate
-            check_traversal: Whether to check for directory traversal attempts
-            check_exists: Whether to check if the path exists
-            path_type: Description of path type for error messages (e.g., "local", "remote")
-
-        Raises:
-            FileValidationError: If validation fails
-        """
-        if not path or not path.strip():
-            raise FileValidationError(
-                f"{path_type.capitalize()} path cannot be empty",
-                file_path=path,
-                reason="empty_path",
-            )
+# A ".." path component, delimited by either separator or the string boundaries
+_TRAVERSAL_RE = re.compile(r"(?:^|[/\\])\.\.(?:[/\\]|$)")
+
+
+@lru_cache(maxsize=4096)
+def _check_traversal_cached(path: str) -> str | None:
+    """
+    Check a path for directory traversal.
+
+    Any ".." component is rejected, including ones that would normalize away
+    (e.g. "a/b/../c"); names that merely contain dots ("foo..bar") are allowed.
+    The result depends only on the path string (not on filesystem state), so it
+    is memoized; repeated validation of the same path is a dict lookup.
+
+    Args:
+        path: The file path to check
+
+    Returns:
+        Failure reason ("directory_traversal") or None if the path is safe
+    """
+    # Substring prefilter keeps the common safe path off the regex engine
+    if ".." in path and _TRAVERSAL_RE.search(path):
+        return "directory_traversal"
+    return None
+
+
+def validate_path(
+    path: str,
+    *,
+    check_traversal: bool = True,
+    check_exists: bool = False,
+    path_type: str = "path",
+) -> None:
+    """
+    Validate a file path for security and correctness.
+
+    Args:
+        path: The file path to validate
+        check_traversal: Whether to check for directory traversal attempts
+        check_exists: Whether to check if the path exists
+        path_type: Description of path type for error messages (e.g., "local", "remote")
 
-        # Check for directory traversal
-        if check_traversal:
-            normalized_path = os.path.normpath(path)
-            if ".." in normalized_path:
-                raise FileValidationError(
-                    MSG_PATH_TRAVERSAL_ERROR,
-                    file_path=path,
-                    reason="directory_traversal",
-                )
-
-        # Check if path exists (when required)
-        if check_exists and not os.path.exists(path):
+    Raises:
+        FileValidationError: If validation fails
+    """
+    if not path or path.isspace():
+        raise FileValidationError(
+            f"{path_type.capitalize()} path cannot be empty",
+            file_path=path,
+            reason="empty_path",
+        )
+
+    # Check for directory traversal
+    if check_traversal:
+        reason = _check_traversal_cached(path)
+        if reason is not None:
             raise FileValidationError(
-                f"{path_type.capitalize()} path does not exist: {path}",
+                MSG_PATH_TRAVERSAL_ERROR,
                 file_path=path,
-                reason="path_not_found",
+                reason=reason,
             )
 
-    @staticmethod
-    def check_paths_for_traversal(
-        *paths: str,
-    ) -> tuple[bool, str | None]:
-        """
-        Check multiple paths for directory traversal attempts.
-
-        This is a convenience method that validates multiple paths and returns
-        a tuple format for easy error handling in service layers. It uses
-        validate_path() internally to eliminate duplicate validation logic.
-
-        Args:
-            *paths: Variable number of paths to check
-
-        Returns:
-            Tuple of (is_valid, error_message)
-            - is_valid: True if all paths are safe, False otherwise
-            - error_message: None if valid, error description if invalid
-        """
-        for path in paths:
-            try:
-                # Use validate_path internally to eliminate duplicate logic
-                PathValidator.validate_path(
-                    path,
-                    check_traversal=True,
-                    check_exists=False,
-                    path_type="path",
-                )
-            except FileValidationError as e:
-                return False, str(e)
-        return True, None
+    # Check if path exists (when required); never cached, filesystem state changes
+    if check_exists and not os.path.exists(path):
+        raise FileValidationError(
+            f"{path_type.capitalize()} path does not exist: {path}",
+            file_path=path,
+            reason="path_not_found",
+        )
+
+
+def check_paths_for_traversal(
+    *paths: str,
+) -> tuple[bool, str | None]:
+    """
+    Check multiple paths for directory traversal attempts.
+
+    This is a convenience function that validates multiple paths and returns
+    a tuple format for easy error handling in service layers. It applies the
+    same empty-path and traversal rules as validate_path() in a single loop,
+    without raising and catching an exception per path.
+
+    Args:
+        *paths: Variable number of paths to check
+
+    Returns:
+        Tuple of (is_valid, error_message)
+        - is_valid: True if all paths are safe, False otherwise
+        - error_message: None if valid, error description if invalid
+    """
+    for path in paths:
+        if not path or path.isspace():
+            return False, "Path path cannot be empty"
+        if _check_traversal_cached(path) is not None:
+            return False, MSG_PATH_TRAVERSAL_ERROR
+    return True, None
+
+
+class PathValidator:
+    """Validates file paths for security and correctness
+
+    Kept for backward compatibility; new code should call the module-level
+    validate_path() and check_paths_for_traversal() functions directly.
+    """
+
+    validate_path = staticmethod(validate_path)
+    check_paths_for_traversal = staticmethod(check_paths_for_traversal)
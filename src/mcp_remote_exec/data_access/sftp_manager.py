@@ -5,24 +5,78 @@ Handles file upload/download operations via SFTP with security validation
 and proper error handling.
 """
 
+import hashlib
 import logging
+import mmap
 import os
+import shlex
+import shutil
+import stat
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
-
-from paramiko import SFTPClient, SSHException
+from functools import lru_cache
+from typing import IO, TYPE_CHECKING, BinaryIO, cast
 
+from mcp_remote_exec.common.validators import validate_octal_permissions
+from mcp_remote_exec.config.constants import (
+    DEFAULT_SFTP_PARALLEL_PARTS,
+    DEFAULT_SFTP_PARALLEL_THRESHOLD,
+    DEFAULT_SFTP_STAT_CACHE_TTL,
+    DEFAULT_SFTP_WINDOW_SIZE,
+)
 from mcp_remote_exec.data_access.exceptions import SFTPError, FileValidationError
-from mcp_remote_exec.data_access.path_validator import PathValidator
+from mcp_remote_exec.data_access.path_validator import validate_path
 
 if TYPE_CHECKING:
+    from paramiko import SFTPAttributes, SFTPClient, SFTPFile
     from mcp_remote_exec.data_access.ssh_connection_manager import SSHConnectionManager
 
 _log = logging.getLogger(__name__)
 
+_SFTP_CHUNK_SIZE = 32768  # Matches paramiko's maximum SFTP write request size
+_MMAP_MIN_SIZE = 1024 * 1024  # Smaller uploads are not worth the mmap setup cost
+_STREAM_CHUNK_SIZE = 256 * 1024  # Bytes read per chunk from upload_stream() sources
+_STAT_CACHE_PRUNE_SIZE = 256  # Drop expired stat entries once the cache grows past this
+
+
+@lru_cache(maxsize=32)
+def _parse_octal_permissions(permissions: int) -> int:
+    """
+    Convert permissions written as a decimal int in octal notation to a mode.
+
+    Only a handful of values (644, 755, 600, 700) are used in practice, so
+    results are memoized.
+
+    Args:
+        permissions: Permissions in octal notation, e.g. 644
+
+    Returns:
+        Decoded mode, e.g. 644 -> 0o644 (420 in decimal)
+
+    Raises:
+        ValueError: If any digit is not 0-7
+    """
+    validate_octal_permissions(permissions)
+    return int(str(permissions), 8)
+
+
+class _HashingWriter:
+    """File-like wrapper that hashes everything written through it"""
 
-@dataclass
+    def __init__(self, file: BinaryIO, digest: "hashlib._Hash") -> None:
+        self._file = file
+        self._digest = digest
+
+    def write(self, data: bytes) -> int:
+        self._digest.update(data)
+        return self._file.write(data)
+
+
+@dataclass(slots=True, frozen=True)
 class FileTransferResult:
     """Result of file transfer operation"""
 
@@ -37,30 +91,74 @@ class FileTransferResult:
         None  # Remote server path (destination for upload, source for download)
     )
     operation: str = ""  # Type of operation: "upload" or "download"
+    sha256: str | None = (
+        None  # Verified SHA-256 hex digest (when verification was requested)
+    )
 
 
 class SFTPManager:
-    """Manages SFTP operations for file transfers"""
+    """Manages SFTP operations for file transfers
+
+    Use as a context manager or call close_sftp_connection() when done; the
+    SFTP channel is not closed on garbage collection (it is also closed when
+    the underlying SSH connection is).
+    """
 
     def __init__(self, connection_manager: "SSHConnectionManager") -> None:
         """Initialize SFTP manager with connection manager"""
         self.connection_manager = connection_manager
-        self._sftp_client: SFTPClient | None = None
+        self._sftp_client: "SFTPClient | None" = None
+        # Guards lazy creation of the shared channel: tool calls run
+        # concurrently in worker threads and must not each open one
+        self._sftp_client_lock = threading.Lock()
+        self._max_file_size = connection_manager.config.security.max_file_size
+        self._channel_lock = threading.Lock()
+        # remote path -> (expires_at, attributes); misses are not cached
+        self._stat_cache: dict[str, tuple[float, "SFTPAttributes"]] = {}
+        self._stat_cache_lock = threading.Lock()
 
-    def _get_sftp_client(self) -> SFTPClient:
-        """Get SFTP client, creating if needed"""
-        if self._sftp_client is None:
-            try:
+    def invalidate_config_cache(self) -> None:
+        """Re-read limits cached from the connection manager's config"""
+        self._max_file_size = self.connection_manager.config.security.max_file_size
+
+    def _open_sftp_channel(self) -> "SFTPClient":
+        """Open a new SFTP channel on the shared SSH transport"""
+        from paramiko import SFTPClient, SSHException
+
+        try:
+            # Serialized so concurrent workers do not race to create the
+            # underlying SSH connection
+            with self._channel_lock:
                 ssh_client = self.connection_manager.get_connection()
-                self._sftp_client = ssh_client.open_sftp()
-                _log.info("Created SFTP client")
-            except SSHException as e:
-                raise SFTPError(
-                    f"Failed to create SFTP client: {str(e)}",
-                    operation="connect",
+                transport = ssh_client.get_transport()
+                if transport is None:
+                    raise SSHException("SSH transport is not connected")
+                # Open the SFTP channel with a larger window than open_sftp()
+                # would use, so bulk transfers are not window-limited
+                sftp_client = SFTPClient.from_transport(
+                    transport, window_size=DEFAULT_SFTP_WINDOW_SIZE
                 )
+            if sftp_client is None:
+                raise SSHException("Failed to open SFTP channel")
+            return sftp_client
+        except SSHException as e:
+            raise SFTPError(
+                f"Failed to create SFTP client: {str(e)}",
+                operation="connect",
+            )
 
-        return self._sftp_client
+    def _get_sftp_client(self) -> "SFTPClient":
+        """Get the shared SFTP client, creating it on first use"""
+        sftp_client = self._sftp_client
+        if sftp_client is not None:
+            return sftp_client
+
+        with self._sftp_client_lock:
+            # Another thread may have created it while we waited
+            if self._sftp_client is None:
+                self._sftp_client = self._open_sftp_channel()
+                _log.info("Created SFTP client")
+            return self._sftp_client
 
     def _validate_file_path(
         self,
@@ -71,7 +169,7 @@ class SFTPManager:
         """
         Validate file path for security (prevent directory traversal).
 
-        Delegates to PathValidator for centralized validation logic.
+        Delegates to path_validator for centralized validation logic.
 
         Args:
             file_path: Path to validate
@@ -79,31 +177,36 @@ class SFTPManager:
             check_existence: Whether to check if local file exists
         """
         path_type = "remote" if remote_operation else "local"
-        PathValidator.validate_path(
+        validate_path(
             file_path,
             check_traversal=True,
             check_exists=(check_existence and not remote_operation),
             path_type=path_type,
         )
 
-    def _validate_file_size(self, file_path: str) -> int:
-        """Validate file size against limits for upload operations.
+    def _stat_and_validate(self, file_path: str) -> int:
+        """Check a local upload source exists and is within the size limit.
+
+        Uses a single os.stat() for both the existence and size checks, so
+        callers should skip the existence check in _validate_file_path().
 
         Note: For downloads, file size is validated in download_file() after
         retrieving remote file stats via SFTP. This method is only used for uploads.
+
+        Returns:
+            Size of the file in bytes
         """
-        max_size = self.connection_manager.config.security.max_file_size
+        max_size = self._max_file_size
 
-        # Local file size check for upload
-        if not os.path.exists(file_path):
+        try:
+            file_size = os.stat(file_path).st_size
+        except OSError:
             raise FileValidationError(
-                f"Local file does not exist: {file_path}",
+                f"Local path does not exist: {file_path}",
                 file_path,
-                "file_not_found",
+                "path_not_found",
             )
 
-        file_size = os.path.getsize(file_path)
-
         if file_size > max_size:
             size_mb = file_size / (1024 * 1024)
             limit_mb = max_size / (1024 * 1024)
@@ -115,12 +218,309 @@ class SFTPManager:
 
         return file_size
 
+    @staticmethod
+    def _put_file(
+        sftp_client: "SFTPClient",
+        local_path: str,
+        remote_path: str,
+        exclusive: bool,
+        digest: "hashlib._Hash | None" = None,
+    ) -> None:
+        """
+        Stream a local file to the remote host through a pipelined SFTP handle.
+
+        Failures are reported by stage: a failed remote open propagates as the
+        original IOError (so the caller can tell an existing destination apart),
+        anything else is raised as SFTPError. A partial remote file left by a
+        failed write is removed.
+
+        Args:
+            sftp_client: Open SFTP client
+            local_path: Local source file
+            remote_path: Remote destination file
+            exclusive: Open with "xb" (fail if the remote file exists) instead of
+                       "wb" (create or truncate)
+            digest: Optional hash object updated with every chunk sent
+
+        Raises:
+            IOError: If the remote file could not be opened
+            SFTPError: If the local file could not be read or a write failed
+        """
+        mode = "xb" if exclusive else "wb"
+        # Open the local file first so a missing source never creates an empty remote file
+        try:
+            local_file = open(local_path, "rb")
+        except OSError as e:
+            raise SFTPError(
+                f"File transfer failed: {str(e)}", operation="upload", path=local_path
+            )
+        with local_file:
+            file_size = os.fstat(local_file.fileno()).st_size
+            remote_handle = sftp_client.open(remote_path, mode)
+            try:
+                with remote_handle as remote_file:
+                    # Send writes without waiting for each acknowledgement
+                    remote_file.set_pipelined(True)
+                    SFTPManager._write_local_file(
+                        local_file, remote_file, file_size, digest
+                    )
+            except Exception as e:
+                SFTPManager._remove_partial(sftp_client, remote_path)
+                raise SFTPError(
+                    f"File transfer failed: {str(e)}",
+                    operation="upload",
+                    path=remote_path,
+                )
+
+    @staticmethod
+    def _write_local_file(
+        local_file: BinaryIO,
+        remote_file: "SFTPFile",
+        file_size: int,
+        digest: "hashlib._Hash | None",
+    ) -> None:
+        """Copy an open local file into an open remote file in SFTP-sized chunks"""
+        if file_size >= _MMAP_MIN_SIZE:
+            # Hand paramiko slices of the mapped file instead of read() copies;
+            # chunks are released before unmapping
+            with (
+                mmap.mmap(local_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+                memoryview(mapped) as view,
+            ):
+                for offset in range(0, len(view), _SFTP_CHUNK_SIZE):
+                    with view[offset : offset + _SFTP_CHUNK_SIZE] as window:
+                        if digest is not None:
+                            digest.update(window)
+                        remote_file.write(window)
+            return
+        if digest is None:
+            shutil.copyfileobj(local_file, remote_file, _SFTP_CHUNK_SIZE)
+            return
+        while chunk := local_file.read(_SFTP_CHUNK_SIZE):
+            digest.update(chunk)
+            remote_file.write(chunk)
+
+    @staticmethod
+    def _remove_partial(sftp_client: "SFTPClient", remote_path: str) -> None:
+        """Best-effort removal of a partially written remote file"""
+        try:
+            sftp_client.remove(remote_path)
+        except Exception as e:
+            _log.warning("Failed to remove partial upload %s: %s", remote_path, e)
+
+    def _get_ranges(
+        self,
+        remote_path: str,
+        local_path: str,
+        file_size: int,
+        max_requests: int,
+        parts: int = DEFAULT_SFTP_PARALLEL_PARTS,
+    ) -> None:
+        """
+        Download a file as byte ranges fetched concurrently on separate channels.
+
+        A single SFTP channel is limited by its own window and request queue;
+        splitting a large file across several channels on the same transport
+        keeps more data in flight. Each range is read with readv() and written
+        at its offset in a preallocated local file.
+
+        Args:
+            remote_path: Remote source file
+            local_path: Local destination file
+            file_size: Size of the remote file in bytes
+            max_requests: Read requests kept in flight per channel
+            parts: Number of ranges (and channels) to use
+        """
+        part_size = -(-file_size // parts)
+        ranges = [
+            (start, min(start + part_size, file_size))
+            for start in range(0, file_size, part_size)
+        ]
+        with open(local_path, "wb") as local_file:
+            local_file.truncate(file_size)
+
+        channels: list["SFTPClient"] = []
+
+        def fetch(byte_range: tuple[int, int]) -> None:
+            start, end = byte_range
+            channel = self._open_sftp_channel()
+            channels.append(channel)
+            chunks = [
+                (offset, min(_SFTP_CHUNK_SIZE, end - offset))
+                for offset in range(start, end, _SFTP_CHUNK_SIZE)
+            ]
+            with (
+                channel.open(remote_path, "rb") as remote_file,
+                open(local_path, "r+b") as local_file,
+            ):
+                local_file.seek(start)
+                for data in remote_file.readv(
+                    chunks, max_concurrent_prefetch_requests=max_requests
+                ):
+                    local_file.write(data)
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=len(ranges), thread_name_prefix="sftp-range"
+            ) as executor:
+                list(executor.map(fetch, ranges))
+        finally:
+            for channel in channels:
+                try:
+                    channel.close()
+                except Exception as e:
+                    _log.warning("Error closing SFTP channel: %s", e)
+
+    @staticmethod
+    def _apply_permissions(
+        sftp_client: "SFTPClient", remote_path: str, permissions: int
+    ) -> None:
+        """
+        Set permissions on an uploaded file.
+
+        Args:
+            sftp_client: Open SFTP client
+            remote_path: Remote file to chmod
+            permissions: Permissions in octal notation, e.g. 644
+
+        Raises:
+            FileValidationError: If permissions is not valid octal notation
+        """
+        try:
+            octal_value = _parse_octal_permissions(permissions)
+            sftp_client.chmod(remote_path, octal_value)
+            _log.info(
+                "Set file permissions to %s (%#o) on %s",
+                permissions,
+                octal_value,
+                remote_path,
+            )
+        except ValueError as e:
+            error_msg = f"Invalid permission value: {str(e)}"
+            _log.error(error_msg)
+            raise FileValidationError(error_msg, remote_path, "invalid_permissions")
+        except Exception as e:
+            _log.warning("Failed to set permissions on %s: %s", remote_path, e)
+
+    def _remote_sha256(self, remote_path: str) -> str:
+        """
+        Compute the SHA-256 digest of a remote file with sha256sum.
+
+        Args:
+            remote_path: Remote file to hash
+
+        Returns:
+            Lowercase hex digest
+
+        Raises:
+            SFTPError: If sha256sum fails or its output cannot be parsed
+        """
+        security = self.connection_manager.config.security
+        result = self.connection_manager.execute_command(
+            f"sha256sum -- {shlex.quote(remote_path)}", security.default_timeout
+        )
+        fields = result.stdout.split(maxsplit=1)
+        if result.exit_code != 0 or not fields:
+            raise SFTPError(
+                f"Remote checksum failed: {result.stderr.strip() or 'no output'}",
+                operation="verify",
+                path=remote_path,
+            )
+        return fields[0].lower()
+
+    def _verify_sha256(self, local_digest: str, remote_path: str) -> str | None:
+        """Compare a locally computed digest with the remote file's
+
+        Returns:
+            Error message on mismatch, or None if the digests match
+        """
+        remote_digest = self._remote_sha256(remote_path)
+        if remote_digest != local_digest:
+            return (
+                f"SHA-256 mismatch for {remote_path}: "
+                f"local {local_digest}, remote {remote_digest}"
+            )
+        return None
+
+    def _cached_stat(
+        self, sftp_client: "SFTPClient", remote_path: str
+    ) -> "SFTPAttributes | None":
+        """Stat a remote path, reusing results for DEFAULT_SFTP_STAT_CACHE_TTL
+
+        Only successful stats are cached: commands run over SSH can create a
+        file at any moment, so a miss is always re-checked. Sizes used to plan
+        a transfer must come from _fresh_stat() instead.
+
+        Args:
+            sftp_client: Open SFTP client
+            remote_path: Remote path to stat
+
+        Returns:
+            Remote attributes, or None if the path does not exist or is not accessible
+        """
+        now = time.monotonic()
+        with self._stat_cache_lock:
+            entry = self._stat_cache.get(remote_path)
+        if entry is not None and now < entry[0]:
+            return entry[1]
+
+        try:
+            attrs: "SFTPAttributes" = sftp_client.stat(remote_path)
+        except IOError:
+            return None
+
+        with self._stat_cache_lock:
+            if len(self._stat_cache) >= _STAT_CACHE_PRUNE_SIZE:
+                self._stat_cache = {
+                    path: cached
+                    for path, cached in self._stat_cache.items()
+                    if cached[0] > now
+                }
+            self._stat_cache[remote_path] = (now + DEFAULT_SFTP_STAT_CACHE_TTL, attrs)
+        return attrs
+
+    def _invalidate_stat(self, remote_path: str) -> None:
+        """Forget the cached stat result for a remote path we are modifying"""
+        with self._stat_cache_lock:
+            self._stat_cache.pop(remote_path, None)
+
+    def _fresh_stat(
+        self, sftp_client: "SFTPClient", remote_path: str
+    ) -> "SFTPAttributes | None":
+        """Stat a remote path bypassing the cache, refreshing the cached entry
+
+        Used to size downloads: a cached size may predate a command that grew
+        the file, and a range download planned from it would be truncated.
+        """
+        self._invalidate_stat(remote_path)
+        return self._cached_stat(sftp_client, remote_path)
+
+    def exists(self, remote_path: str) -> bool:
+        """Check whether a regular file exists at a remote path using one SFTP stat
+
+        Equivalent to ``test -f`` but goes over the shared SFTP channel
+        instead of a new exec channel. Directories and other non-regular
+        files report False.
+
+        Args:
+            remote_path: Remote path to check
+
+        Returns:
+            True if the path exists, is accessible and is a regular file
+
+        Raises:
+            SFTPError: If the SFTP channel cannot be opened
+        """
+        attrs = self._cached_stat(self._get_sftp_client(), remote_path)
+        return attrs is not None and stat.S_ISREG(attrs.st_mode or 0)
+
     def upload_file(
         self,
         local_path: str,
         remote_path: str,
         permissions: int | None = None,
         overwrite: bool = False,
+        verify_sha256: bool = False,
     ) -> FileTransferResult:
         """Upload file to remote host via SFTP
 
@@ -133,6 +533,8 @@ class SFTPManager:
                         Common values: 644 (rw-r--r--), 755 (rwxr-xr-x),
                                      600 (rw-------), 700 (rwx------)
             overwrite: Whether to overwrite existing remote files
+            verify_sha256: Hash the file while sending it and compare against
+                          sha256sum run on the remote host afterwards
 
         Returns:
             FileTransferResult with success status and metadata
@@ -141,10 +543,10 @@ class SFTPManager:
         # Validate inputs
         try:
             self._validate_file_path(
-                local_path, remote_operation=False, check_existence=True
+                local_path, remote_operation=False, check_existence=False
             )
             self._validate_file_path(remote_path, remote_operation=True)
-            file_size = self._validate_file_size(local_path)
+            file_size = self._stat_and_validate(local_path)
         except FileValidationError as e:
             return FileTransferResult(
                 success=False,
@@ -154,15 +556,35 @@ class SFTPManager:
                 operation="upload",
             )
 
-        _log.info(f"Starting upload: {local_path} -> {remote_path}")
+        _log.info("Starting upload: %s -> %s", local_path, remote_path)
 
         try:
             sftp_client = self._get_sftp_client()
 
-            # Check if remote file already exists
+            # Transfer the file. The existence check is folded into the open
+            # itself ("xb" fails if the file exists, "wb" truncates it), which
+            # avoids separate stat/remove round trips before the upload.
+            start_time = time.time()
+            self._invalidate_stat(remote_path)
+            digest = hashlib.sha256() if verify_sha256 else None
+
             try:
-                sftp_client.stat(remote_path)
-                if not overwrite:
+                self._put_file(
+                    sftp_client,
+                    local_path,
+                    remote_path,
+                    exclusive=not overwrite,
+                    digest=digest,
+                )
+            except SFTPError:
+                raise
+            except IOError as e:
+                # Only the remote open raises a bare IOError; after a failed
+                # exclusive open an existing file means the path was taken
+                if (
+                    not overwrite
+                    and self._cached_stat(sftp_client, remote_path) is not None
+                ):
                     error_msg = f"Remote file already exists: {remote_path}. Use overwrite=true to force overwrite."
                     return FileTransferResult(
                         success=False,
@@ -171,24 +593,11 @@ class SFTPManager:
                         remote_path=remote_path,
                         operation="upload",
                     )
-                else:
-                    # Remove existing file if overwrite is True
-                    try:
-                        sftp_client.remove(remote_path)
-                        _log.info(f"Removed existing file: {remote_path}")
-                    except Exception as e:
-                        _log.warning(
-                            f"Failed to remove existing file {remote_path}: {str(e)}"
-                        )
-            except IOError:
-                # File doesn't exist, which is good
-                pass
-
-            # Transfer the file
-            start_time = time.time()
-
-            try:
-                sftp_client.put(local_path, remote_path)
+                raise SFTPError(
+                    f"File transfer failed: {str(e)}",
+                    operation="upload",
+                    path=remote_path,
+                )
             except Exception as e:
                 raise SFTPError(
                     f"File transfer failed: {str(e)}",
@@ -198,41 +607,36 @@ class SFTPManager:
 
             # Set file permissions if specified
             if permissions is not None:
-                try:
-                    # Convert octal notation (as decimal int) to actual octal value
-                    # Example: 644 -> int("644", 8) -> 0o644 (420 in decimal)
-                    perm_str = str(permissions)
-
-                    # Validate all digits are 0-7 (valid octal)
-                    if not all(c in "01234567" for c in perm_str):
-                        raise ValueError(
-                            f"Invalid octal notation: {permissions}. Each digit must be 0-7. "
-                            f"Common values: 644, 755, 600, 700"
-                        )
+                self._apply_permissions(sftp_client, remote_path, permissions)
 
-                    octal_value = int(perm_str, 8)
-                    sftp_client.chmod(remote_path, octal_value)
-                    _log.info(
-                        f"Set file permissions to {perm_str} ({oct(octal_value)}) on {remote_path}"
-                    )
-                except ValueError as e:
-                    error_msg = f"Invalid permission value: {str(e)}"
-                    _log.error(error_msg)
-                    raise FileValidationError(
-                        error_msg, remote_path, "invalid_permissions"
-                    )
-                except Exception as e:
-                    _log.warning(
-                        f"Failed to set permissions on {remote_path}: {str(e)}"
-                    )
+            # Drop any result cached by a concurrent transfer while we wrote
+            self._invalidate_stat(remote_path)
 
             transfer_time = time.time() - start_time
             speed = file_size / transfer_time if transfer_time > 0 else 0
 
             _log.info(
-                f"Upload completed: {file_size} bytes in {transfer_time:.2f}s ({speed:.0f} bytes/s)"
+                "Upload completed: %d bytes in %.2fs (%.0f bytes/s)",
+                file_size,
+                transfer_time,
+                speed,
             )
 
+            sha256 = None
+            if digest is not None:
+                sha256 = digest.hexdigest()
+                mismatch = self._verify_sha256(sha256, remote_path)
+                if mismatch:
+                    _log.error(mismatch)
+                    return FileTransferResult(
+                        success=False,
+                        message=mismatch,
+                        bytes_transferred=file_size,
+                        local_path=local_path,
+                        remote_path=remote_path,
+                        operation="upload",
+                    )
+
             return FileTransferResult(
                 success=True,
                 message=f"Successfully uploaded {local_path} to {remote_path}",
@@ -241,6 +645,7 @@ class SFTPManager:
                 local_path=local_path,
                 remote_path=remote_path,
                 operation="upload",
+                sha256=sha256,
             )
 
         except Exception as e:
@@ -254,10 +659,208 @@ class SFTPManager:
                 operation="upload",
             )
 
+    def upload_stream(
+        self,
+        reader: IO[bytes],
+        remote_path: str,
+        permissions: int | None = None,
+        overwrite: bool = False,
+    ) -> FileTransferResult:
+        """Upload the contents of a readable byte stream via SFTP
+
+        Used to pipe data (e.g. an HTTP response body) to the remote host
+        without staging it in a local file. The size is not known up front,
+        so the max_file_size limit is enforced while copying and a partial
+        remote file is removed if it is exceeded.
+
+        Args:
+            reader: Binary file-like object to read from
+            remote_path: Destination path on remote server
+            permissions: File permissions in octal notation (see upload_file)
+            overwrite: Whether to overwrite existing remote files
+
+        Returns:
+            FileTransferResult with success status and metadata
+        """
+        try:
+            self._validate_file_path(remote_path, remote_operation=True)
+        except FileValidationError as e:
+            return FileTransferResult(
+                success=False,
+                message=str(e),
+                remote_path=remote_path,
+                operation="upload",
+            )
+
+        _log.info("Starting stream upload -> %s", remote_path)
+
+        try:
+            sftp_client = self._get_sftp_client()
+            start_time = time.time()
+            self._invalidate_stat(remote_path)
+            max_size = self._max_file_size
+            bytes_written = 0
+
+            try:
+                remote_handle = sftp_client.open(
+                    remote_path, "wb" if overwrite else "xb"
+                )
+            except IOError as e:
+                if (
+                    not overwrite
+                    and self._cached_stat(sftp_client, remote_path) is not None
+                ):
+                    error_msg = f"Remote file already exists: {remote_path}. Use overwrite=true to force overwrite."
+                    return FileTransferResult(
+                        success=False,
+                        message=error_msg,
+                        remote_path=remote_path,
+                        operation="upload",
+                    )
+                raise SFTPError(
+                    f"File transfer failed: {str(e)}",
+                    operation="upload",
+                    path=remote_path,
+                )
+
+            try:
+                with remote_handle as remote_file:
+                    remote_file.set_pipelined(True)
+                    while chunk := reader.read(_STREAM_CHUNK_SIZE):
+                        bytes_written += len(chunk)
+                        if bytes_written > max_size:
+                            break
+                        remote_file.write(chunk)
+            except Exception as e:
+                # Covers both SFTP write errors and errors raised by the source
+                # stream (e.g. a dropped HTTP connection)
+                self._remove_partial(sftp_client, remote_path)
+                raise SFTPError(
+                    f"File transfer failed: {str(e)}",
+                    operation="upload",
+                    path=remote_path,
+                )
+
+            if bytes_written > max_size:
+                self._remove_partial(sftp_client, remote_path)
+                limit_mb = max_size / (1024 * 1024)
+                return FileTransferResult(
+                    success=False,
+                    message=f"File too large. Maximum allowed size is {limit_mb:.1f}MB.",
+                    remote_path=remote_path,
+                    operation="upload",
+                )
+
+            if permissions is not None:
+                self._apply_permissions(sftp_client, remote_path, permissions)
+
+            self._invalidate_stat(remote_path)
+
+            transfer_time = time.time() - start_time
+            speed = bytes_written / transfer_time if transfer_time > 0 else 0
+
+            _log.info(
+                "Stream upload completed: %d bytes in %.2fs (%.0f bytes/s)",
+                bytes_written,
+                transfer_time,
+                speed,
+            )
+
+            return FileTransferResult(
+                success=True,
+                message=f"Successfully uploaded stream to {remote_path}",
+                bytes_transferred=bytes_written,
+                transfer_speed=speed,
+                remote_path=remote_path,
+                operation="upload",
+            )
+
+        except Exception as e:
+            error_msg = f"Upload failed: {str(e)}"
+            _log.error(error_msg)
+            return FileTransferResult(
+                success=False,
+                message=error_msg,
+                remote_path=remote_path,
+                operation="upload",
+            )
+
+    @contextmanager
+    def open_read_stream(self, remote_path: str) -> Iterator[IO[bytes]]:
+        """Open a remote file for streaming reads via SFTP
+
+        The file is checked against max_file_size first, and read-ahead is
+        started for the whole file so sequential reads do not wait one round
+        trip per chunk.
+
+        Args:
+            remote_path: Path to file on remote server
+
+        Yields:
+            Binary file-like object reading the remote file
+
+        Raises:
+            FileValidationError: If the path is unsafe or the file is too large
+            SFTPError: If the file does not exist or cannot be opened
+        """
+        self._validate_file_path(remote_path, remote_operation=True)
+
+        sftp_client = self._get_sftp_client()
+        remote_stat = self._fresh_stat(sftp_client, remote_path)
+        if remote_stat is None:
+            raise SFTPError(
+                f"Remote file does not exist or is not accessible: {remote_path}",
+                operation="download",
+                path=remote_path,
+            )
+        file_size = remote_stat.st_size or 0
+        max_size = self._max_file_size
+        if file_size > max_size:
+            size_mb = file_size / (1024 * 1024)
+            limit_mb = max_size / (1024 * 1024)
+            raise FileValidationError(
+                f"Remote file too large ({size_mb:.1f}MB). Maximum allowed size is {limit_mb:.1f}MB.",
+                remote_path,
+                "file_too_large",
+            )
+
+        _log.info("Starting stream download: %s", remote_path)
+        try:
+            remote_file = sftp_client.open(remote_path, "rb")
+        except IOError as e:
+            raise SFTPError(
+                f"File transfer failed: {str(e)}",
+                operation="download",
+                path=remote_path,
+            )
+        with remote_file:
+            remote_file.prefetch(
+                file_size,
+                max_concurrent_requests=(
+                    self.connection_manager.config.security.sftp_max_unconfirmed
+                ),
+            )
+            yield cast(IO[bytes], remote_file)
+
     def download_file(
-        self, remote_path: str, local_path: str, overwrite: bool = False
+        self,
+        remote_path: str,
+        local_path: str,
+        overwrite: bool = False,
+        verify_sha256: bool = False,
     ) -> FileTransferResult:
-        """Download file from remote host via SFTP"""
+        """Download file from remote host via SFTP
+
+        Args:
+            remote_path: Path to file on remote server
+            local_path: Local destination path
+            overwrite: Whether to overwrite existing local files
+            verify_sha256: Hash the file while receiving it and compare against
+                          sha256sum run on the remote host afterwards
+
+        Returns:
+            FileTransferResult with success status and metadata
+        """
 
         # Validate inputs
         try:
@@ -275,7 +878,7 @@ class SFTPManager:
                 operation="download",
             )
 
-        _log.info(f"Starting download: {remote_path} -> {local_path}")
+        _log.info("Starting download: %s -> %s", remote_path, local_path)
 
         try:
             sftp_client = self._get_sftp_client()
@@ -295,17 +898,17 @@ class SFTPManager:
                     # Remove existing local file if overwrite is True
                     try:
                         os.remove(local_path)
-                        _log.info(f"Removed existing local file: {local_path}")
+                        _log.info("Removed existing local file: %s", local_path)
                     except Exception as e:
                         _log.warning(
-                            f"Failed to remove existing local file {local_path}: {str(e)}"
+                            "Failed to remove existing local file %s: %s",
+                            local_path,
+                            e,
                         )
 
             # Check remote file exists and get size
-            try:
-                remote_stat = sftp_client.stat(remote_path)
-                file_size = remote_stat.st_size or 0
-            except IOError:
+            remote_stat = self._fresh_stat(sftp_client, remote_path)
+            if remote_stat is None:
                 error_msg = (
                     f"Remote file does not exist or is not accessible: {remote_path}"
                 )
@@ -316,10 +919,11 @@ class SFTPManager:
                     remote_path=remote_path,
                     operation="download",
                 )
+            file_size = remote_stat.st_size or 0
 
             # Validate file size
             try:
-                max_size = self.connection_manager.config.security.max_file_size
+                max_size = self._max_file_size
                 if file_size > max_size:
                     size_mb = file_size / (1024 * 1024)
                     limit_mb = max_size / (1024 * 1024)
@@ -348,8 +952,32 @@ class SFTPManager:
             # Transfer the file
             start_time = time.time()
 
+            digest = hashlib.sha256() if verify_sha256 else None
+
             try:
-                sftp_client.get(remote_path, local_path)
+                # Keep several read requests in flight so throughput is not
+                # bounded by one round trip per 32 KiB chunk on slow links
+                max_requests = (
+                    self.connection_manager.config.security.sftp_max_unconfirmed
+                )
+                if digest is None and file_size >= DEFAULT_SFTP_PARALLEL_THRESHOLD:
+                    self._get_ranges(remote_path, local_path, file_size, max_requests)
+                elif digest is None:
+                    sftp_client.get(
+                        remote_path,
+                        local_path,
+                        prefetch=True,
+                        max_concurrent_prefetch_requests=max_requests,
+                    )
+                else:
+                    with open(local_path, "wb") as local_file:
+                        sftp_client.getfo(
+                            remote_path,
+                            # getfo() only ever calls write()
+                            cast(IO[bytes], _HashingWriter(local_file, digest)),
+                            prefetch=True,
+                            max_concurrent_prefetch_requests=max_requests,
+                        )
             except Exception as e:
                 raise SFTPError(
                     f"File transfer failed: {str(e)}",
@@ -361,9 +989,27 @@ class SFTPManager:
             speed = file_size / transfer_time if transfer_time > 0 else 0
 
             _log.info(
-                f"Download completed: {file_size} bytes in {transfer_time:.2f}s ({speed:.0f} bytes/s)"
+                "Download completed: %d bytes in %.2fs (%.0f bytes/s)",
+                file_size,
+                transfer_time,
+                speed,
             )
 
+            sha256 = None
+            if digest is not None:
+                sha256 = digest.hexdigest()
+                mismatch = self._verify_sha256(sha256, remote_path)
+                if mismatch:
+                    _log.error(mismatch)
+                    return FileTransferResult(
+                        success=False,
+                        message=mismatch,
+                        bytes_transferred=file_size,
+                        local_path=local_path,
+                        remote_path=remote_path,
+                        operation="download",
+                    )
+
             return FileTransferResult(
                 success=True,
                 message=f"Successfully downloaded {remote_path} to {local_path}",
@@ -372,6 +1018,7 @@ class SFTPManager:
                 local_path=local_path,
                 remote_path=remote_path,
                 operation="download",
+                sha256=sha256,
             )
 
         except Exception as e:
@@ -387,19 +1034,15 @@ class SFTPManager:
 
     def close_sftp_connection(self) -> None:
         """Close SFTP connection"""
-        if self._sftp_client is None:
+        with self._sftp_client_lock:
+            sftp_client, self._sftp_client = self._sftp_client, None
+        if sftp_client is None:
             return
         try:
             _log.info("Closing SFTP connection")
-            self._sftp_client.close()
+            sftp_client.close()
         except Exception as e:
-            _log.warning(f"Error closing SFTP connection: {str(e)}")
-        finally:
-            self._sftp_client = None
-
-    def __del__(self) -> None:
-        """Cleanup on object destruction"""
-        self.close_sftp_connection()
+            _log.warning("Error closing SFTP connection: %s", e)
 
     def __enter__(self) -> "SFTPManager":
         """Context manager entry"""
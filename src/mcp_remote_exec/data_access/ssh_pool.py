@@ -0,0 +1,286 @@
+"""
+SSH Connection Pool for SSH MCP Remote Exec
+
+Keeps authenticated SSH clients alive between operations so that repeated
+commands to the same host reuse an existing transport instead of paying the
+TCP connect, key exchange and authentication handshake on every call.
+
+Clients are pooled per (host, port, username, auth) key. Each key holds at most
+``max_idle_per_key`` idle clients; clients idle for longer than ``idle_timeout``
+seconds are closed the next time the pool is touched, and clients are probed
+for liveness before being handed out again. acquire() can also retire
+a client after a fixed number of uses, so long-lived transports are rotated,
+and a borrower can discard() a client whose state it no longer trusts.
+
+Only command execution goes through the pool. SFTP runs on a second, dedicated
+transport per SSHConnectionManager (get_connection()), which is opened once,
+kept for the manager's lifetime and closed by close_connection(); it is not
+counted against the pool's idle limits.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+import weakref
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from mcp_remote_exec.config.constants import (
+    DEFAULT_POOL_IDLE_TIMEOUT,
+    DEFAULT_POOL_MAX_IDLE_PER_HOST,
+)
+from mcp_remote_exec.config.ssh_config import HostConfig
+
+if TYPE_CHECKING:
+    import paramiko
+
+_log = logging.getLogger(__name__)
+
+PoolKey = tuple[str, int, str, str]
+"""Pool key: (host, port, username, auth identity)"""
+
+
+def make_pool_key(host_config: HostConfig) -> PoolKey:
+    """Build the pool key for a host configuration.
+
+    The auth identity is the key path for key authentication, or a SHA-256
+    digest of the password so the plaintext secret is never used as a key.
+    """
+    if host_config.key_path:
+        auth = f"key:{host_config.key_path}"
+    elif host_config.password:
+        digest = hashlib.sha256(host_config.password.encode("utf-8")).hexdigest()
+        auth = f"password:{digest}"
+    else:
+        auth = "none"
+    return (host_config.host, host_config.port, host_config.username, auth)
+
+
+def is_client_alive(client: "paramiko.SSHClient") -> bool:
+    """Check whether an SSH client still has an active transport"""
+    transport = client.get_transport()
+    return transport is not None and transport.is_active()
+
+
+def probe_client(client: "paramiko.SSHClient") -> bool:
+    """Check that an SSH client's connection still works before reusing it.
+
+    A transport whose peer vanished while idle (NAT timeout, server reboot)
+    still reports itself active until a write fails, so an SSH_MSG_IGNORE
+    packet is sent and the socket's peer is checked as well.
+
+    Args:
+        client: SSH client to check
+
+    Returns:
+        True if the transport is active and accepted the probe
+    """
+    if not is_client_alive(client):
+        return False
+    transport = client.get_transport()
+    if transport is None:
+        return False
+    try:
+        transport.send_ignore()
+        transport.getpeername()
+    except Exception as e:
+        _log.debug(f"Pooled SSH client failed liveness probe: {e}")
+        return False
+    return transport.is_active()
+
+
+def _close_client(client: "paramiko.SSHClient") -> None:
+    """Close a client, ignoring errors from already-dead transports"""
+    try:
+        client.close()
+    except Exception as e:
+        _log.debug(f"Error closing pooled SSH client: {e}")
+
+
+class SSHConnectionPool:
+    """Thread-safe pool of authenticated SSH clients keyed by host and credentials"""
+
+    def __init__(
+        self,
+        max_idle_per_key: int = DEFAULT_POOL_MAX_IDLE_PER_HOST,
+        idle_timeout: float = DEFAULT_POOL_IDLE_TIMEOUT,
+    ) -> None:
+        """
+        Initialize an empty pool.
+
+        Args:
+            max_idle_per_key: Maximum idle clients kept per pool key
+            idle_timeout: Seconds an idle client is kept before being closed
+        """
+        self.max_idle_per_key = max_idle_per_key
+        self.idle_timeout = idle_timeout
+        self._idle: dict[PoolKey, deque[tuple[float, paramiko.SSHClient]]] = {}
+        # Number of acquire() sessions each live client has served
+        self._uses: weakref.WeakKeyDictionary[paramiko.SSHClient, int] = (
+            weakref.WeakKeyDictionary()
+        )
+        # Borrowed clients that acquire() must close instead of checking in
+        self._discarded: weakref.WeakSet[paramiko.SSHClient] = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def checkout(self, key: PoolKey) -> "paramiko.SSHClient | None":
+        """
+        Take the most recently used live client for a key out of the pool.
+
+        Each candidate is checked with probe_client(); clients whose
+        connection died while idle are closed and the next one is tried.
+
+        Args:
+            key: Pool key from make_pool_key()
+
+        Returns:
+            A live SSH client, or None if no idle client is available
+        """
+        stale: list[paramiko.SSHClient] = []
+        with self._lock:
+            self._evict_expired_locked(time.monotonic(), stale)
+
+        # Close outside the lock, closing a transport can block
+        for dead in stale:
+            _close_client(dead)
+
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    return None
+                _, candidate = idle.pop()
+            # Probed outside the lock, the probe writes to the socket
+            if probe_client(candidate):
+                return candidate
+            _close_client(candidate)
+
+    def checkin(self, key: PoolKey, client: "paramiko.SSHClient") -> None:
+        """
+        Return a client to the pool for reuse.
+
+        Dead clients, and clients beyond the per-key idle cap, are closed.
+
+        Args:
+            key: Pool key the client was created for
+            client: SSH client to return
+        """
+        if not is_client_alive(client):
+            _close_client(client)
+            return
+
+        stale: list[paramiko.SSHClient] = []
+        with self._lock:
+            now = time.monotonic()
+            self._evict_expired_locked(now, stale)
+            idle = self._idle.setdefault(key, deque())
+            if len(idle) < self.max_idle_per_key:
+                idle.append((now, client))
+            else:
+                stale.append(client)
+
+        for extra in stale:
+            _close_client(extra)
+
+    @contextmanager
+    def acquire(
+        self,
+        key: PoolKey,
+        factory: "Callable[[], paramiko.SSHClient]",
+        max_uses: int | None = None,
+    ) -> "Iterator[paramiko.SSHClient]":
+        """
+        Borrow a client for the duration of a ``with`` block.
+
+        Reuses an idle live client when one is available, otherwise creates a
+        new one with ``factory``. The client is returned to the pool on exit,
+        unless it has now served ``max_uses`` sessions or was passed to
+        discard(), in which case it is drained (closed) so the next borrow
+        opens a fresh transport.
+
+        Args:
+            key: Pool key from make_pool_key()
+            factory: Callable that creates and connects a new SSH client
+            max_uses: Sessions a client may serve before it is retired
+                      (None for no limit)
+
+        Yields:
+            Connected SSH client
+        """
+        client = self.checkout(key)
+        if client is None:
+            client = factory()
+        try:
+            yield client
+        finally:
+            with self._lock:
+                uses = self._uses.get(client, 0) + 1
+                discarded = client in self._discarded
+                drain = discarded or (max_uses is not None and uses >= max_uses)
+                if drain:
+                    self._uses.pop(client, None)
+                    self._discarded.discard(client)
+                else:
+                    self._uses[client] = uses
+            if discarded:
+                _log.debug("Closing discarded SSH client instead of pooling it")
+                _close_client(client)
+            elif drain:
+                _log.debug(f"Draining pooled SSH client after {uses} sessions")
+                _close_client(client)
+            else:
+                self.checkin(key, client)
+
+    def discard(self, client: "paramiko.SSHClient") -> None:
+        """
+        Mark a client borrowed with acquire() so it is closed, not pooled.
+
+        Used when the transport may still be busy, e.g. a command that timed
+        out may keep running remotely and hold one of its session slots.
+
+        Args:
+            client: Client currently borrowed with acquire()
+        """
+        with self._lock:
+            self._discarded.add(client)
+
+    def idle_count(self, key: PoolKey | None = None) -> int:
+        """Get number of idle clients, for one key or across the whole pool"""
+        with self._lock:
+            if key is not None:
+                return len(self._idle.get(key, ()))
+            return sum(len(idle) for idle in self._idle.values())
+
+    def close_all(self) -> None:
+        """Close every idle client and empty the pool"""
+        with self._lock:
+            clients = [client for idle in self._idle.values() for _, client in idle]
+            self._idle.clear()
+
+        if clients:
+            _log.info(f"Closing {len(clients)} pooled SSH connection(s)")
+        for client in clients:
+            _close_client(client)
+
+    def _evict_expired_locked(
+        self, now: float, stale: "list[paramiko.SSHClient]"
+    ) -> None:
+        """Move clients idle longer than idle_timeout into ``stale`` (lock held)"""
+        for key in list(self._idle):
+            idle = self._idle[key]
+            # Oldest entries sit at the left of each deque
+            while idle and now - idle[0][0] > self.idle_timeout:
+                stale.append(idle.popleft()[1])
+            if not idle:
+                del self._idle[key]
+
+
+_default_pool = SSHConnectionPool()
+
+
+def get_default_pool() -> SSHConnectionPool:
+    """Get the process-wide SSH connection pool"""
+    return _default_pool
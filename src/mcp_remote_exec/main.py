@@ -16,12 +16,6 @@ from dotenv import load_dotenv
 
 from mcp_remote_exec import __version__
 
-# Load environment variables from .env file BEFORE any imports that use config
-# mcp_tools imports bootstrap which initializes SSHConfig (reads env vars)
-load_dotenv()
-
-from mcp_remote_exec.presentation.mcp_tools import mcp  # noqa: E402
-
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 
@@ -31,13 +25,20 @@ def run_stdio_mode() -> None:
     Run MCP server in stdio mode.
 
     Services are automatically initialized when mcp_tools module is imported
-    (via bootstrap.initialize() call). This function just starts the MCP server.
-    Handles graceful shutdown on keyboard interrupt.
+    (via bootstrap.initialize() call). The import is deferred to this point so
+    --help and --version neither load the server stack nor require a valid
+    configuration. Handles graceful shutdown on keyboard interrupt.
 
     Raises:
         SystemExit: On configuration errors or exceptions
     """
+    # Load environment variables from .env file BEFORE importing mcp_tools,
+    # which imports bootstrap and initializes SSHConfig (reads env vars)
+    load_dotenv()
+
     try:
+        from mcp_remote_exec.presentation.mcp_tools import mcp
+
         # Services already initialized via bootstrap.initialize() in mcp_tools module
         # Start MCP server
         mcp.run()
@@ -16,11 +16,17 @@ Configuration Pattern:
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 
 from mcp_remote_exec.config.constants import DEFAULT_TRANSFER_TIMEOUT_SECONDS
 
 
-@dataclass
+def clear_cache() -> None:
+    """Forget the cached config so the environment is read again (e.g. in tests)"""
+    ImageKitConfig.from_env.cache_clear()
+
+
+@dataclass(slots=True, frozen=True)
 class ImageKitConfig:
     """Configuration for ImageKit file transfer service"""
 
@@ -31,6 +37,7 @@ class ImageKitConfig:
     transfer_timeout: int = DEFAULT_TRANSFER_TIMEOUT_SECONDS
 
     @classmethod
+    @lru_cache(maxsize=1)
     def from_env(cls) -> "ImageKitConfig | None":
         """
         Create config from environment variables.
@@ -41,33 +48,33 @@ class ImageKitConfig:
         - Returns None if plugin should not be activated (disabled or missing config)
         - Returns validated config instance if all checks pass
 
+        The result, including None, is cached: repeated calls return the same
+        instance without re-reading the environment. Call clear_cache() after
+        changing the environment.
+
         Returns:
             ImageKitConfig if enabled and all required variables are set, None otherwise
         """
         # Check if plugin is enabled first
-        if os.getenv("ENABLE_IMAGEKIT", "false").lower() != "true":
+        if os.environ.get("ENABLE_IMAGEKIT", "false").lower() != "true":
             return None
 
-        # Get required credentials
-        public_key = os.getenv("IMAGEKIT_PUBLIC_KEY")
-        private_key = os.getenv("IMAGEKIT_PRIVATE_KEY")
-        url_endpoint = os.getenv("IMAGEKIT_URL_ENDPOINT")
-
-        # Validate all required credentials are present
-        if public_key is None or private_key is None or url_endpoint is None:
-            return None
+        # Get required credentials (missing variables read as empty strings)
+        public_key = os.environ.get("IMAGEKIT_PUBLIC_KEY", "")
+        private_key = os.environ.get("IMAGEKIT_PRIVATE_KEY", "")
+        url_endpoint = os.environ.get("IMAGEKIT_URL_ENDPOINT", "")
 
-        # Validate credentials are not empty strings
+        # Validate all required credentials are present and non-empty
         if not public_key or not private_key or not url_endpoint:
             return None
 
         # Get optional settings
         transfer_timeout = int(
-            os.getenv(
+            os.environ.get(
                 "IMAGEKIT_TRANSFER_TIMEOUT", str(DEFAULT_TRANSFER_TIMEOUT_SECONDS)
             )
         )
-        folder = os.getenv("IMAGEKIT_FOLDER", "/mcp-remote-exec")
+        folder = os.environ.get("IMAGEKIT_FOLDER", "/mcp-remote-exec")
 
         return cls(
             public_key=public_key,
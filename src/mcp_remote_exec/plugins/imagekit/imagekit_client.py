@@ -6,19 +6,30 @@ Handles ImageKit SDK operations for file uploads/downloads.
 
 import logging
 import os
-from typing import Any
-
-import requests
-from imagekitio import ImageKit
-from imagekitio.models.UploadFileRequestOptions import UploadFileRequestOptions
-from imagekitio.models.ListAndSearchFileRequestOptions import (
-    ListAndSearchFileRequestOptions,
-)
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import IO, Any, cast
 
 from mcp_remote_exec.plugins.imagekit.config import ImageKitConfig
 
 _log = logging.getLogger(__name__)
 
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # Bytes read per chunk when streaming downloads
+_HTTP_POOL_SIZE = 16  # Keep-alive connections kept per host by the shared HTTP session
+
+# curl command for client-side uploads, filled in by build_upload_command()
+_UPLOAD_COMMAND_TEMPLATE = (
+    "curl -X POST 'https://upload.imagekit.io/api/v1/files/upload' \\\n"
+    "  -F 'file=@LOCAL_FILE_PATH' \\\n"
+    "  -F 'fileName={file_name}' \\\n"
+    "  -F 'useUniqueFileName=false' \\\n"
+    "  -F 'folder={folder}' \\\n"
+    "  -F 'publicKey={public_key}' \\\n"
+    "  -F 'signature={signature}' \\\n"
+    "  -F 'expire={expire}' \\\n"
+    "  -F 'token={token}'"
+)
+
 
 class ImageKitClient:
     """Wrapper for ImageKit SDK operations"""
@@ -30,12 +41,47 @@ class ImageKitClient:
         Args:
             config: ImageKit configuration
         """
+        # Imported on first use: the SDK pulls in an HTTP stack that is not
+        # needed when the ImageKit plugin is disabled
+        import requests
+        from imagekitio import ImageKit
+        from requests.adapters import HTTPAdapter
+
         self.config = config
         self._client = ImageKit(
             private_key=config.private_key,
             public_key=config.public_key,
             url_endpoint=config.url_endpoint,
         )
+        # One keep-alive session for all ImageKit HTTP traffic, so repeated
+        # calls reuse TLS connections instead of handshaking each time
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(pool_maxsize=_HTTP_POOL_SIZE))
+        # The SDK calls requests.request() (a new connection per call) through
+        # this hook; send its REST calls through the shared session instead
+        self._client.ik_request.request = self._sdk_request
+        # Download directories already created, so repeat downloads skip makedirs.
+        # A race between threads only costs a redundant exist_ok makedirs call.
+        self._ensured_dirs: set[str] = set()
+
+    def _sdk_request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        params: Any = None,
+        files: Any = None,
+        data: Any = None,
+    ) -> Any:
+        """Drop-in for the SDK's ImageKitRequest.request using the shared session"""
+        return self._http.request(
+            method=method,
+            url=url,
+            params=params,
+            files=files,
+            data=data,
+            headers=headers,
+        )
 
     def generate_upload_token(self, file_name: str) -> dict[str, Any]:
         """
@@ -71,22 +117,11 @@ class ImageKitClient:
         """
         auth = self.generate_upload_token(file_name)
 
-        # Build curl command for client to execute
         # Client needs to replace LOCAL_FILE_PATH with their actual file path
-        cmd = (
-            f"curl -X POST 'https://upload.imagekit.io/api/v1/files/upload' \\\n"
-            f"  -F 'file=@LOCAL_FILE_PATH' \\\n"
-            f"  -F 'fileName={auth['file_name']}' \\\n"
-            f"  -F 'useUniqueFileName=false' \\\n"
-            f"  -F 'folder={self.config.folder}' \\\n"
-            f"  -F 'publicKey={auth['public_key']}' \\\n"
-            f"  -F 'signature={auth['signature']}' \\\n"
-            f"  -F 'expire={auth['expire']}' \\\n"
-            f"  -F 'token={auth['token']}'"
+        return _UPLOAD_COMMAND_TEMPLATE.format_map(
+            {**auth, "folder": self.config.folder}
         )
 
-        return cmd
-
     def upload_file(self, file_path: str, file_name: str) -> dict[str, Any]:
         """
         Upload file to ImageKit (server-side).
@@ -104,13 +139,36 @@ class ImageKitClient:
             raise FileNotFoundError(f"File not found: {file_path}")
 
         with open(file_path, "rb") as file:
-            options = UploadFileRequestOptions(
-                folder=self.config.folder,
-                use_unique_file_name=False,
-            )
-            result = self._client.upload_file(
-                file=file, file_name=file_name, options=options
-            )
+            return self.upload_stream(file, file_name)
+
+    def upload_stream(self, reader: IO[bytes], file_name: str) -> dict[str, Any]:
+        """
+        Upload the contents of a readable byte stream to ImageKit (server-side).
+
+        Args:
+            reader: Binary file-like object to read the file body from
+            file_name: Name for the uploaded file
+
+        Returns:
+            Dict with file_id, url, name
+        """
+        from imagekitio.models.UploadFileRequestOptions import (
+            UploadFileRequestOptions,
+        )
+
+        options = UploadFileRequestOptions(
+            folder=self.config.folder,
+            use_unique_file_name=False,
+        )
+        # The SDK only wraps BufferedReader/str/bytes as a multipart file part;
+        # other streams (e.g. an SFTP handle) have no length it can measure.
+        # It buffers the whole multipart body in memory anyway, so reading
+        # the stream here costs nothing extra.
+        result = self._client.upload_file(
+            file=(file_name, reader.read(), None),
+            file_name=file_name,
+            options=options,
+        )
 
         _log.debug(f"Upload complete: {result.file_id}")
 
@@ -149,22 +207,58 @@ class ImageKitClient:
         # Get file URL
         file_url = self.get_file_url(file_id)
 
-        # Download file with timeout (30s connect, 300s read for large files)
-        response = requests.get(file_url, timeout=(30, 300))
-        response.raise_for_status()
-
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(destination_path) or ".", exist_ok=True)
-
-        # Write to file
-        with open(destination_path, "wb") as f:
-            f.write(response.content)
+        # Download file with timeout (30s connect, 300s read for large files),
+        # streaming the body so memory use does not grow with the file size
+        with self._http.get(file_url, timeout=(30, 300), stream=True) as response:
+            response.raise_for_status()
+
+            # Ensure directory exists
+            directory = os.path.dirname(destination_path) or "."
+            if directory not in self._ensured_dirs:
+                os.makedirs(directory, exist_ok=True)
+                self._ensured_dirs.add(directory)
+
+            # Write to file chunk by chunk
+            bytes_written = 0
+            try:
+                f = open(destination_path, "wb")
+            except FileNotFoundError:
+                # Directory was removed since it was first created
+                os.makedirs(directory, exist_ok=True)
+                f = open(destination_path, "wb")
+            with f:
+                for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    bytes_written += len(chunk)
 
-        bytes_written = len(response.content)
         _log.debug(f"Downloaded {bytes_written} bytes")
 
         return bytes_written
 
+    @contextmanager
+    def open_download_stream(self, file_id: str) -> Iterator[IO[bytes]]:
+        """
+        Open an ImageKit file as a readable byte stream.
+
+        Lets callers pipe the response body straight to its destination
+        instead of materializing it on local disk first.
+
+        Args:
+            file_id: ImageKit file ID
+
+        Yields:
+            Binary file-like object reading the (content-decoded) file body
+        """
+        _log.info(f"Streaming {file_id} from ImageKit")
+
+        file_url = self.get_file_url(file_id)
+
+        with self._http.get(file_url, timeout=(30, 300), stream=True) as response:
+            response.raise_for_status()
+            # Undo any Content-Encoding so readers see the file's own bytes
+            response.raw.decode_content = True
+            yield cast(IO[bytes], response.raw)
+
     def delete_file(self, file_id: str) -> bool:
         """
         Delete file from ImageKit.
@@ -195,6 +289,10 @@ class ImageKitClient:
         Returns:
             File info dict if found, None otherwise
         """
+        from imagekitio.models.ListAndSearchFileRequestOptions import (
+            ListAndSearchFileRequestOptions,
+        )
+
         try:
             _log.info(f"Searching for file: {file_name}")
 
@@ -208,26 +306,24 @@ class ImageKitClient:
             result = self._client.list_files(options)
             _log.info(f"Search result count: {len(result.list) if result else 0}")
 
-            if result and len(result.list) > 0:
-                # Find exact match (case-insensitive)
-                for file_info in result.list:
-                    _log.info(f"Found file: {file_info.name}")
-                    if file_info.name.lower() == file_name.lower():
-                        _log.info(f"Exact match found: {file_info.name}")
-                        return {
-                            "file_id": file_info.file_id,
-                            "url": file_info.url,
-                            "name": file_info.name,
-                        }
-
-                # If no exact match but we have results, return first one
-                _log.warning(
-                    f"No exact match, using first result: {result.list[0].name}"
+            if result and result.list:
+                # Find exact match (case-insensitive, including non-ASCII names)
+                target = file_name.casefold()
+                file_info = next(
+                    (f for f in result.list if f.name.casefold() == target), None
                 )
+                if file_info is not None:
+                    _log.info(f"Exact match found: {file_info.name}")
+                else:
+                    # If no exact match but we have results, return first one
+                    file_info = result.list[0]
+                    _log.warning(
+                        f"No exact match, using first result: {file_info.name}"
+                    )
                 return {
-                    "file_id": result.list[0].file_id,
-                    "url": result.list[0].url,
-                    "name": result.list[0].name,
+                    "file_id": file_info.file_id,
+                    "url": file_info.url,
+                    "name": file_info.name,
                 }
 
         except Exception as e:
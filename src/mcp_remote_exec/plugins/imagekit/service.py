@@ -11,12 +11,13 @@ Design Note - Response Format:
     Plain text format would not support this workflow.
 """
 
-import json
 import logging
-import os
-import tempfile
+import shlex
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
+from mcp_remote_exec.common.json_utils import dumps
 from mcp_remote_exec.plugins.imagekit.config import ImageKitConfig
 from mcp_remote_exec.plugins.imagekit.constants import (
     MSG_PROXMOX_REQUIRED,
@@ -39,6 +40,44 @@ from mcp_remote_exec.services.file_utils import cleanup_temp_file
 
 _log = logging.getLogger(__name__)
 
+_MISSING_MARKER = "MISSING"
+"""Printed by the combined container check-and-pull command when the file is absent"""
+
+_EXISTS_MARKER = "EXISTS"
+"""Printed by the guarded container push command when the destination already exists"""
+
+
+def _log_cleanup_failure(future: "Future[object]") -> None:
+    """Log an exception raised by a background cleanup step"""
+    error = future.exception()
+    if error is not None:
+        _log.warning("Background cleanup failed: %s", error)
+
+
+# Error responses that never vary, serialized once at import time
+_PROXMOX_REQUIRED_JSON = dumps(
+    {
+        "success": False,
+        "error": MSG_PROXMOX_REQUIRED,
+        "suggestion": MSG_PROXMOX_ENABLE_SUGGESTION,
+    },
+    pretty=False,
+)
+_TRANSFER_NOT_FOUND_JSON = dumps(
+    {
+        "success": False,
+        "error": MSG_TRANSFER_NOT_FOUND,
+    },
+    pretty=False,
+)
+_IMAGEKIT_FILE_NOT_FOUND_JSON = dumps(
+    {
+        "success": False,
+        "error": "File not found on ImageKit. Make sure upload completed successfully.",
+    },
+    pretty=False,
+)
+
 
 class ImageKitService:
     """Service for ImageKit file transfer operations"""
@@ -65,6 +104,47 @@ class ImageKitService:
         self.enabled_plugins = enabled_plugins or set()
         self.client = ImageKitClient(config)
         self.transfer_manager = TransferManager(timeout_seconds=config.transfer_timeout)
+        # Read on every request; snapshot once instead of re-deriving per call
+        self._transfer_timeout = config.transfer_timeout
+        self._proxmox_enabled = "proxmox" in self.enabled_plugins
+        # Best-effort cleanup (temp files, ImageKit deletes) runs here so it
+        # does not add round trips to the tool response
+        self._cleanup_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="imagekit-cleanup"
+        )
+
+    def close(self) -> None:
+        """
+        Wait for pending background cleanup and stop the cleanup executor.
+
+        Must run before the SSH connections are closed, because queued temp
+        file removals still execute remote commands.
+        """
+        self._cleanup_executor.shutdown(wait=True)
+
+    def _cleanup_in_background(self, fn: Callable[..., object], *args: Any) -> None:
+        """
+        Run a best-effort cleanup step without waiting for it.
+
+        Args:
+            fn: Cleanup function
+            *args: Arguments for fn
+        """
+        self._cleanup_executor.submit(fn, *args).add_done_callback(_log_cleanup_failure)
+
+    def _discard_upload(self, transfer_id: str, file_id: str) -> None:
+        """
+        Finish a failed upload confirmation and delete its ImageKit copy.
+
+        The transfer is consumed, so a retry starts with a new request_upload
+        and a new ImageKit file; the old copy would otherwise be orphaned.
+
+        Args:
+            transfer_id: Transfer identifier
+            file_id: ImageKit file ID of the uploaded file
+        """
+        self._cleanup_in_background(self.client.delete_file, file_id)
+        self.transfer_manager.complete_transfer(transfer_id)
 
     def request_upload(
         self,
@@ -87,67 +167,27 @@ class ImageKitService:
         """
         # Validate container access requires Proxmox plugin
         if ctid is not None:
-            proxmox_enabled = "proxmox" in self.enabled_plugins
-            if not proxmox_enabled:
-                return json.dumps(
-                    {
-                        "success": False,
-                        "error": MSG_PROXMOX_REQUIRED,
-                        "suggestion": MSG_PROXMOX_ENABLE_SUGGESTION,
-                    },
-                    indent=2,
-                )
+            if not self._proxmox_enabled:
+                return _PROXMOX_REQUIRED_JSON
 
         if ctid:
-            _log.info(f"Upload request for {remote_path} in container {ctid}")
+            _log.info("Upload request for %s in container %s", remote_path, ctid)
         else:
-            _log.info(f"Upload request for {remote_path} on host")
+            _log.info("Upload request for %s on host", remote_path)
 
         # Validate remote path
         is_valid, error = self.file_service.validate_paths(remote_path)
         if not is_valid:
-            return json.dumps(
+            return dumps(
                 {
                     "success": False,
                     "error": error,
                 },
-                indent=2,
+                pretty=False,
             )
 
-        # Check if file exists (if not overwriting)
-        if not overwrite:
-            try:
-                if ctid:
-                    # Check in container
-                    check_cmd = f"pct exec {ctid} -- test -f {remote_path}"
-                    check_result = self.command_service.execute_command_raw(
-                        check_cmd, 10
-                    )
-                    if check_result.exit_code == 0:  # File exists in container
-                        return json.dumps(
-                            {
-                                "success": False,
-                                "error": f"File already exists in container {ctid}: {remote_path}",
-                                "suggestion": "Set overwrite=true to replace existing file",
-                            },
-                            indent=2,
-                        )
-                else:
-                    # Check on host
-                    check_result = self.command_service.execute_command_raw(
-                        f"test -f {remote_path}", 10
-                    )
-                    if check_result.exit_code == 0:  # File exists on host
-                        return json.dumps(
-                            {
-                                "success": False,
-                                "error": f"File already exists on host: {remote_path}",
-                                "suggestion": "Set overwrite=true to replace existing file",
-                            },
-                            indent=2,
-                        )
-            except Exception as e:
-                _log.warning(f"Could not check if file exists: {e}")
+        # No existence check here: the file may change before confirm_upload
+        # runs, so the check is done atomically when the file is written there
 
         # Create transfer state
         transfer = self.transfer_manager.create_transfer(
@@ -167,13 +207,13 @@ class ImageKitService:
             upload_command=upload_command.replace(
                 "LOCAL_FILE_PATH", "<YOUR_FILE_PATH>"
             ),
-            expires_in=self.config.transfer_timeout,
+            expires_in=self._transfer_timeout,
         )
 
         # Cleanup expired transfers
         self.transfer_manager.cleanup_expired_transfers()
 
-        return json.dumps(result.model_dump(), indent=2)
+        return result.model_dump_json()
 
     def confirm_upload(self, transfer_id: str, file_id: str | None = None) -> str:
         """
@@ -186,33 +226,27 @@ class ImageKitService:
         Returns:
             JSON string with transfer result
         """
-        _log.info(f"Upload confirmation for {transfer_id}")
+        _log.info("Upload confirmation for %s", transfer_id)
 
         # Get transfer state
         transfer = self.transfer_manager.get_transfer(transfer_id)
         if not transfer:
-            return json.dumps(
-                {
-                    "success": False,
-                    "error": MSG_TRANSFER_NOT_FOUND,
-                },
-                indent=2,
-            )
+            return _TRANSFER_NOT_FOUND_JSON
 
         if transfer.operation != TransferOperation.UPLOAD.value:
-            return json.dumps(
+            return dumps(
                 {
                     "success": False,
                     "error": f"Transfer {transfer_id} is not an upload operation",
                 },
-                indent=2,
+                pretty=False,
             )
 
         try:
             # Get file info - either by ID or by searching
             file_info: dict[str, Any] | None
             if file_id:
-                _log.info(f"Using provided file_id: {file_id}")
+                _log.info("Using provided file_id: %s", file_id)
                 # When file_id is provided, we only need the ID for download
                 # The URL will be retrieved by the client via get_file_url()
                 file_info = {
@@ -225,111 +259,116 @@ class ImageKitService:
                 file_info = self.client.get_file_by_name(file_name)
 
             if not file_info:
-                return json.dumps(
-                    {
-                        "success": False,
-                        "error": "File not found on ImageKit. Make sure upload completed successfully.",
-                    },
-                    indent=2,
-                )
-
-            # Download from ImageKit to MCP server temp location
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".tmp") as tmp_file:
-                local_temp_path = tmp_file.name
-
-            bytes_transferred = self.client.download_file(
-                file_info["file_id"], local_temp_path
-            )
+                return _IMAGEKIT_FILE_NOT_FOUND_JSON
 
             if transfer.ctid:
                 # Upload to container workflow
                 _log.info(
-                    f"Uploading to container {transfer.ctid}: {transfer.remote_path}"
+                    "Uploading to container %s: %s", transfer.ctid, transfer.remote_path
                 )
 
-                # Upload from MCP server to host temp location via SFTP
+                # Stream from ImageKit to host temp location via SFTP
                 # Path is on remote SSH server, not local system
                 host_temp_path = f"{TEMP_FILE_PREFIX_UPLOAD}-{transfer_id}"
-                upload_result = self.file_service.upload_file_raw(
-                    local_path=local_temp_path,
-                    remote_path=host_temp_path,
-                    permissions=None,
-                    overwrite=True,
-                )
+                with self.client.open_download_stream(file_info["file_id"]) as reader:
+                    upload_result = self.file_service.upload_stream_raw(
+                        reader,
+                        remote_path=host_temp_path,
+                        permissions=None,
+                        overwrite=True,
+                    )
+                bytes_transferred = upload_result.bytes_transferred
 
                 if not upload_result.success:
-                    os.unlink(local_temp_path)
-                    self.transfer_manager.complete_transfer(transfer_id)
-                    return json.dumps(
+                    self._discard_upload(transfer_id, file_info["file_id"])
+                    return dumps(
                         {
                             "success": False,
                             "error": f"Failed to upload to host: {upload_result.message}",
                         },
-                        indent=2,
+                        pretty=False,
                     )
 
-                # Push file from host to container
-                push_result = self.command_service.execute_command_raw(
-                    f"pct push {transfer.ctid} {host_temp_path} {transfer.remote_path}",
-                    30,
-                )
+                # Push file from host to container, set permissions and remove
+                # the host temp file in a single exec channel. Without
+                # overwrite, the push is refused if the destination exists.
+                ctid = transfer.ctid
+                quoted_temp = shlex.quote(host_temp_path)
+                quoted_dest = shlex.quote(transfer.remote_path)
+                push_steps = []
+                if not transfer.overwrite:
+                    push_steps.append(
+                        f"if pct exec {ctid} -- test -f {quoted_dest}; "
+                        f"then echo {_EXISTS_MARKER}; false; fi"
+                    )
+                push_steps.append(f"pct push {ctid} {quoted_temp} {quoted_dest}")
+                if transfer.permissions is not None:
+                    # Best-effort, as a failed chmod does not undo the push
+                    push_steps.append(
+                        f"{{ pct exec {ctid} -- chmod {transfer.permissions} "
+                        f"{quoted_dest} || true; }}"
+                    )
+                push_steps.append(f"rm -f {quoted_temp}")
+                push_result = self.command_service.execute_pipeline(push_steps, 30)
+
+                if push_result.stdout.strip() == _EXISTS_MARKER:
+                    self._cleanup_in_background(
+                        cleanup_temp_file, self.command_service, host_temp_path
+                    )
+                    self._discard_upload(transfer_id, file_info["file_id"])
+                    return dumps(
+                        {
+                            "success": False,
+                            "error": f"File already exists in container {transfer.ctid}: {transfer.remote_path}",
+                            "suggestion": "Set overwrite=true to replace existing file",
+                        },
+                        pretty=False,
+                    )
 
                 if push_result.exit_code != 0:
                     # Cleanup
-                    os.unlink(local_temp_path)
-                    cleanup_temp_file(self.command_service, host_temp_path)
-                    self.transfer_manager.complete_transfer(transfer_id)
-                    return json.dumps(
+                    self._cleanup_in_background(
+                        cleanup_temp_file, self.command_service, host_temp_path
+                    )
+                    self._discard_upload(transfer_id, file_info["file_id"])
+                    return dumps(
                         {
                             "success": False,
                             "error": f"Failed to push to container {transfer.ctid}: {push_result.stderr}",
                             "suggestion": "Check if container exists and is running",
                         },
-                        indent=2,
-                    )
-
-                # Set permissions in container if specified
-                if transfer.permissions is not None:
-                    perm_str = str(transfer.permissions)
-                    self.command_service.execute_command_raw(
-                        f"pct exec {transfer.ctid} -- chmod {perm_str} {transfer.remote_path}",
-                        10,
+                        pretty=False,
                     )
 
-                # Cleanup temp files
-                os.unlink(local_temp_path)
-                cleanup_temp_file(self.command_service, host_temp_path)
-
                 message = f"Successfully uploaded to container {transfer.ctid}: {transfer.remote_path}"
             else:
                 # Upload to host workflow (original behavior)
-                _log.info(f"Uploading to host: {transfer.remote_path}")
-
-                # Upload from MCP server to host via SFTP
-                upload_result = self.file_service.upload_file_raw(
-                    local_path=local_temp_path,
-                    remote_path=transfer.remote_path,
-                    permissions=transfer.permissions,
-                    overwrite=transfer.overwrite,
-                )
-
-                # Cleanup local temp file
-                os.unlink(local_temp_path)
+                _log.info("Uploading to host: %s", transfer.remote_path)
+
+                # Stream from ImageKit to host via SFTP
+                with self.client.open_download_stream(file_info["file_id"]) as reader:
+                    upload_result = self.file_service.upload_stream_raw(
+                        reader,
+                        remote_path=transfer.remote_path,
+                        permissions=transfer.permissions,
+                        overwrite=transfer.overwrite,
+                    )
+                bytes_transferred = upload_result.bytes_transferred
 
                 if not upload_result.success:
-                    self.transfer_manager.complete_transfer(transfer_id)
-                    return json.dumps(
+                    self._discard_upload(transfer_id, file_info["file_id"])
+                    return dumps(
                         {
                             "success": False,
                             "error": f"Failed to upload to host: {upload_result.message}",
                         },
-                        indent=2,
+                        pretty=False,
                     )
 
                 message = f"Successfully uploaded to host: {transfer.remote_path}"
 
-            # Delete from ImageKit
-            self.client.delete_file(file_info["file_id"])
+            # Delete from ImageKit (does not affect the result, so not awaited)
+            self._cleanup_in_background(self.client.delete_file, file_info["file_id"])
 
             # Complete transfer
             self.transfer_manager.complete_transfer(transfer_id)
@@ -341,16 +380,16 @@ class ImageKitService:
                 bytes_transferred=bytes_transferred,
             )
 
-            return json.dumps(result.model_dump(), indent=2)
+            return result.model_dump_json()
 
         except Exception as e:
-            _log.error(f"Upload confirmation failed: {e}")
-            return json.dumps(
+            _log.error("Upload confirmation failed: %s", e)
+            return dumps(
                 {
                     "success": False,
                     "error": f"Upload failed: {str(e)}",
                 },
-                indent=2,
+                pretty=False,
             )
 
     def request_download(self, remote_path: str, ctid: int | None = None) -> str:
@@ -366,60 +405,45 @@ class ImageKitService:
         """
         # Validate container access requires Proxmox plugin
         if ctid is not None:
-            proxmox_enabled = "proxmox" in self.enabled_plugins
-            if not proxmox_enabled:
-                return json.dumps(
-                    {
-                        "success": False,
-                        "error": MSG_PROXMOX_REQUIRED,
-                        "suggestion": MSG_PROXMOX_ENABLE_SUGGESTION,
-                    },
-                    indent=2,
-                )
+            if not self._proxmox_enabled:
+                return _PROXMOX_REQUIRED_JSON
 
         if ctid:
-            _log.info(f"Download request for {remote_path} from container {ctid}")
+            _log.info("Download request for %s from container %s", remote_path, ctid)
         else:
-            _log.info(f"Download request for {remote_path} from host")
+            _log.info("Download request for %s from host", remote_path)
 
         # Validate remote path
         is_valid, error = self.file_service.validate_paths(remote_path)
         if not is_valid:
-            return json.dumps(
+            return dumps(
                 {
                     "success": False,
                     "error": error,
                 },
-                indent=2,
+                pretty=False,
             )
 
-        # Check if file exists (in container or on host)
-        try:
-            if ctid:
-                # Check file in container
-                check_cmd = f"pct exec {ctid} -- test -f {remote_path}"
-            else:
-                # Check file on host
-                check_cmd = f"test -f {remote_path}"
-
-            check_result = self.command_service.execute_command_raw(check_cmd, 10)
-            if check_result.exit_code != 0:  # File doesn't exist
-                location = f"container {ctid}" if ctid else "host"
-                return json.dumps(
+        # Check if file exists on host. Container files are checked as part of
+        # the pull command below, so they cost no extra round trip.
+        if not ctid:
+            try:
+                if not self.file_service.exists(remote_path):
+                    return dumps(
+                        {
+                            "success": False,
+                            "error": f"File not found in host: {remote_path}",
+                        },
+                        pretty=False,
+                    )
+            except Exception as e:
+                return dumps(
                     {
                         "success": False,
-                        "error": f"File not found in {location}: {remote_path}",
+                        "error": f"Could not check file: {str(e)}",
                     },
-                    indent=2,
+                    pretty=False,
                 )
-        except Exception as e:
-            return json.dumps(
-                {
-                    "success": False,
-                    "error": f"Could not check file: {str(e)}",
-                },
-                indent=2,
-            )
 
         # Create transfer state
         transfer = self.transfer_manager.create_transfer(
@@ -432,21 +456,37 @@ class ImageKitService:
             # If downloading from container, first pull to host temp
             host_temp_path = None
             if ctid:
-                _log.info(f"Pulling file from container {ctid}: {remote_path}")
+                _log.info("Pulling file from container %s: %s", ctid, remote_path)
                 # Path is on remote SSH server, not local system
                 host_temp_path = f"{TEMP_FILE_PREFIX_DOWNLOAD}-{transfer.transfer_id}"
 
-                pull_cmd = f"pct pull {ctid} {remote_path} {host_temp_path}"
+                # Existence check and pull in a single exec channel
+                quoted_path = shlex.quote(remote_path)
+                pull_cmd = (
+                    f"if pct exec {ctid} -- test -f {quoted_path}; "
+                    f"then pct pull {ctid} {quoted_path} {shlex.quote(host_temp_path)}; "
+                    f"else echo {_MISSING_MARKER}; fi"
+                )
                 pull_result = self.command_service.execute_command_raw(pull_cmd, 30)
 
+                if pull_result.stdout.strip() == _MISSING_MARKER:
+                    self.transfer_manager.complete_transfer(transfer.transfer_id)
+                    return dumps(
+                        {
+                            "success": False,
+                            "error": f"File not found in container {ctid}: {remote_path}",
+                        },
+                        pretty=False,
+                    )
+
                 if pull_result.exit_code != 0:
                     self.transfer_manager.complete_transfer(transfer.transfer_id)
-                    return json.dumps(
+                    return dumps(
                         {
                             "success": False,
                             "error": f"Failed to pull from container {ctid}: {pull_result.stderr}",
                         },
-                        indent=2,
+                        pretty=False,
                     )
 
                 # Use the host temp path for SFTP download
@@ -455,39 +495,20 @@ class ImageKitService:
                 # Download directly from host
                 download_path = remote_path
 
-            # Download from remote server to local temp file using SFTP
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".tmp") as tmp_file:
-                local_temp_path = tmp_file.name
-
-            # Use SFTP to download file from remote host to MCP server
-            download_result = self.file_service.download_file_raw(
-                remote_path=download_path, local_path=local_temp_path, overwrite=True
-            )
-
-            if not download_result.success:
-                os.unlink(local_temp_path)
+            # Stream the file from the remote server via SFTP straight into
+            # the ImageKit upload, without a temp file on the MCP server
+            file_name = f"mcp-download-{transfer.transfer_id}"
+            try:
+                with self.file_service.open_download_stream_raw(
+                    download_path
+                ) as reader:
+                    file_info = self.client.upload_stream(reader, file_name)
+            finally:
                 # Clean up host temp file if we created one
                 if host_temp_path:
-                    cleanup_temp_file(self.command_service, host_temp_path)
-                self.transfer_manager.complete_transfer(transfer.transfer_id)
-                return json.dumps(
-                    {
-                        "success": False,
-                        "error": f"Failed to download from remote: {download_result.message}",
-                    },
-                    indent=2,
-                )
-
-            # Clean up host temp file if we created one
-            if host_temp_path:
-                cleanup_temp_file(self.command_service, host_temp_path)
-
-            # Upload to ImageKit from MCP server
-            file_name = f"mcp-download-{transfer.transfer_id}"
-            file_info = self.client.upload_file(local_temp_path, file_name)
-
-            # Clean up local temp file
-            os.unlink(local_temp_path)
+                    self._cleanup_in_background(
+                        cleanup_temp_file, self.command_service, host_temp_path
+                    )
 
             # Update transfer with ImageKit file ID
             self.transfer_manager.update_transfer(
@@ -502,23 +523,23 @@ class ImageKitService:
                 transfer_id=transfer.transfer_id,
                 download_url=download_url,
                 download_command=download_command,
-                expires_in=self.config.transfer_timeout,
+                expires_in=self._transfer_timeout,
             )
 
             # Cleanup expired transfers
             self.transfer_manager.cleanup_expired_transfers()
 
-            return json.dumps(result.model_dump(), indent=2)
+            return result.model_dump_json()
 
         except Exception as e:
-            _log.error(f"Download request failed: {e}")
+            _log.error("Download request failed: %s", e)
             self.transfer_manager.complete_transfer(transfer.transfer_id)
-            return json.dumps(
+            return dumps(
                 {
                     "success": False,
                     "error": f"Download preparation failed: {str(e)}",
                 },
-                indent=2,
+                pretty=False,
             )
 
     def confirm_download(self, transfer_id: str) -> str:
@@ -531,26 +552,26 @@ class ImageKitService:
         Returns:
             JSON string with cleanup result
         """
-        _log.info(f"Download confirmation for {transfer_id}")
+        _log.info("Download confirmation for %s", transfer_id)
 
         # Get transfer state
         transfer = self.transfer_manager.get_transfer(transfer_id)
         if not transfer:
-            return json.dumps(
+            return dumps(
                 {
                     "success": False,
                     "error": f"Transfer {transfer_id} not found or already completed",
                 },
-                indent=2,
+                pretty=False,
             )
 
         if transfer.operation != TransferOperation.DOWNLOAD.value:
-            return json.dumps(
+            return dumps(
                 {
                     "success": False,
                     "error": f"Transfer {transfer_id} is not a download operation",
                 },
-                indent=2,
+                pretty=False,
             )
 
         try:
@@ -567,14 +588,14 @@ class ImageKitService:
                 remote_path=transfer.remote_path,
             )
 
-            return json.dumps(result.model_dump(), indent=2)
+            return result.model_dump_json()
 
         except Exception as e:
-            _log.error(f"Download confirmation failed: {e}")
-            return json.dumps(
+            _log.error("Download confirmation failed: %s", e)
+            return dumps(
                 {
                     "success": False,
                     "error": f"Cleanup failed: {str(e)}",
                 },
-                indent=2,
+                pretty=False,
             )
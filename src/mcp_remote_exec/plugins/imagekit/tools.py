@@ -4,6 +4,7 @@ MCP Tools for ImageKit Plugin
 Registers ImageKit file transfer tools.
 """
 
+import asyncio
 import logging
 from typing import Annotated
 
@@ -92,7 +93,9 @@ def register_imagekit_tools(mcp: FastMCP, container: ServiceContainer) -> None:
                 ctid=ctid,
             )
 
-            return imagekit_service.request_upload(
+            # SFTP and ImageKit HTTP calls block; keep them off the event loop
+            return await asyncio.to_thread(
+                imagekit_service.request_upload,
                 remote_path=input_data.remote_path,
                 permissions=input_data.permissions,
                 overwrite=input_data.overwrite,
@@ -151,8 +154,10 @@ def register_imagekit_tools(mcp: FastMCP, container: ServiceContainer) -> None:
                 transfer_id=transfer_id, file_id=file_id
             )
 
-            return imagekit_service.confirm_upload(
-                transfer_id=input_data.transfer_id, file_id=input_data.file_id
+            return await asyncio.to_thread(
+                imagekit_service.confirm_upload,
+                transfer_id=input_data.transfer_id,
+                file_id=input_data.file_id,
             )
 
         except ValueError as e:
@@ -207,8 +212,10 @@ def register_imagekit_tools(mcp: FastMCP, container: ServiceContainer) -> None:
                 remote_path=remote_path, ctid=ctid
             )
 
-            return imagekit_service.request_download(
-                remote_path=input_data.remote_path, ctid=input_data.ctid
+            return await asyncio.to_thread(
+                imagekit_service.request_download,
+                remote_path=input_data.remote_path,
+                ctid=input_data.ctid,
             )
 
         except ValueError as e:
@@ -243,7 +250,9 @@ def register_imagekit_tools(mcp: FastMCP, container: ServiceContainer) -> None:
         try:
             input_data = ImageKitConfirmDownloadInput(transfer_id=transfer_id)
 
-            return imagekit_service.confirm_download(transfer_id=input_data.transfer_id)
+            return await asyncio.to_thread(
+                imagekit_service.confirm_download, transfer_id=input_data.transfer_id
+            )
 
         except ValueError as e:
             return container.output_formatter.format_error_result(
@@ -4,7 +4,9 @@ Transfer State Manager for ImageKit Plugin
 Tracks active file transfers and handles cleanup.
 """
 
+import heapq
 import logging
+import threading
 import uuid
 from datetime import datetime, timedelta
 
@@ -25,6 +27,12 @@ class TransferManager:
         """
         self.timeout_seconds = timeout_seconds
         self._transfers: dict[str, TransferState] = {}
+        # Min-heap of (created_at, transfer_id) so expiry only looks at the
+        # oldest entries. Entries for completed transfers are skipped lazily.
+        self._expiry: list[tuple[datetime, str]] = []
+        # Tools run in worker threads (asyncio.to_thread), so every access to
+        # the transfers and the heap is serialized
+        self._lock = threading.Lock()
 
     def create_transfer(
         self,
@@ -59,7 +67,9 @@ class TransferManager:
             ctid=ctid,
         )
 
-        self._transfers[transfer_id] = state
+        with self._lock:
+            self._transfers[transfer_id] = state
+            heapq.heappush(self._expiry, (state.timestamp, transfer_id))
         _log.debug(
             f"Created {operation.value} transfer {transfer_id} for {remote_path}"
         )
@@ -76,7 +86,8 @@ class TransferManager:
         Returns:
             TransferState if found, None otherwise
         """
-        return self._transfers.get(transfer_id)
+        with self._lock:
+            return self._transfers.get(transfer_id)
 
     def update_transfer(
         self, transfer_id: str, imagekit_file_id: str | None = None
@@ -91,12 +102,13 @@ class TransferManager:
         Returns:
             True if transfer was found and updated, False otherwise
         """
-        transfer = self._transfers.get(transfer_id)
-        if not transfer:
-            return False
+        with self._lock:
+            transfer = self._transfers.get(transfer_id)
+            if not transfer:
+                return False
 
-        if imagekit_file_id is not None:
-            transfer.imagekit_file_id = imagekit_file_id
+            if imagekit_file_id is not None:
+                transfer.imagekit_file_id = imagekit_file_id
 
         _log.debug(f"Updated transfer {transfer_id}")
         return True
@@ -111,7 +123,8 @@ class TransferManager:
         Returns:
             TransferState if found, None otherwise
         """
-        transfer = self._transfers.pop(transfer_id, None)
+        with self._lock:
+            transfer = self._transfers.pop(transfer_id, None)
         if transfer:
             _log.debug(f"Completed {transfer.operation} transfer {transfer_id}")
         else:
@@ -127,24 +140,35 @@ class TransferManager:
             Number of expired transfers removed
         """
         cutoff_time = datetime.now() - timedelta(seconds=self.timeout_seconds)
-        expired_ids = [
-            tid
-            for tid, transfer in self._transfers.items()
-            if transfer.timestamp < cutoff_time
-        ]
-
-        for tid in expired_ids:
-            transfer = self._transfers.pop(tid)
-            _log.info(f"Cleaned up expired {transfer.operation} transfer {tid}")
-
-        return len(expired_ids)
+        expired: list[TransferState] = []
+
+        # Checking the heap top and popping it must be one atomic step, or a
+        # concurrent cleanup could pop the checked entry first and leave us
+        # popping the next, still live, one
+        with self._lock:
+            while self._expiry and self._expiry[0][0] < cutoff_time:
+                _, tid = heapq.heappop(self._expiry)
+                transfer = self._transfers.pop(tid, None)
+                if transfer is not None:
+                    # None means it already completed; only the heap entry was left
+                    expired.append(transfer)
+
+        for transfer in expired:
+            _log.info(
+                f"Cleaned up expired {transfer.operation} transfer {transfer.transfer_id}"
+            )
+
+        return len(expired)
 
     def get_active_count(self) -> int:
         """Get count of active transfers"""
-        return len(self._transfers)
+        with self._lock:
+            return len(self._transfers)
 
     def clear_all(self) -> None:
         """Clear all transfers (for testing/cleanup)"""
-        count = len(self._transfers)
-        self._transfers.clear()
+        with self._lock:
+            count = len(self._transfers)
+            self._transfers.clear()
+            self._expiry.clear()
         _log.debug(f"Cleared {count} transfers")
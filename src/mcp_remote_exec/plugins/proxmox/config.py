@@ -21,7 +21,7 @@ import os
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProxmoxConfig:
     """Configuration for Proxmox container management plugin"""
 
@@ -9,6 +9,8 @@ This separation allows the presentation layer (mcp_tools.py) to remain clean and
 only depend on services, while the composition root handles all the wiring.
 """
 
+import asyncio
+import atexit
 import logging
 from typing import Annotated
 
@@ -18,6 +20,7 @@ from mcp_remote_exec.config.exceptions import ConfigError
 from mcp_remote_exec.config.ssh_config import SSHConfig
 from mcp_remote_exec.data_access.ssh_connection_manager import SSHConnectionManager
 from mcp_remote_exec.data_access.sftp_manager import SFTPManager
+from mcp_remote_exec.data_access.ssh_pool import get_default_pool
 from mcp_remote_exec.services.command_service import CommandService
 from mcp_remote_exec.services.file_transfer_service import FileTransferService
 from mcp_remote_exec.services.output_formatter import OutputFormatter
@@ -57,7 +60,7 @@ def initialize(mcp_server: FastMCP) -> ServiceContainer:
     _log.info("Initializing SSH MCP Remote Exec...")
 
     # Load and validate configuration (Layer 1: Config)
-    config = SSHConfig()
+    config = SSHConfig.from_env()
     _, error = config.validate()
     if error:
         _log.error(f"Configuration validation failed: {error}")
@@ -66,7 +69,10 @@ def initialize(mcp_server: FastMCP) -> ServiceContainer:
     _log.info(f"Configuration validated. Host: {config.get_host().name}")
 
     # Initialize Data Access Layer (Layer 2)
-    connection_manager = SSHConnectionManager(config)
+    # One pool for the whole process, so connections outlive individual tool
+    # calls; it is closed by shutdown() at interpreter exit
+    connection_pool = get_default_pool()
+    connection_manager = SSHConnectionManager(config, pool=connection_pool)
     sftp_manager = SFTPManager(connection_manager)
 
     # Initialize Service Layer (Layer 3)
@@ -82,6 +88,7 @@ def initialize(mcp_server: FastMCP) -> ServiceContainer:
         command_service=command_service,
         file_service=file_service,
         output_formatter=output_formatter,
+        connection_pool=connection_pool,
     )
 
     # Initialize and register plugins
@@ -134,6 +141,29 @@ def get_container() -> ServiceContainer:
     return _app_context
 
 
+def shutdown() -> None:
+    """
+    Stop plugin background work and close the application's SSH and SFTP connections.
+
+    Registered with atexit, so pooled connections are closed once when the
+    process exits instead of whenever a manager happens to be garbage collected.
+    The ImageKit cleanup executor is drained first, since its pending temp-file
+    removals still need an SSH connection.
+    """
+    if _app_context is None:
+        return
+    imagekit_service = _app_context.plugin_services.get("imagekit")
+    if imagekit_service is not None:
+        imagekit_service.close()
+    _log.info("Closing SSH connections...")
+    _app_context.sftp_manager.close_sftp_connection()
+    _app_context.connection_manager.close_connection()
+    _app_context.connection_pool.close_all()
+
+
+atexit.register(shutdown)
+
+
 def _register_ssh_file_transfer_tools(mcp_server: FastMCP) -> None:
     """
     Register SSH file transfer tools (upload/download).
@@ -160,6 +190,10 @@ def _register_ssh_file_transfer_tools(mcp_server: FastMCP) -> None:
         overwrite: Annotated[
             bool, "Overwrite existing remote files (default: False)"
         ] = False,
+        verify_sha256: Annotated[
+            bool,
+            "Compare SHA-256 digests of the local and uploaded file (default: False)",
+        ] = False,
     ) -> str:
         """Upload a file to your remote SSH server via SFTP.
 
@@ -174,6 +208,7 @@ def _register_ssh_file_transfer_tools(mcp_server: FastMCP) -> None:
             remote_path: Remote destination path on your SSH server (required)
             permissions: File permissions as octal value. Specify as decimal int representing octal notation (e.g., 644 for 0o644/rw-r--r--, 755 for 0o755/rwxr-xr-x). Optional, defaults to server's umask.
             overwrite: Overwrite existing files (default: False, will fail if file exists)
+            verify_sha256: Compare SHA-256 digests of the local and uploaded file (default: False)
 
         Returns:
             Transfer result with metadata (bytes transferred, speed, etc.)
@@ -185,15 +220,19 @@ def _register_ssh_file_transfer_tools(mcp_server: FastMCP) -> None:
                 remote_path=remote_path,
                 permissions=permissions,
                 overwrite=overwrite,
+                verify_sha256=verify_sha256,
             )
 
             container = get_container()
 
-            result = container.file_service.upload_file(
+            # Transfers block on SFTP I/O; keep them off the event loop
+            result = await asyncio.to_thread(
+                container.file_service.upload_file,
                 local_path=input_data.local_path,
                 remote_path=input_data.remote_path,
                 permissions=input_data.permissions,
                 overwrite=input_data.overwrite,
+                verify_sha256=input_data.verify_sha256,
             )
 
             return result
@@ -221,6 +260,10 @@ def _register_ssh_file_transfer_tools(mcp_server: FastMCP) -> None:
             bool,
             "Overwrite existing local files (default: False, will fail if file exists)",
         ] = False,
+        verify_sha256: Annotated[
+            bool,
+            "Compare SHA-256 digests of the remote and downloaded file (default: False)",
+        ] = False,
     ) -> str:
         """Download a file from your remote SSH server via SFTP.
 
@@ -234,6 +277,7 @@ def _register_ssh_file_transfer_tools(mcp_server: FastMCP) -> None:
             remote_path: Remote file path on your SSH server to download (required)
             local_path: Local destination path - absolute or relative (required)
             overwrite: Overwrite existing local files (default: False, will fail if file exists)
+            verify_sha256: Compare SHA-256 digests of the remote and downloaded file (default: False)
 
         Returns:
             Transfer result with metadata (bytes transferred, speed, etc.)
@@ -241,15 +285,21 @@ def _register_ssh_file_transfer_tools(mcp_server: FastMCP) -> None:
         try:
             # Validate input
             input_data = SSHDownloadFileInput(
-                remote_path=remote_path, local_path=local_path, overwrite=overwrite
+                remote_path=remote_path,
+                local_path=local_path,
+                overwrite=overwrite,
+                verify_sha256=verify_sha256,
             )
 
             container = get_container()
 
-            result = container.file_service.download_file(
+            # Transfers block on SFTP I/O; keep them off the event loop
+            result = await asyncio.to_thread(
+                container.file_service.download_file,
                 remote_path=input_data.remote_path,
                 local_path=input_data.local_path,
                 overwrite=input_data.overwrite,
+                verify_sha256=input_data.verify_sha256,
             )
 
             return result
@@ -8,6 +8,7 @@ to the bootstrap module (composition root). It only imports from the services an
 presentation layers, maintaining proper architectural separation.
 """
 
+import asyncio
 import logging
 from typing import Annotated
 
@@ -40,6 +41,10 @@ async def ssh_exec_command(
         str,
         "Output format: 'text' for human-readable or 'json' for structured data",
     ] = "text",
+    cacheable: Annotated[
+        bool,
+        "Reuse the result of an identical recent command (for read-only commands)",
+    ] = False,
 ) -> str:
     """Execute a bash command on your remote SSH server.
 
@@ -54,6 +59,8 @@ async def ssh_exec_command(
         command: Bash command to execute (required)
         timeout: Command timeout in seconds (default: 30, max: 300)
         response_format: Output format - 'text' for human-readable or 'json' for structured data
+        cacheable: Reuse a result from the last few seconds instead of re-running
+                   (only for read-only commands whose output does not change)
 
     Returns:
         Formatted command output with execution metadata
@@ -64,15 +71,20 @@ async def ssh_exec_command(
             command=command,
             timeout=timeout,
             response_format=ResponseFormat(response_format.lower()),
+            cacheable=cacheable,
         )
 
         # Get services from bootstrap module
         container = bootstrap.get_container()
 
-        result = container.command_service.execute_command(
+        # Run the blocking SSH call in a worker thread so the event loop can
+        # keep serving other tool calls while this command runs
+        result = await asyncio.to_thread(
+            container.command_service.execute_command,
             command=input_data.command,
             timeout=input_data.timeout,
             response_format=input_data.response_format.value,
+            cacheable=input_data.cacheable,
         )
 
         return result
@@ -37,6 +37,11 @@ class SSHExecCommandInput(BaseModel):
         description="Output format: 'text' for human-readable or 'json' for structured data",
     )
 
+    cacheable: bool = Field(
+        default=False,
+        description="Reuse the result of an identical command run in the last few seconds",
+    )
+
 
 class SSHUploadFileInput(BaseModel):
     """Input model for uploading files to remote SSH server"""
@@ -64,6 +69,11 @@ class SSHUploadFileInput(BaseModel):
         description="Overwrite existing files (default: False, will fail if file exists)",
     )
 
+    verify_sha256: bool = Field(
+        default=False,
+        description="Verify the upload by comparing SHA-256 digests (default: False)",
+    )
+
     permissions: int | None = Field(
         None,
         description=(
@@ -106,3 +116,8 @@ class SSHDownloadFileInput(BaseModel):
         default=False,
         description="Overwrite existing local files (default: False, will fail if file exists)",
     )
+
+    verify_sha256: bool = Field(
+        default=False,
+        description="Verify the download by comparing SHA-256 digests (default: False)",
+    )
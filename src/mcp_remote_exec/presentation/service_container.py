@@ -10,6 +10,7 @@ from typing import Any
 from mcp_remote_exec.config.ssh_config import SSHConfig
 from mcp_remote_exec.data_access.ssh_connection_manager import SSHConnectionManager
 from mcp_remote_exec.data_access.sftp_manager import SFTPManager
+from mcp_remote_exec.data_access.ssh_pool import SSHConnectionPool, get_default_pool
 from mcp_remote_exec.services.command_service import CommandService
 from mcp_remote_exec.services.file_transfer_service import FileTransferService
 from mcp_remote_exec.services.output_formatter import OutputFormatter
@@ -29,6 +30,7 @@ class ServiceContainer:
         plugin_services: Plugin service instances (key: plugin name, value: service instance)
                         Common keys: "proxmox" (ProxmoxService), "imagekit" (ImageKitService)
         enabled_plugins: Set of plugin names that are currently enabled
+        connection_pool: Process-wide SSH connection pool shared by all services
     """
 
     config: SSHConfig
@@ -39,3 +41,4 @@ class ServiceContainer:
     output_formatter: OutputFormatter
     plugin_services: dict[str, Any] = field(default_factory=dict)
     enabled_plugins: set[str] = field(default_factory=set)
+    connection_pool: SSHConnectionPool = field(default_factory=get_default_pool)
@@ -6,12 +6,14 @@ between the presentation layer and data access layer.
 """
 
 from mcp_remote_exec.services.command_service import CommandService
+from mcp_remote_exec.services.command_cache import CommandResultCache
 from mcp_remote_exec.services.file_transfer_service import FileTransferService
 from mcp_remote_exec.services.output_formatter import OutputFormatter, FormattedResult
 from mcp_remote_exec.services.file_utils import cleanup_temp_file
 
 __all__ = [
     "CommandService",
+    "CommandResultCache",
     "FileTransferService",
     "OutputFormatter",
     "FormattedResult",
@@ -0,0 +1,98 @@
+"""
+Command Result Cache for SSH MCP Remote Exec
+
+TTL-bounded cache of command results so that repeated discovery commands
+(e.g. ``uname -a``, ``hostname``) are answered without an SSH round trip.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import replace
+
+from mcp_remote_exec.config.constants import (
+    DEFAULT_COMMAND_CACHE_SIZE,
+    DEFAULT_COMMAND_CACHE_TTL,
+)
+from mcp_remote_exec.data_access.ssh_connection_manager import ExecutionResult
+
+CACHEABLE_COMMAND_PATTERN = re.compile(
+    r"^(?:uname(?: -[a-z]+)?|hostname|cat /etc/os-release|lsb_release -a|ls -la /)$"
+)
+"""Commands whose output is considered stable enough to cache without opt-in"""
+
+CacheKey = tuple[str, int, str, str]
+"""Cache key: (host, port, username, command)"""
+
+
+def is_cacheable_command(command: str) -> bool:
+    """Check whether a command is on the built-in cache allowlist"""
+    return CACHEABLE_COMMAND_PATTERN.match(command.strip()) is not None
+
+
+class CommandResultCache:
+    """Thread-safe LRU cache of ExecutionResults with a time-to-live"""
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_COMMAND_CACHE_SIZE,
+        ttl: float = DEFAULT_COMMAND_CACHE_TTL,
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of cached results
+            ttl: Seconds a cached result stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[CacheKey, tuple[float, ExecutionResult]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> ExecutionResult | None:
+        """
+        Get a cached result.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Copy of the cached result marked ``cached=True``, or None on miss/expiry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return replace(result, cached=True)
+
+    def put(self, key: CacheKey, result: ExecutionResult) -> None:
+        """
+        Store a result, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key
+            result: Execution result to cache
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached results"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of cached results, including any not yet evicted after expiry"""
+        return len(self._entries)
@@ -5,6 +5,7 @@ Provides business logic for SSH command execution.
 """
 
 import logging
+from collections.abc import Sequence
 from datetime import datetime
 
 from mcp_remote_exec.config.ssh_config import SSHConfig
@@ -17,6 +18,10 @@ from mcp_remote_exec.data_access.exceptions import (
     AuthenticationError,
     SSHConnectionError,
 )
+from mcp_remote_exec.services.command_cache import (
+    CommandResultCache,
+    is_cacheable_command,
+)
 from mcp_remote_exec.services.output_formatter import OutputFormatter
 
 _log = logging.getLogger(__name__)
@@ -25,24 +30,39 @@ _log = logging.getLogger(__name__)
 class CommandService:
     """Provides business logic for SSH command execution"""
 
-    def __init__(self, connection_manager: SSHConnectionManager, config: SSHConfig):
+    def __init__(
+        self,
+        connection_manager: SSHConnectionManager,
+        config: SSHConfig,
+        result_cache: CommandResultCache | None = None,
+    ):
         """Initialize command service with dependencies"""
         self.connection_manager = connection_manager
         self.config = config
         self.output_formatter = OutputFormatter(config)
+        self.result_cache = (
+            result_cache if result_cache is not None else CommandResultCache()
+        )
 
     def execute_command(
         self,
         command: str = "",
         timeout: int = 30,
         response_format: str = "text",
+        cacheable: bool = False,
     ) -> str:
         """Execute SSH command with formatting.
 
+        Successful results of allowlisted discovery commands (see
+        command_cache.CACHEABLE_COMMAND_PATTERN), or of any command when
+        ``cacheable`` is True, are reused for a short TTL instead of
+        re-running the command.
+
         Args:
             command: Bash command to execute (already validated by Pydantic in presentation layer)
             timeout: Command timeout in seconds (default: 30, clamped to 1-300 based on config)
             response_format: Output format - "text" or "json" (case-insensitive)
+            cacheable: Allow a recent identical result to be reused
 
         Returns:
             Formatted command output with execution metadata
@@ -56,7 +76,9 @@ class CommandService:
             host_config = self.config.get_host()
             _log.debug(f"Executing command on {host_config.name}: {command[:100]}")
 
-            execution_result = self.connection_manager.execute_command(command, timeout)
+            execution_result = self._execute_with_cache(
+                command, timeout, cacheable or is_cacheable_command(command)
+            )
 
             # Step 3: Format result
             formatted_result = self.output_formatter.format_command_output(
@@ -96,6 +118,26 @@ class CommandService:
             _log.error(f"{error_msg} - {context}")
             return self.output_formatter.format_error_result(error_msg, context).content
 
+    def _execute_with_cache(
+        self, command: str, timeout: int, use_cache: bool
+    ) -> ExecutionResult:
+        """Execute a command, consulting the result cache when allowed"""
+        if not use_cache:
+            return self.connection_manager.execute_command(command, timeout)
+
+        host_config = self.config.get_host()
+        cache_key = (host_config.host, host_config.port, host_config.username, command)
+        cached_result = self.result_cache.get(cache_key)
+        if cached_result is not None:
+            _log.debug(f"Serving cached result for: {command[:100]}")
+            return cached_result
+
+        execution_result = self.connection_manager.execute_command(command, timeout)
+        # Only successful, complete results are worth reusing
+        if execution_result.exit_code == 0 and not execution_result.timeout_reached:
+            self.result_cache.put(cache_key, execution_result)
+        return execution_result
+
     def execute_command_raw(
         self,
         command: str,
@@ -124,3 +166,29 @@ class CommandService:
         _log.debug(f"Executing raw command on {host_config.name}: {command[:100]}")
 
         return self.connection_manager.execute_command(command, timeout)
+
+    def execute_pipeline(
+        self,
+        commands: Sequence[str],
+        timeout: int = 30,
+    ) -> ExecutionResult:
+        """Execute several commands in one SSH exec channel.
+
+        The commands are joined with ``&&``, so they run in order and stop at
+        the first one that fails. The result is that of the whole chain: the
+        exit code of the last command run, with the combined stdout/stderr.
+        Like execute_command_raw(), this is intended for plugin services.
+
+        Args:
+            commands: Shell commands to run; arguments must already be quoted
+            timeout: Timeout for the whole chain in seconds (default: 30)
+
+        Returns:
+            ExecutionResult with exit_code, stdout, stderr, and timeout status
+
+        Raises:
+            AuthenticationError: If SSH authentication fails
+            CommandExecutionError: If command execution fails
+            SSHConnectionError: If SSH connection fails
+        """
+        return self.execute_command_raw(" && ".join(commands), timeout)
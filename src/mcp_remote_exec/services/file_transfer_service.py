@@ -5,11 +5,14 @@ Provides business logic for file upload/download operations with validation.
 """
 
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
+from typing import IO
 
 from mcp_remote_exec.config.ssh_config import SSHConfig
 from mcp_remote_exec.data_access.sftp_manager import SFTPManager, FileTransferResult
-from mcp_remote_exec.data_access.path_validator import PathValidator
+from mcp_remote_exec.data_access.path_validator import check_paths_for_traversal
 from mcp_remote_exec.services.output_formatter import OutputFormatter
 
 _log = logging.getLogger(__name__)
@@ -25,7 +28,11 @@ class FileTransferService:
         self.output_formatter = OutputFormatter(config)
 
     def download_file(
-        self, remote_path: str, local_path: str, overwrite: bool = False
+        self,
+        remote_path: str,
+        local_path: str,
+        overwrite: bool = False,
+        verify_sha256: bool = False,
     ) -> str:
         """Download file from remote server"""
 
@@ -33,7 +40,7 @@ class FileTransferService:
             _log.debug(f"Download requested: {remote_path} -> {local_path}")
             # Perform download (validation and directory creation delegated to SFTPManager)
             transfer_result = self.sftp_manager.download_file(
-                remote_path, local_path, overwrite
+                remote_path, local_path, overwrite, verify_sha256
             )
 
             if transfer_result.success:
@@ -64,6 +71,7 @@ class FileTransferService:
         remote_path: str,
         permissions: int | None = None,
         overwrite: bool = False,
+        verify_sha256: bool = False,
     ) -> str:
         """Upload file to remote server"""
 
@@ -71,7 +79,7 @@ class FileTransferService:
             _log.debug(f"Upload requested: {local_path} -> {remote_path}")
             # Perform upload (validation delegated to SFTPManager)
             transfer_result = self.sftp_manager.upload_file(
-                local_path, remote_path, permissions, overwrite
+                local_path, remote_path, permissions, overwrite, verify_sha256
             )
 
             if transfer_result.success:
@@ -153,13 +161,78 @@ class FileTransferService:
             local_path, remote_path, permissions, overwrite
         )
 
+    def upload_stream_raw(
+        self,
+        reader: IO[bytes],
+        remote_path: str,
+        permissions: int | None = None,
+        overwrite: bool = False,
+    ) -> FileTransferResult:
+        """Upload the contents of a byte stream and return raw result.
+
+        Like upload_file_raw(), but reads from an open binary stream (e.g. an
+        HTTP response body) instead of a local file, so plugins can pipe data
+        to the remote server without a temporary file.
+
+        Args:
+            reader: Binary file-like object to read from
+            remote_path: Destination path on remote server
+            permissions: File permissions in octal notation (e.g., 644, 755)
+            overwrite: Whether to overwrite existing remote files
+
+        Returns:
+            FileTransferResult with success status, message, and transfer metadata
+        """
+        _log.debug(f"Raw stream upload requested: -> {remote_path}")
+        return self.sftp_manager.upload_stream(
+            reader, remote_path, permissions, overwrite
+        )
+
+    @contextmanager
+    def open_download_stream_raw(self, remote_path: str) -> Iterator[IO[bytes]]:
+        """Open a file on the remote server as a readable byte stream.
+
+        Lets plugins pipe remote file contents to another destination (e.g.
+        an HTTP upload) without downloading to a temporary file first.
+
+        Args:
+            remote_path: Path to file on remote server
+
+        Yields:
+            Binary file-like object reading the remote file
+
+        Raises:
+            FileValidationError: If path validation or size check fails
+            SFTPError: If the file does not exist or SFTP operation fails
+        """
+        _log.debug(f"Raw stream download requested: {remote_path}")
+        with self.sftp_manager.open_read_stream(remote_path) as reader:
+            yield reader
+
+    def exists(self, remote_path: str) -> bool:
+        """Check whether a regular file exists on the remote server.
+
+        Same semantics as ``test -f`` (directories report False), but uses an
+        SFTP stat on the already open SFTP channel instead of a new exec channel.
+
+        Args:
+            remote_path: Path on remote server
+
+        Returns:
+            True if the path is an accessible regular file
+
+        Raises:
+            SFTPError: If SFTP operation fails
+        """
+        return self.sftp_manager.exists(remote_path)
+
     def validate_paths(self, *paths: str) -> tuple[bool, str | None]:
         """
         Validate multiple paths for directory traversal attempts.
 
         This service method provides plugins with a way to validate paths
         without directly accessing the data access layer. It wraps the
-        PathValidator functionality while maintaining proper layer separation.
+        path_validator functionality while maintaining proper layer separation.
 
         Args:
             *paths: Variable number of paths to check
@@ -169,7 +242,7 @@ class FileTransferService:
             - is_valid: True if all paths are safe, False otherwise
             - error_message: None if valid, error description if invalid
         """
-        return PathValidator.check_paths_for_traversal(*paths)
+        return check_paths_for_traversal(*paths)
 
     def _add_transfer_metadata(
         self,
@@ -5,6 +5,7 @@ Provides utility functions for file operations used by service classes.
 """
 
 import logging
+import shlex
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -35,7 +36,7 @@ def cleanup_temp_file(command_service: "CommandService", temp_path: str) -> None
         # File is removed if exists, errors are silently ignored
     """
     try:
-        command_service.execute_command_raw(f"rm -f {temp_path}", 5)
+        command_service.execute_command_raw(f"rm -f {shlex.quote(temp_path)}", 5)
         _log.debug(f"Cleaned up temp file: {temp_path}")
     except Exception as e:  # nosec B110 - Intentionally broad for best-effort cleanup
         # Best-effort cleanup: ignore all errors
@@ -117,6 +117,9 @@ class OutputFormatter:
             json_result["stderr_truncated"] = True
             json_result["stderr_original_length"] = stderr_len
 
+        if result.cached:
+            json_result["cached"] = True
+
         json_content = json.dumps(json_result, indent=2)
 
         return FormattedResult(
@@ -149,6 +152,9 @@ class OutputFormatter:
         if result.timeout_reached:
             metadata.append("[WARNING] EXECUTION TIMED OUT")
 
+        if result.cached:
+            metadata.append("[CACHED] Result reused from a recent identical command")
+
         sections.append("\n".join(metadata))
 
         # Combine all sections
@@ -195,6 +201,9 @@ class OutputFormatter:
             if result.transfer_speed > 0:
                 sections.append(f"Transfer speed: {result.transfer_speed:.0f} bytes/s")
 
+            if result.sha256:
+                sections.append(f"SHA-256 (verified): {result.sha256}")
+
             content = "\n".join(sections)
         else:
             content = (
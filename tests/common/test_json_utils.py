@@ -0,0 +1,46 @@
+"""Tests for Common JSON Utilities"""
+
+import json
+import pytest
+
+from mcp_remote_exec.common.json_utils import dumps
+
+
+class TestDumps:
+    """Tests for dumps function"""
+
+    PAYLOAD = {
+        "success": False,
+        "error": "File not found",
+        "bytes": 1024,
+        "nested": {"items": [1, 2.5, None, True]},
+    }
+
+    def test_matches_stdlib_layout(self):
+        """Test output is laid out like json.dumps(obj, indent=2)"""
+        assert dumps(self.PAYLOAD) == json.dumps(self.PAYLOAD, indent=2)
+
+    def test_round_trips(self):
+        """Test output parses back to the original object"""
+        assert json.loads(dumps(self.PAYLOAD)) == self.PAYLOAD
+
+    def test_compact_layout(self):
+        """Test pretty=False emits JSON without whitespace"""
+        expected = json.dumps(self.PAYLOAD, separators=(",", ":"))
+
+        assert dumps(self.PAYLOAD, pretty=False) == expected
+
+    @pytest.mark.parametrize("pretty", [True, False])
+    def test_non_ascii_not_escaped(self, pretty):
+        """Test non-ASCII text is kept as UTF-8 in both layouts"""
+        payload = {"path": "/tmp/café.txt"}
+
+        result = dumps(payload, pretty=pretty)
+
+        assert "café" in result
+        assert json.loads(result) == payload
+
+    def test_unserializable_value_raises(self):
+        """Test unsupported values raise TypeError"""
+        with pytest.raises(TypeError):
+            dumps({"value": object()})
@@ -1,8 +1,12 @@
 """Tests for Common Validators"""
 
 import pytest
+from pydantic import BaseModel, ValidationError, field_validator
 
-from mcp_remote_exec.common.validators import validate_octal_permissions
+from mcp_remote_exec.common.validators import (
+    pydantic_permissions_field_validator,
+    validate_octal_permissions,
+)
 
 
 class TestValidateOctalPermissions:
@@ -38,3 +42,30 @@ class TestValidateOctalPermissions:
         """Test single digit permissions"""
         assert validate_octal_permissions(7) == 7
         assert validate_octal_permissions(5) == 5
+
+    def test_negative_permission(self):
+        """Test negative values are rejected with the octal error message"""
+        with pytest.raises(ValueError, match="Invalid octal permission value"):
+            validate_octal_permissions(-644)
+
+
+class TestPydanticPermissionsFieldValidator:
+    """Tests for pydantic_permissions_field_validator"""
+
+    def test_alias_calls_validator_directly(self):
+        """Test the Pydantic validator is the bare validator, not a wrapper"""
+        assert pydantic_permissions_field_validator.__func__ is validate_octal_permissions
+
+    def test_used_as_field_validator(self):
+        """Test the alias works with Pydantic's field_validator"""
+
+        class Model(BaseModel):
+            permissions: int | None = None
+
+            validate_permissions = field_validator("permissions")(
+                pydantic_permissions_field_validator
+            )
+
+        assert Model(permissions=644).permissions == 644
+        with pytest.raises(ValidationError, match="Invalid octal permission value"):
+            Model(permissions=648)
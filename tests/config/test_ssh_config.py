@@ -2,6 +2,7 @@
 
 import os
 import pytest
+from dataclasses import FrozenInstanceError
 from unittest.mock import patch
 
 from mcp_remote_exec.common.constants import MAX_TIMEOUT
@@ -129,6 +130,87 @@ class TestSSHConfig:
             assert config.host.port == 22
             assert config.security.accept_risks is True
 
+    @pytest.mark.parametrize("value", ["true", "TRUE", "True", "1", "yes", " on "])
+    def test_init_accepts_truthy_risk_values(self, value):
+        """Test common truthy spellings accept the risks"""
+        env = {
+            "I_ACCEPT_RISKS": value,
+            "HOST": "test.example.com",
+            "SSH_PASSWORD": "password",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            assert SSHConfig().security.accept_risks is True
+
+    @pytest.mark.parametrize("value", ["false", "0", "no", "", "truthy"])
+    def test_init_rejects_non_truthy_risk_values(self, value):
+        """Test anything outside the truthy set does not accept the risks"""
+        with patch.dict(os.environ, {"I_ACCEPT_RISKS": value}, clear=True):
+            with pytest.raises(ConfigError, match="You must explicitly accept the risks"):
+                SSHConfig()
+
+    @pytest.mark.parametrize(
+        "value,expected", [(None, True), ("true", True), ("1", True), ("false", False), ("off", False)]
+    )
+    def test_init_strict_host_key_checking(self, value, expected):
+        """Test SSH_STRICT_HOST_KEY_CHECKING parsing and default"""
+        env = {
+            "I_ACCEPT_RISKS": "true",
+            "HOST": "test.example.com",
+            "SSH_PASSWORD": "password",
+        }
+        if value is not None:
+            env["SSH_STRICT_HOST_KEY_CHECKING"] = value
+        with patch.dict(os.environ, env, clear=True):
+            assert SSHConfig().security.strict_host_key_checking is expected
+
+    def test_init_empty_auth_values_are_unset(self):
+        """Test empty SSH_PASSWORD/SSH_KEY values do not count as authentication"""
+        env = {
+            "I_ACCEPT_RISKS": "true",
+            "HOST": "test.example.com",
+            "SSH_PASSWORD": "",
+            "SSH_KEY": "",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            with pytest.raises(ConfigError, match="No authentication configured"):
+                SSHConfig()
+
+    def test_init_sftp_max_unconfirmed(self):
+        """Test SFTP in-flight request window is read from the environment"""
+        env = {
+            "I_ACCEPT_RISKS": "true",
+            "HOST": "test.example.com",
+            "SSH_PASSWORD": "password",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            assert SSHConfig().security.sftp_max_unconfirmed == 64
+
+        with patch.dict(os.environ, {**env, "SFTP_MAX_UNCONFIRMED": "16"}, clear=True):
+            assert SSHConfig().security.sftp_max_unconfirmed == 16
+
+        with patch.dict(os.environ, {**env, "SFTP_MAX_UNCONFIRMED": "0"}, clear=True):
+            assert SSHConfig().security.sftp_max_unconfirmed == 1
+
+    def test_init_max_sessions_per_transport(self):
+        """Test the per-transport session limit is read from the environment"""
+        env = {
+            "I_ACCEPT_RISKS": "true",
+            "HOST": "test.example.com",
+            "SSH_PASSWORD": "password",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            assert SSHConfig().security.max_sessions_per_transport == 8
+
+        with patch.dict(
+            os.environ, {**env, "SSH_MAX_SESSIONS_PER_TRANSPORT": "3"}, clear=True
+        ):
+            assert SSHConfig().security.max_sessions_per_transport == 3
+
+        with patch.dict(
+            os.environ, {**env, "SSH_MAX_SESSIONS_PER_TRANSPORT": "0"}, clear=True
+        ):
+            assert SSHConfig().security.max_sessions_per_transport == 1
+
     def test_init_with_key_auth(self, tmp_path):
         """Test successful initialization with SSH key authentication"""
         key_file = tmp_path / "test_key"
@@ -263,3 +345,64 @@ class TestSSHConfig:
         assert DEFAULT_TIMEOUT == 30
         assert MAX_TIMEOUT == 300
         assert DEFAULT_SSH_PORT == 22
+
+
+class TestSSHConfigFromEnv:
+    """Tests for SSHConfig.from_env"""
+
+    def setup_method(self):
+        SSHConfig.from_env.cache_clear()
+
+    def teardown_method(self):
+        SSHConfig.from_env.cache_clear()
+
+    def test_from_env_returns_cached_instance(self, mock_env_minimal):
+        """Test the environment is parsed once and the instance reused"""
+        with patch.dict(os.environ, mock_env_minimal, clear=True):
+            first = SSHConfig.from_env()
+            second = SSHConfig.from_env()
+
+        assert first is second
+        assert first.host.host == "test.example.com"
+
+    def test_from_env_cache_clear_reparses(self, mock_env_minimal):
+        """Test cache_clear forces a fresh parse"""
+        with patch.dict(os.environ, mock_env_minimal, clear=True):
+            first = SSHConfig.from_env()
+        SSHConfig.from_env.cache_clear()
+        with patch.dict(os.environ, {**mock_env_minimal, "HOST": "other"}, clear=True):
+            second = SSHConfig.from_env()
+
+        assert second is not first
+        assert second.host.host == "other"
+
+    def test_from_env_does_not_cache_errors(self, mock_env_minimal):
+        """Test a failed parse is retried on the next call"""
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(ConfigError):
+                SSHConfig.from_env()
+        with patch.dict(os.environ, mock_env_minimal, clear=True):
+            assert SSHConfig.from_env().host.host == "test.example.com"
+
+    def test_nested_configs_use_slots(self, mock_env_minimal):
+        """Test HostConfig and SecurityConfig instances carry no __dict__"""
+        with patch.dict(os.environ, mock_env_minimal, clear=True):
+            config = SSHConfig.from_env()
+
+        assert not hasattr(config.host, "__dict__")
+        assert not hasattr(config.security, "__dict__")
+
+
+class TestConfigImmutability:
+    """Tests for frozen HostConfig and SecurityConfig"""
+
+    def test_host_config_is_frozen_and_hashable(self, mock_host_config):
+        """Test HostConfig cannot be mutated and can be used as a dict key"""
+        with pytest.raises(FrozenInstanceError):
+            mock_host_config.port = 2222
+        assert {mock_host_config: True}[mock_host_config] is True
+
+    def test_security_config_is_frozen(self, mock_security_config):
+        """Test SecurityConfig cannot be mutated"""
+        with pytest.raises(FrozenInstanceError):
+            mock_security_config.max_timeout = 60
@@ -1,5 +1,8 @@
 """Tests for custom exceptions"""
 
+import pickle
+
+import pytest
 from mcp_remote_exec.data_access.exceptions import (
     SSHConnectionError,
     AuthenticationError,
@@ -135,3 +138,37 @@ class TestFileValidationError:
         error = FileValidationError("File invalid")
         assert not isinstance(error, SSHConnectionError)
         assert isinstance(error, Exception)
+
+
+class TestExceptionPickling:
+    """Tests that exception context survives a pickle round trip"""
+
+    @pytest.mark.parametrize(
+        "error,attrs",
+        [
+            (SSHConnectionError("down", host_name="h"), {"host_name": "h"}),
+            (
+                AuthenticationError("denied", host_name="h", username="u"),
+                {"host_name": "h", "username": "u"},
+            ),
+            (
+                CommandExecutionError("failed", host_name="h", command="ls", exit_code=2),
+                {"host_name": "h", "command": "ls", "exit_code": 2},
+            ),
+            (
+                SFTPError("failed", operation="upload", path="/tmp/x"),
+                {"operation": "upload", "path": "/tmp/x"},
+            ),
+            (
+                FileValidationError("bad", file_path="/tmp/x", reason="empty_path"),
+                {"file_path": "/tmp/x", "reason": "empty_path"},
+            ),
+        ],
+    )
+    def test_round_trip_keeps_context(self, error, attrs):
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert type(restored) is type(error)
+        assert str(restored) == str(error)
+        for name, value in attrs.items():
+            assert getattr(restored, name) == value
@@ -1,7 +1,13 @@
 """Tests for Path Validator"""
 
 import pytest
-from mcp_remote_exec.data_access.path_validator import PathValidator, MSG_PATH_TRAVERSAL_ERROR
+from mcp_remote_exec.data_access.path_validator import (
+    PathValidator,
+    MSG_PATH_TRAVERSAL_ERROR,
+    _check_traversal_cached,
+    check_paths_for_traversal,
+    validate_path,
+)
 from mcp_remote_exec.data_access.exceptions import FileValidationError
 
 
@@ -30,6 +36,19 @@ class TestPathValidator:
         with pytest.raises(FileValidationError, match="traversal"):
             PathValidator.validate_path("some/path/../../../etc/shadow")
 
+    @pytest.mark.parametrize(
+        "path", ["..", "a/..", "/var/www/../../etc/passwd", "a/b/../c", "dir\\..\\file"]
+    )
+    def test_validate_path_traversal_any_component(self, path):
+        """Test any '..' component is rejected, even if it would normalize away"""
+        with pytest.raises(FileValidationError, match="traversal"):
+            PathValidator.validate_path(path)
+
+    @pytest.mark.parametrize("path", ["/foo..bar/baz", "archive..tar", "..hidden", "a/...", "v1..2/x"])
+    def test_validate_path_dots_in_names_allowed(self, path):
+        """Test names that merely contain '..' are not treated as traversal"""
+        PathValidator.validate_path(path)
+
     def test_validate_path_traversal_disabled(self):
         """Test validation passes when traversal check is disabled"""
         # Should not raise even with ..
@@ -73,6 +92,13 @@ class TestPathValidator:
         assert is_valid is False
         assert error == MSG_PATH_TRAVERSAL_ERROR
 
+    def test_check_paths_for_traversal_empty_path(self):
+        """Test an empty path fails with the same message as validate_path"""
+        is_valid, error = PathValidator.check_paths_for_traversal("/tmp/a", "  ")
+        assert is_valid is False
+        with pytest.raises(FileValidationError, match=error):
+            PathValidator.validate_path("  ")
+
     def test_check_paths_for_traversal_empty_list(self):
         """Test empty path list"""
         is_valid, error = PathValidator.check_paths_for_traversal()
@@ -119,3 +145,53 @@ class TestPathValidator:
             assert e.file_path == "../etc/passwd"
             assert e.reason == "directory_traversal"
             assert MSG_PATH_TRAVERSAL_ERROR in str(e)
+
+
+class TestTraversalCache:
+    """Tests for the memoized traversal check"""
+
+    def test_repeated_paths_hit_cache(self):
+        """Test validating the same path twice reuses the cached result"""
+        _check_traversal_cached.cache_clear()
+
+        PathValidator.validate_path("/var/log/syslog")
+        PathValidator.validate_path("/var/log/syslog")
+
+        info = _check_traversal_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_cached_traversal_still_raises(self):
+        """Test a cached unsafe result raises on every call"""
+        for _ in range(2):
+            with pytest.raises(FileValidationError) as exc_info:
+                PathValidator.validate_path("../etc/passwd")
+            assert exc_info.value.reason == "directory_traversal"
+
+    def test_existence_check_is_not_cached(self, tmp_path):
+        """Test existence is re-checked after the file appears"""
+        target = tmp_path / "later.txt"
+
+        with pytest.raises(FileValidationError):
+            PathValidator.validate_path(str(target), check_exists=True)
+        target.write_text("now it exists")
+        PathValidator.validate_path(str(target), check_exists=True)
+
+
+class TestModuleFunctions:
+    """Tests for the module-level validation functions"""
+
+    def test_validate_path_function(self):
+        """Test validate_path can be called without the PathValidator class"""
+        validate_path("/var/www/html")
+        with pytest.raises(FileValidationError, match="traversal"):
+            validate_path("../etc/passwd")
+
+    def test_check_paths_for_traversal_function(self):
+        """Test check_paths_for_traversal can be called without the class"""
+        assert check_paths_for_traversal("/tmp/a", "/tmp/b") == (True, None)
+
+    def test_class_shim_delegates_to_functions(self):
+        """Test PathValidator keeps exposing the same functions"""
+        assert PathValidator.validate_path is validate_path
+        assert PathValidator.check_paths_for_traversal is check_paths_for_traversal
@@ -4,15 +4,31 @@ Tests for SFTPManager
 Basic smoke tests for SFTP manager functionality.
 """
 
+import hashlib
+import io
+import mmap
+import stat
+import threading
+import time
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
 from unittest.mock import MagicMock, patch
-from mcp_remote_exec.data_access.sftp_manager import SFTPManager, FileTransferResult
+from mcp_remote_exec.config.constants import DEFAULT_SFTP_WINDOW_SIZE
+from mcp_remote_exec.data_access.ssh_connection_manager import ExecutionResult
+from mcp_remote_exec.data_access.exceptions import SFTPError, FileValidationError
+from mcp_remote_exec.data_access.sftp_manager import (
+    SFTPManager,
+    FileTransferResult,
+    _parse_octal_permissions,
+)
 
 
 @pytest.fixture
 def mock_connection_manager():
     """Create a mock SSH connection manager"""
     mock = MagicMock()
+    mock.config.security.max_file_size = 1024
     return mock
 
 
@@ -58,6 +74,17 @@ def test_file_transfer_result_defaults():
     assert result.transfer_speed == 0.0
 
 
+def test_file_transfer_result_is_immutable():
+    """Test FileTransferResult is frozen and slotted"""
+    result = FileTransferResult(
+        success=True, message="OK", local_path="/local", remote_path="/remote"
+    )
+
+    with pytest.raises(FrozenInstanceError):
+        result.success = False  # type: ignore[misc]
+    assert not hasattr(result, "__dict__")
+
+
 def test_file_transfer_result_failure():
     """Test FileTransferResult for failed transfer"""
     result = FileTransferResult(
@@ -74,16 +101,40 @@ def test_file_transfer_result_failure():
     assert result.bytes_transferred == 0
 
 
-@patch("mcp_remote_exec.data_access.sftp_manager.os.path.exists")
-def test_validate_file_size_within_limit(
-    mock_exists, sftp_manager, mock_connection_manager
+def test_stat_and_validate_within_limit(tmp_path, sftp_manager, mock_connection_manager):
+    """Test a local file within the limit returns its size"""
+    local_file = tmp_path / "in.txt"
+    local_file.write_bytes(b"12345")
+
+    assert sftp_manager._stat_and_validate(str(local_file)) == 5
+
+
+def test_stat_and_validate_too_large(tmp_path, sftp_manager, mock_connection_manager):
+    """Test a local file over the limit is rejected"""
+    mock_connection_manager.config.security.max_file_size = 4
+    sftp_manager.invalidate_config_cache()
+    local_file = tmp_path / "in.txt"
+    local_file.write_bytes(b"12345")
+
+    with pytest.raises(FileValidationError) as exc_info:
+        sftp_manager._stat_and_validate(str(local_file))
+    assert exc_info.value.reason == "file_too_large"
+
+
+def test_upload_missing_local_file_single_stat(
+    tmp_path, sftp_manager, mock_connection_manager
 ):
-    """Test file size validation when file is within limit"""
-    # Setup mock
-    mock_exists.return_value = True
+    """Test a missing upload source is reported from one os.stat call"""
+    missing = str(tmp_path / "missing.txt")
 
-    # This is a basic structure test - actual validation logic would need more mocking
-    assert sftp_manager is not None
+    with patch(
+        "mcp_remote_exec.data_access.sftp_manager.os.stat", side_effect=FileNotFoundError
+    ) as mock_stat:
+        result = sftp_manager.upload_file(missing, "/remote/missing.txt")
+
+    assert result.success is False
+    assert result.message == f"Local path does not exist: {missing}"
+    mock_stat.assert_called_once_with(missing)
 
 
 def test_sftp_manager_has_required_methods(sftp_manager):
@@ -92,3 +143,541 @@ def test_sftp_manager_has_required_methods(sftp_manager):
     assert hasattr(sftp_manager, "download_file")
     assert callable(getattr(sftp_manager, "upload_file"))
     assert callable(getattr(sftp_manager, "download_file"))
+
+
+@patch("paramiko.SFTPClient.from_transport")
+def test_download_file_pipelines_reads(
+    mock_from_transport, tmp_path, sftp_manager, mock_connection_manager
+):
+    """Test download keeps the configured number of read requests in flight"""
+    mock_connection_manager.config.security.sftp_max_unconfirmed = 32
+    sftp_client = mock_from_transport.return_value
+    sftp_client.stat.return_value.st_size = 10
+    local_path = str(tmp_path / "out.txt")
+
+    result = sftp_manager.download_file("/remote/file.txt", local_path)
+
+    assert result.success is True
+    sftp_client.get.assert_called_once_with(
+        "/remote/file.txt",
+        local_path,
+        prefetch=True,
+        max_concurrent_prefetch_requests=32,
+    )
+
+
+@patch("mcp_remote_exec.data_access.sftp_manager.DEFAULT_SFTP_PARALLEL_THRESHOLD", 10)
+@patch("paramiko.SFTPClient.from_transport")
+def test_large_download_fetches_ranges_in_parallel(
+    mock_from_transport, tmp_path, sftp_manager
+):
+    """Test a large download is split into ranges on separate channels"""
+    payload = bytes(range(100))
+    sftp_client = mock_from_transport.return_value
+    sftp_client.stat.return_value.st_size = len(payload)
+    remote_file = sftp_client.open.return_value.__enter__.return_value
+    remote_file.readv.side_effect = lambda chunks, **kwargs: (
+        payload[offset : offset + length] for offset, length in chunks
+    )
+    local_path = tmp_path / "out.bin"
+
+    result = sftp_manager.download_file("/remote/big.bin", str(local_path))
+
+    assert result.success is True
+    assert local_path.read_bytes() == payload
+    sftp_client.get.assert_not_called()
+    requested = sorted(
+        chunk for call in remote_file.readv.call_args_list for chunk in call.args[0]
+    )
+    assert requested == [(0, 25), (25, 25), (50, 25), (75, 25)]
+    # One shared channel for the stat plus one per range, all ranges closed
+    assert mock_from_transport.call_count == 5
+    assert sftp_client.close.call_count == 4
+
+
+@patch("paramiko.SFTPClient.from_transport")
+def test_sftp_client_uses_large_window(
+    mock_from_transport, sftp_manager, mock_connection_manager
+):
+    """Test the SFTP channel is opened with the enlarged window and reused"""
+    transport = mock_connection_manager.get_connection.return_value.get_transport.return_value
+
+    first = sftp_manager._get_sftp_client()
+    second = sftp_manager._get_sftp_client()
+
+    assert first is second is mock_from_transport.return_value
+    mock_from_transport.assert_called_once_with(
+        transport, window_size=DEFAULT_SFTP_WINDOW_SIZE
+    )
+
+
+def test_sftp_client_without_transport_raises(sftp_manager, mock_connection_manager):
+    """Test a disconnected SSH client surfaces as SFTPError"""
+    mock_connection_manager.get_connection.return_value.get_transport.return_value = None
+
+    with pytest.raises(SFTPError, match="not connected"):
+        sftp_manager._get_sftp_client()
+
+
+def test_concurrent_first_use_opens_one_shared_channel(sftp_manager):
+    """Test racing callers share a single lazily created SFTP channel"""
+    opened = []
+    barrier = threading.Barrier(8)
+
+    def open_channel():
+        time.sleep(0.01)  # Widen the window for a racing second open
+        client = MagicMock()
+        opened.append(client)
+        return client
+
+    def get_client():
+        barrier.wait()
+        return sftp_manager._get_sftp_client()
+
+    with patch.object(sftp_manager, "_open_sftp_channel", side_effect=open_channel):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = list(pool.map(lambda _: get_client(), range(8)))
+
+    assert len(opened) == 1
+    assert all(client is opened[0] for client in clients)
+
+
+@patch("paramiko.SFTPClient.from_transport")
+def test_upload_overwrite_skips_stat(
+    mock_from_transport, tmp_path, sftp_manager, mock_connection_manager
+):
+    """Test overwrite=True truncates in place without stat/remove round trips"""
+    sftp_client = mock_from_transport.return_value
+    remote_file = sftp_client.open.return_value.__enter__.return_value
+    local_file = tmp_path / "in.txt"
+    local_file.write_bytes(b"payload")
+
+    result = sftp_manager.upload_file(str(local_file), "/remote/in.txt", overwrite=True)
+
+    assert result.success is True
+    sftp_client.open.assert_called_once_with("/remote/in.txt", "wb")
+    remote_file.set_pipelined.assert_called_once_with(True)
+    remote_file.write.assert_called_once_with(b"payload")
+    sftp_client.stat.assert_not_called()
+    sftp_client.remove.assert_not_called()
+
+
+@patch("paramiko.SFTPClient.from_transport")
+def test_upload_existing_file_without_overwrite(
+    mock_from_transport, tmp_path, sftp_manager, mock_connection_manager
+):
+    """Test an exclusive open failure on an existing file reports it exists"""
+    sftp_client = mock_from_transport.return_value
+    sftp_client.open.side_effect = IOError("Failure")
+    local_file = tmp_path / "in.txt"
+    local_file.write_bytes(b"payload")
+
+    result = sftp_manager.upload_file(str(local_file), "/remote/in.txt")
+
+    assert result.success is False
+    assert "already exists" in result.message
+    sftp_client.open.assert_called_once_with("/remote/in.txt", "xb")
+    sftp_client.stat.assert_called_once_with("/remote/in.txt")
+
+
+@patch("paramiko.SFTPClient.from_transport")
+def test_upload_open_failure_on_missing_file(
+    mock_from_transport, tmp_path, sftp_manager, mock_connection_manager
+):
+    """Test an open failure for a non-existent remote file is a transfer failure"""
+    sftp_client = mock_from_transport.return_value
+    sftp_client.open.side_effect = IOError("Permission denied")
+    sftp_client.stat.side_effect = IOError("No such file")
+    local_file = tmp_path / "in.txt"
+    local_file.write_bytes(b"payload")
+
+    result = sftp_manager.upload_file(str(local_file), "/remote/in.txt")
+
+    assert result.success is False
+    assert "Permission denied" in result.message
+
+
+@patch("paramiko.SFTPClient.from_transport")
+def test_upload_write_failure_removes_partial_file(
+    mock_from_transport, tmp_path, sftp_manager, mock_connection_manager
+):
+    """Test a failed write is not reported as an existing file and is cleaned up"""
+    sftp_client = mock_from_transport.return_value
+    remote_file = sftp_client.open.return_value.__enter__.return_value
+    remote_file.write.side_effect = IOError("No space left on device")
+    local_file = tmp_path / "in.txt"
+    local_file.write_bytes(b"payload")
+
+    result = sftp_manager.upload_file(str(local_file), "/remote/in.txt")
+
+    assert result.success is False
+    assert "already exists" not in result.message
+    assert "No space left on device" in result.message
+    sftp_client.remove.assert_called_once_with("/remote/in.txt")
+    sftp_client.stat.assert_not_called()
+
+
+class TestParseOctalPermissions:
+    """Tests for _parse_octal_permissions"""
+
+    @pytest.mark.parametrize(
+        "permissions,expected", [(644, 0o644), (755, 0o755), (600, 0o600), (0, 0)]
+    )
+    def test_valid_values(self, permissions, expected):
+        assert _parse_octal_permissions(permissions) == expected
+
+    @pytest.mark.parametrize("permissions", [888, 649, -644])
+    def test_invalid_values(self, permissions):
+        with pytest.raises(ValueError, match="Invalid octal permission value"):
+            _parse_octal_permissions(permissions)
+
+    def test_results_are_cached(self):
+        _parse_octal_permissions.cache_clear()
+
+        _parse_octal_permissions(644)
+        _parse_octal_permissions(644)
+
+        assert _parse_octal_permissions.cache_info().hits == 1
+
+
+class TestStatCache:
+    """Tests for the short-lived remote stat cache"""
+
+    def test_repeated_stat_is_cached(self, sftp_manager):
+        sftp_client = MagicMock()
+
+        first = sftp_manager._cached_stat(sftp_client, "/remote/file.txt")
+        second = sftp_manager._cached_stat(sftp_client, "/remote/file.txt")
+
+        assert first is second is sftp_client.stat.return_value
+        sftp_client.stat.assert_called_once_with("/remote/file.txt")
+
+    def test_missing_path_is_not_cached(self, sftp_manager):
+        """Test a file created right after a miss is seen on the next check"""
+        sftp_client = MagicMock()
+        sftp_client.stat.side_effect = IOError("No such file")
+
+        assert sftp_manager._cached_stat(sftp_client, "/remote/new") is None
+        sftp_client.stat.side_effect = None
+        assert sftp_manager._cached_stat(sftp_client, "/remote/new") is not None
+        assert sftp_client.stat.call_count == 2
+
+    def test_fresh_stat_bypasses_cached_size(self, sftp_manager):
+        """Test transfer sizing ignores a size cached before the file grew"""
+        sftp_client = MagicMock()
+        sftp_client.stat.return_value.st_size = 10
+        sftp_manager._cached_stat(sftp_client, "/remote/growing.log")
+        sftp_client.stat.return_value = MagicMock(st_size=5000)
+
+        assert sftp_manager._fresh_stat(sftp_client, "/remote/growing.log").st_size == 5000
+        assert sftp_manager._cached_stat(sftp_client, "/remote/growing.log").st_size == 5000
+
+    def test_entries_expire(self, sftp_manager):
+        sftp_client = MagicMock()
+        with patch(
+            "mcp_remote_exec.data_access.sftp_manager.time.monotonic"
+        ) as clock:
+            clock.return_value = 100.0
+            sftp_manager._cached_stat(sftp_client, "/remote/file.txt")
+            clock.return_value = 101.5
+            sftp_manager._cached_stat(sftp_client, "/remote/file.txt")
+
+        assert sftp_client.stat.call_count == 2
+
+    @patch("paramiko.SFTPClient.from_transport")
+    def test_upload_invalidates_cached_result(
+        self, mock_from_transport, tmp_path, sftp_manager, mock_connection_manager
+    ):
+        sftp_client = mock_from_transport.return_value
+        sftp_client.stat.side_effect = IOError("No such file")
+        assert sftp_manager._cached_stat(sftp_client, "/remote/in.txt") is None
+
+        local_file = tmp_path / "in.txt"
+        local_file.write_bytes(b"payload")
+        sftp_manager.upload_file(str(local_file), "/remote/in.txt")
+        sftp_client.stat.side_effect = None
+
+        assert sftp_manager._cached_stat(sftp_client, "/remote/in.txt") is not None
+        assert sftp_client.stat.call_count == 2
+
+    @patch("paramiko.SFTPClient.from_transport")
+    def test_exists_uses_cached_stat(self, mock_from_transport, sftp_manager):
+        sftp_client = mock_from_transport.return_value
+        sftp_client.stat.return_value.st_mode = stat.S_IFREG | 0o644
+
+        assert sftp_manager.exists("/remote/file.txt") is True
+        assert sftp_manager._cached_stat(sftp_client, "/remote/file.txt") is not None
+        sftp_client.stat.assert_called_once_with("/remote/file.txt")
+
+    @patch("paramiko.SFTPClient.from_transport")
+    def test_exists_missing_path(self, mock_from_transport, sftp_manager):
+        mock_from_transport.return_value.stat.side_effect = IOError("No such file")
+
+        assert sftp_manager.exists("/remote/missing") is False
+
+    @patch("paramiko.SFTPClient.from_transport")
+    def test_exists_rejects_directory(self, mock_from_transport, sftp_manager):
+        """Test a directory does not count as an existing file, like test -f"""
+        mock_from_transport.return_value.stat.return_value.st_mode = (
+            stat.S_IFDIR | 0o755
+        )
+
+        assert sftp_manager.exists("/remote/dir") is False
+
+
+class TestUploadStream:
+    """Tests for uploading from a readable stream"""
+
+    @patch("paramiko.SFTPClient.from_transport")
+    def test_stream_is_copied_to_remote_file(self, mock_from_transport, sftp_manager):
+        sftp_client = mock_from_transport.return_value
+        remote_file = sftp_client.open.return_value.__enter__.return_value
+
+        result = sftp_manager.upload_stream(
+            io.BytesIO(b"payload"), "/remote/out.bin", permissions=600
+        )
+
+        assert result.success is True
+        assert result.bytes_transferred == 7
+        sftp_client.open.assert_called_once_with("/remote/out.bin", "xb")
+        remote_file.write.assert_called_once_with(b"payload")
+        sftp_client.chmod.assert_called_once_with("/remote/out.bin", 0o600)
+
+    @patch("paramiko.SFTPClient.from_transport")
+    def test_overwrite_truncates(self, mock_from_transport, sftp_manager):
+        sftp_client = mock_from_transport.return_value
+
+        sftp_manager.upload_stream(io.BytesIO(b"x"), "/remote/out.bin", overwrite=True)
+
+        sftp_client.open.assert_called_once_with("/remote/out.bin", "wb")
+
+    @patch("paramiko.SFTPClient.from_transport")
+    def test_oversized_stream_is_removed(
+        self, mock_from_transport, sftp_manager, mock_connection_manager
+    ):
+        sftp_client = mock_from_transport.return_value
+
+        result = sftp_manager.upload_stream(io.BytesIO(b"x" * 2048), "/remote/big.bin")
+
+        assert result.success is False
+        assert "too large" in result.message
+        sftp_client.remove.assert_called_once_with("/remote/big.bin")
+
+    @patch("paramiko.SFTPClient.from_transport")
+    def test_existing_file_without_overwrite(self, mock_from_transport, sftp_manager):
+        sftp_client = mock_from_transport.return_value
+        sftp_client.open.side_effect = IOError("Failure")
+
+        result = sftp_manager.upload_stream(io.BytesIO(b"x"), "/remote/exists.bin")
+
+        assert result.success is False
+        assert "already exists" in result.message
+
+    @patch("paramiko.SFTPClient.from_transport")
+    def test_first_write_failure_removes_partial_file(
+        self, mock_from_transport, sftp_manager
+    ):
+        sftp_client = mock_from_transport.return_value
+        remote_file = sftp_client.open.return_value.__enter__.return_value
+        remote_file.write.side_effect = IOError("Connection lost")
+
+        result = sftp_manager.upload_stream(io.BytesIO(b"x"), "/remote/out.bin")
+
+        assert result.success is False
+        assert "already exists" not in result.message
+        assert "Connection lost" in result.message
+        sftp_client.remove.assert_called_once_with("/remote/out.bin")
+
+    @patch("paramiko.SFTPClient.from_transport")
+    def test_source_stream_error_removes_partial_file(
+        self, mock_from_transport, sftp_manager
+    ):
+        sftp_client = mock_from_transport.return_value
+        reader = MagicMock()
+        reader.read.side_effect = [b"x", RuntimeError("Connection broken")]
+
+        result = sftp_manager.upload_stream(reader, "/remote/out.bin")
+
+        assert result.success is False
+        assert "Connection broken" in result.message
+        sftp_client.remove.assert_called_once_with("/remote/out.bin")
+
+    def test_traversal_is_rejected(self, sftp_manager):
+        result = sftp_manager.upload_stream(io.BytesIO(b"x"), "../etc/passwd")
+
+        assert result.success is False
+        assert "traversal" in result.message
+
+
+class TestOpenReadStream:
+    """Tests for streaming reads of a remote file"""
+
+    @patch("paramiko.SFTPClient.from_transport")
+    def test_yields_prefetched_remote_file(
+        self, mock_from_transport, sftp_manager, mock_connection_manager
+    ):
+        mock_connection_manager.config.security.sftp_max_unconfirmed = 16
+        sftp_client = mock_from_transport.return_value
+        sftp_client.stat.return_value.st_size = 100
+        remote_file = sftp_client.open.return_value
+
+        with sftp_manager.open_read_stream("/remote/file.bin") as reader:
+            assert reader is remote_file
+
+        sftp_client.open.assert_called_once_with("/remote/file.bin", "rb")
+        remote_file.prefetch.assert_called_once_with(100, max_concurrent_requests=16)
+        remote_file.__exit__.assert_called_once()
+
+    @patch("paramiko.SFTPClient.from_transport")
+    def test_missing_file_raises(self, mock_from_transport, sftp_manager):
+        mock_from_transport.return_value.stat.side_effect = IOError("No such file")
+
+        with pytest.raises(SFTPError, match="does not exist"):
+            with sftp_manager.open_read_stream("/remote/missing"):
+                pass
+
+    @patch("paramiko.SFTPClient.from_transport")
+    def test_too_large_file_raises(self, mock_from_transport, sftp_manager):
+        sftp_client = mock_from_transport.return_value
+        sftp_client.stat.return_value.st_size = 4096
+
+        with pytest.raises(FileValidationError, match="too large"):
+            with sftp_manager.open_read_stream("/remote/big.bin"):
+                pass
+        sftp_client.open.assert_not_called()
+
+
+class TestVerifySha256:
+    """Tests for checksum verification fused into transfers"""
+
+    PAYLOAD = b"payload"
+    DIGEST = hashlib.sha256(PAYLOAD).hexdigest()
+
+    def _remote_digest(self, mock_connection_manager, digest):
+        mock_connection_manager.config.security.default_timeout = 30
+        mock_connection_manager.execute_command.return_value = ExecutionResult(
+            exit_code=0, stdout=f"{digest}  /remote/in.txt\n", stderr=""
+        )
+
+    @patch("paramiko.SFTPClient.from_transport")
+    def test_upload_digest_matches(
+        self, mock_from_transport, tmp_path, sftp_manager, mock_connection_manager
+    ):
+        self._remote_digest(mock_connection_manager, self.DIGEST)
+        local_file = tmp_path / "in.txt"
+        local_file.write_bytes(self.PAYLOAD)
+
+        result = sftp_manager.upload_file(
+            str(local_file), "/remote/in.txt", verify_sha256=True
+        )
+
+        assert result.success is True
+        assert result.sha256 == self.DIGEST
+        mock_connection_manager.execute_command.assert_called_once_with(
+            "sha256sum -- /remote/in.txt", 30
+        )
+
+    @patch("paramiko.SFTPClient.from_transport")
+    def test_upload_digest_mismatch_fails(
+        self, mock_from_transport, tmp_path, sftp_manager, mock_connection_manager
+    ):
+        self._remote_digest(mock_connection_manager, "0" * 64)
+        local_file = tmp_path / "in.txt"
+        local_file.write_bytes(self.PAYLOAD)
+
+        result = sftp_manager.upload_file(
+            str(local_file), "/remote/in.txt", verify_sha256=True
+        )
+
+        assert result.success is False
+        assert "SHA-256 mismatch" in result.message
+
+    @patch("paramiko.SFTPClient.from_transport")
+    def test_download_hashes_received_data(
+        self, mock_from_transport, tmp_path, sftp_manager, mock_connection_manager
+    ):
+        self._remote_digest(mock_connection_manager, self.DIGEST)
+        sftp_client = mock_from_transport.return_value
+        sftp_client.stat.return_value.st_size = len(self.PAYLOAD)
+        sftp_client.getfo.side_effect = lambda path, fl, **kwargs: fl.write(
+            self.PAYLOAD
+        )
+        local_path = tmp_path / "out.txt"
+
+        result = sftp_manager.download_file(
+            "/remote/in.txt", str(local_path), verify_sha256=True
+        )
+
+        assert result.success is True
+        assert result.sha256 == self.DIGEST
+        assert local_path.read_bytes() == self.PAYLOAD
+        sftp_client.get.assert_not_called()
+
+    def test_remote_checksum_failure_raises(self, sftp_manager, mock_connection_manager):
+        mock_connection_manager.execute_command.return_value = ExecutionResult(
+            exit_code=127, stdout="", stderr="sha256sum: command not found"
+        )
+
+        with pytest.raises(SFTPError, match="command not found"):
+            sftp_manager._remote_sha256("/remote/in.txt")
+
+
+class _FakeRemoteFile:
+    """Minimal SFTPFile stand-in that copies every write"""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.writes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set_pipelined(self, pipelined=True):
+        pass
+
+    def write(self, data):
+        self.data += data
+        self.writes += 1
+
+
+def test_put_file_large_upload_uses_mmap(tmp_path):
+    """Test large uploads are sent from a memory map in 32KB chunks"""
+    payload = bytes(range(256)) * 8192  # 2MB
+    local_file = tmp_path / "big.bin"
+    local_file.write_bytes(payload)
+    remote_file = _FakeRemoteFile()
+    sftp_client = MagicMock()
+    sftp_client.open.return_value = remote_file
+    digest = hashlib.sha256()
+
+    with patch(
+        "mcp_remote_exec.data_access.sftp_manager.mmap.mmap", wraps=mmap.mmap
+    ) as mock_mmap:
+        SFTPManager._put_file(
+            sftp_client, str(local_file), "/remote/big.bin", exclusive=False, digest=digest
+        )
+
+    mock_mmap.assert_called_once()
+    assert bytes(remote_file.data) == payload
+    assert remote_file.writes == len(payload) // 32768
+    assert digest.hexdigest() == hashlib.sha256(payload).hexdigest()
+
+
+def test_put_file_small_upload_skips_mmap(tmp_path):
+    """Test small uploads are read normally"""
+    local_file = tmp_path / "small.txt"
+    local_file.write_bytes(b"small")
+    remote_file = _FakeRemoteFile()
+    sftp_client = MagicMock()
+    sftp_client.open.return_value = remote_file
+
+    with patch("mcp_remote_exec.data_access.sftp_manager.mmap.mmap") as mock_mmap:
+        SFTPManager._put_file(
+            sftp_client, str(local_file), "/remote/small.txt", exclusive=True
+        )
+
+    mock_mmap.assert_not_called()
+    assert bytes(remote_file.data) == b"small"
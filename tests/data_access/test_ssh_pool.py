@@ -0,0 +1,277 @@
+"""
+Tests for SSHConnectionPool
+
+Tests for pool keying, client reuse, idle limits and idle expiry.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from mcp_remote_exec.config.ssh_config import HostConfig
+from mcp_remote_exec.data_access.ssh_pool import (
+    SSHConnectionPool,
+    is_client_alive,
+    make_pool_key,
+    probe_client,
+)
+
+KEY = ("test.example.com", 22, "testuser", "none")
+
+
+def _live_client():
+    """Create a mock SSH client with an active transport"""
+    client = Mock()
+    client.get_transport.return_value.is_active.return_value = True
+    return client
+
+
+def _dead_client():
+    """Create a mock SSH client whose transport has gone away"""
+    client = Mock()
+    client.get_transport.return_value = None
+    return client
+
+
+@pytest.fixture
+def pool():
+    """Create an empty pool"""
+    return SSHConnectionPool(max_idle_per_key=2, idle_timeout=60)
+
+
+class TestMakePoolKey:
+    """Tests for make_pool_key"""
+
+    def test_password_key_does_not_contain_plaintext(self, mock_host_config):
+        """Test password auth identity is hashed"""
+        key = make_pool_key(mock_host_config)
+
+        assert key[:3] == ("test.example.com", 22, "testuser")
+        assert key[3].startswith("password:")
+        assert mock_host_config.password not in key[3]
+
+    def test_key_auth_uses_key_path(self):
+        """Test key auth identity is derived from the key path"""
+        host_config = HostConfig(
+            name="test",
+            host="test.example.com",
+            port=2222,
+            username="root",
+            key_path="/keys/id_ed25519",
+        )
+
+        assert make_pool_key(host_config) == (
+            "test.example.com",
+            2222,
+            "root",
+            "key:/keys/id_ed25519",
+        )
+
+    def test_different_passwords_give_different_keys(self):
+        """Test credentials are part of the key"""
+        a = HostConfig(name="a", host="h", port=22, username="u", password="one")
+        b = HostConfig(name="b", host="h", port=22, username="u", password="two")
+
+        assert make_pool_key(a) != make_pool_key(b)
+
+
+class TestIsClientAlive:
+    """Tests for is_client_alive"""
+
+    def test_active_transport(self):
+        assert is_client_alive(_live_client()) is True
+
+    def test_missing_transport(self):
+        assert is_client_alive(_dead_client()) is False
+
+    def test_inactive_transport(self):
+        client = _live_client()
+        client.get_transport.return_value.is_active.return_value = False
+        assert is_client_alive(client) is False
+
+
+class TestProbeClient:
+    """Tests for probe_client"""
+
+    def test_live_client_passes(self):
+        client = _live_client()
+
+        assert probe_client(client) is True
+        client.get_transport.return_value.send_ignore.assert_called_once()
+
+    def test_dead_client_is_not_probed(self):
+        assert probe_client(_dead_client()) is False
+
+    def test_failed_send_fails_probe(self):
+        client = _live_client()
+        client.get_transport.return_value.send_ignore.side_effect = EOFError()
+
+        assert probe_client(client) is False
+
+    def test_disconnected_socket_fails_probe(self):
+        client = _live_client()
+        client.get_transport.return_value.getpeername.side_effect = OSError(
+            "Transport endpoint is not connected"
+        )
+
+        assert probe_client(client) is False
+
+
+class TestSSHConnectionPool:
+    """Tests for SSHConnectionPool"""
+
+    def test_checkout_empty_pool_returns_none(self, pool):
+        assert pool.checkout(KEY) is None
+
+    def test_checkin_then_checkout_reuses_client(self, pool):
+        client = _live_client()
+        pool.checkin(KEY, client)
+
+        assert pool.idle_count(KEY) == 1
+        assert pool.checkout(KEY) is client
+        assert pool.idle_count(KEY) == 0
+
+    def test_checkout_is_lifo(self, pool):
+        first, second = _live_client(), _live_client()
+        pool.checkin(KEY, first)
+        pool.checkin(KEY, second)
+
+        assert pool.checkout(KEY) is second
+
+    def test_checkin_dead_client_closes_it(self, pool):
+        client = _dead_client()
+        pool.checkin(KEY, client)
+
+        client.close.assert_called_once()
+        assert pool.idle_count() == 0
+
+    def test_checkin_beyond_cap_closes_extra(self, pool):
+        clients = [_live_client() for _ in range(3)]
+        for client in clients:
+            pool.checkin(KEY, client)
+
+        assert pool.idle_count(KEY) == 2
+        clients[2].close.assert_called_once()
+
+    def test_checkout_skips_and_closes_dead_clients(self, pool):
+        live, dying = _live_client(), _live_client()
+        pool.checkin(KEY, live)
+        pool.checkin(KEY, dying)
+        dying.get_transport.return_value.is_active.return_value = False
+
+        assert pool.checkout(KEY) is live
+        dying.close.assert_called_once()
+
+    def test_checkout_discards_client_failing_probe(self, pool):
+        live, silently_dead = _live_client(), _live_client()
+        pool.checkin(KEY, live)
+        pool.checkin(KEY, silently_dead)
+        silently_dead.get_transport.return_value.send_ignore.side_effect = OSError(
+            "Broken pipe"
+        )
+
+        assert pool.checkout(KEY) is live
+        silently_dead.close.assert_called_once()
+
+    def test_acquire_replaces_client_failing_probe(self, pool):
+        stale, fresh = _live_client(), _live_client()
+        pool.checkin(KEY, stale)
+        stale.get_transport.return_value.send_ignore.side_effect = EOFError()
+        factory = Mock(return_value=fresh)
+
+        with pool.acquire(KEY, factory) as acquired:
+            assert acquired is fresh
+
+        stale.close.assert_called_once()
+
+    def test_idle_clients_expire(self, pool):
+        client = _live_client()
+        with patch("mcp_remote_exec.data_access.ssh_pool.time.monotonic") as clock:
+            clock.return_value = 1000.0
+            pool.checkin(KEY, client)
+            clock.return_value = 1061.0
+
+            assert pool.checkout(KEY) is None
+
+        client.close.assert_called_once()
+
+    def test_keys_are_isolated(self, pool):
+        pool.checkin(KEY, _live_client())
+
+        assert pool.checkout(("other", 22, "testuser", "none")) is None
+        assert pool.idle_count(KEY) == 1
+
+    def test_acquire_creates_and_returns_client(self, pool):
+        client = _live_client()
+        factory = Mock(return_value=client)
+
+        with pool.acquire(KEY, factory) as acquired:
+            assert acquired is client
+            assert pool.idle_count(KEY) == 0
+
+        factory.assert_called_once()
+        assert pool.idle_count(KEY) == 1
+
+    def test_acquire_returns_client_on_error(self, pool):
+        client = _live_client()
+
+        with pytest.raises(RuntimeError):
+            with pool.acquire(KEY, Mock(return_value=client)):
+                raise RuntimeError("boom")
+
+        assert pool.checkout(KEY) is client
+
+    def test_acquire_propagates_factory_error(self, pool):
+        factory = Mock(side_effect=RuntimeError("connect failed"))
+
+        with pytest.raises(RuntimeError, match="connect failed"):
+            with pool.acquire(KEY, factory):
+                pass
+
+        assert pool.idle_count() == 0
+
+    def test_acquire_drains_client_after_max_uses(self, pool):
+        first, second = _live_client(), _live_client()
+        factory = Mock(side_effect=[first, second])
+
+        for _ in range(3):
+            with pool.acquire(KEY, factory, max_uses=2):
+                pass
+
+        assert factory.call_count == 2
+        first.close.assert_called_once()
+        second.close.assert_not_called()
+        assert pool.checkout(KEY) is second
+
+    def test_acquire_without_max_uses_never_drains(self, pool):
+        client = _live_client()
+        factory = Mock(return_value=client)
+
+        for _ in range(10):
+            with pool.acquire(KEY, factory):
+                pass
+
+        factory.assert_called_once()
+        client.close.assert_not_called()
+
+    def test_acquire_closes_discarded_client(self, pool):
+        first, second = _live_client(), _live_client()
+        factory = Mock(side_effect=[first, second])
+
+        with pool.acquire(KEY, factory) as client:
+            pool.discard(client)
+        with pool.acquire(KEY, factory) as client:
+            assert client is second
+
+        first.close.assert_called_once()
+        second.close.assert_not_called()
+        assert pool.checkout(KEY) is second
+
+    def test_close_all(self, pool):
+        clients = [_live_client(), _live_client()]
+        for client in clients:
+            pool.checkin(KEY, client)
+
+        pool.close_all()
+
+        assert pool.idle_count() == 0
+        for client in clients:
+            client.close.assert_called_once()
@@ -0,0 +1,13 @@
+"""Pytest fixtures for ImageKit plugin tests"""
+
+import pytest
+
+from mcp_remote_exec.plugins.imagekit import config
+
+
+@pytest.fixture(autouse=True)
+def clear_imagekit_env_cache():
+    """Re-read ImageKit environment variables in every test"""
+    config.clear_cache()
+    yield
+    config.clear_cache()
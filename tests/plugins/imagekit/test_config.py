@@ -1,9 +1,12 @@
 """Tests for ImageKit Plugin Configuration"""
 
 import os
+from dataclasses import FrozenInstanceError
 from unittest.mock import patch
 
-from mcp_remote_exec.plugins.imagekit.config import ImageKitConfig
+import pytest
+
+from mcp_remote_exec.plugins.imagekit.config import ImageKitConfig, clear_cache
 from mcp_remote_exec.config.constants import DEFAULT_TRANSFER_TIMEOUT_SECONDS
 
 
@@ -193,6 +196,43 @@ class TestImageKitConfigFromEnv:
         assert config is None
 
 
+class TestEnvCache:
+    """Tests for the cached environment lookups"""
+
+    ENV = {
+        "ENABLE_IMAGEKIT": "true",
+        "IMAGEKIT_PUBLIC_KEY": "public_key",
+        "IMAGEKIT_PRIVATE_KEY": "private_key",
+        "IMAGEKIT_URL_ENDPOINT": "https://ik.imagekit.io/test",
+    }
+
+    def test_env_changes_ignored_until_cache_cleared(self):
+        """Test values are read once and re-read after clear_cache()"""
+        with patch.dict(os.environ, self.ENV):
+            assert ImageKitConfig.from_env().folder == "/mcp-remote-exec"
+
+            os.environ["IMAGEKIT_FOLDER"] = "/changed"
+            assert ImageKitConfig.from_env().folder == "/mcp-remote-exec"
+
+            clear_cache()
+            assert ImageKitConfig.from_env().folder == "/changed"
+
+    def test_from_env_returns_cached_instance(self):
+        """Test repeated calls share one config instance"""
+        with patch.dict(os.environ, self.ENV):
+            assert ImageKitConfig.from_env() is ImageKitConfig.from_env()
+
+    def test_enabled_flag_cached(self):
+        """Test ENABLE_IMAGEKIT is parsed once"""
+        with patch.dict(os.environ, {"ENABLE_IMAGEKIT": "false"}):
+            assert ImageKitConfig.from_env() is None
+
+        with patch.dict(os.environ, self.ENV):
+            assert ImageKitConfig.from_env() is None
+            clear_cache()
+            assert ImageKitConfig.from_env() is not None
+
+
 class TestImageKitConfigDataclass:
     """Tests for ImageKitConfig dataclass"""
 
@@ -232,13 +272,14 @@ class TestImageKitConfigDataclass:
 
         assert config.transfer_timeout == 7200
 
-    def test_config_fields_are_mutable(self):
-        """Test ImageKitConfig fields can be modified"""
+    def test_config_is_frozen(self):
+        """Test ImageKitConfig fields cannot be modified after creation"""
         config = ImageKitConfig(
             public_key="key1",
             private_key="key2",
             url_endpoint="https://example.com",
         )
 
-        config.folder = "/new-folder"
-        assert config.folder == "/new-folder"
+        with pytest.raises(FrozenInstanceError):
+            config.folder = "/new-folder"
+        assert not hasattr(config, "__dict__")
@@ -1,5 +1,9 @@
 """Tests for ImageKit Client"""
 
+import io
+import os
+import shutil
+
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -21,10 +25,17 @@ def imagekit_config():
 @pytest.fixture
 def mock_imagekit_sdk():
     """Mock the ImageKit SDK"""
-    with patch("mcp_remote_exec.plugins.imagekit.imagekit_client.ImageKit") as mock:
+    with patch("imagekitio.ImageKit") as mock:
         yield mock
 
 
+@pytest.fixture
+def mock_http():
+    """Mock the shared requests session"""
+    with patch("requests.Session") as mock:
+        yield mock.return_value
+
+
 class TestImageKitClientInitialization:
     """Tests for ImageKitClient initialization"""
 
@@ -41,6 +52,41 @@ class TestImageKitClientInitialization:
         )
 
 
+class TestHTTPSession:
+    """Tests for the shared HTTP session"""
+
+    def test_sdk_requests_use_shared_session(
+        self, imagekit_config, mock_imagekit_sdk, mock_http
+    ):
+        """Test SDK REST calls are sent through the keep-alive session"""
+        client = ImageKitClient(imagekit_config)
+        ik_request = mock_imagekit_sdk.return_value.ik_request
+
+        response = ik_request.request(
+            method="Delete", url="https://api.imagekit.io/v1/files/x", headers={}
+        )
+
+        assert response is mock_http.request.return_value
+        mock_http.request.assert_called_once_with(
+            method="Delete",
+            url="https://api.imagekit.io/v1/files/x",
+            params=None,
+            files=None,
+            data=None,
+            headers={},
+        )
+        assert client._http is mock_http
+
+    def test_session_is_created_once_per_client(
+        self, imagekit_config, mock_imagekit_sdk
+    ):
+        """Test one session serves every call made by a client"""
+        with patch("requests.Session") as mock_session:
+            ImageKitClient(imagekit_config)
+
+        mock_session.assert_called_once_with()
+
+
 class TestGenerateUploadToken:
     """Tests for generate_upload_token method"""
 
@@ -106,3 +152,205 @@ class TestBuildUploadCommand:
 
         # Should contain placeholder for user to replace
         assert "LOCAL_FILE_PATH" in command
+
+
+class TestUploadStream:
+    """Tests for upload_stream method"""
+
+    def test_upload_stream_sends_stream_contents_to_sdk(
+        self, imagekit_config, mock_imagekit_sdk
+    ):
+        """Test the stream is read and handed to the SDK as a named file part"""
+        sdk = mock_imagekit_sdk.return_value
+        sdk.upload_file.return_value.file_id = "file_123"
+        sdk.upload_file.return_value.url = "https://ik.imagekit.io/test/x"
+        sdk.upload_file.return_value.name = "x"
+        reader = io.BytesIO(b"payload")
+
+        client = ImageKitClient(imagekit_config)
+        result = client.upload_stream(reader, "x")
+
+        assert result == {
+            "file_id": "file_123",
+            "url": "https://ik.imagekit.io/test/x",
+            "name": "x",
+        }
+        kwargs = sdk.upload_file.call_args.kwargs
+        assert kwargs["file"] == ("x", b"payload", None)
+        assert kwargs["file_name"] == "x"
+
+    def test_upload_stream_with_real_sdk_and_plain_stream(
+        self, imagekit_config, mock_http
+    ):
+        """Test a non-BufferedReader stream encodes through the real SDK"""
+
+        class ReadOnlyStream:
+            """Stream exposing only read(), like paramiko's SFTPFile"""
+
+            def __init__(self, data):
+                self._buffer = io.BytesIO(data)
+
+            def read(self, size=-1):
+                return self._buffer.read(size)
+
+        response = mock_http.request.return_value
+        response.status_code = 200
+        response.headers = {}
+        response.json.return_value = {
+            "fileId": "file_123",
+            "name": "x.txt",
+            "url": "https://ik.imagekit.io/test/x.txt",
+            "AITags": None,
+            "versionInfo": {"id": "v1", "name": "Version 1"},
+        }
+
+        client = ImageKitClient(imagekit_config)
+        result = client.upload_stream(ReadOnlyStream(b"payload-bytes"), "x.txt")
+
+        assert result["file_id"] == "file_123"
+        body = mock_http.request.call_args.kwargs["data"]
+        assert b"payload-bytes" in body
+        assert b'filename="x.txt"' in body
+
+
+class TestDownloadFile:
+    """Tests for download_file method"""
+
+    def test_download_streams_to_file(
+        self, mock_http, imagekit_config, mock_imagekit_sdk, tmp_path
+    ):
+        """Test the response body is written chunk by chunk"""
+        mock_imagekit_sdk.return_value.get_file_details.return_value.url = (
+            "https://ik.imagekit.io/test/file.bin"
+        )
+        response = mock_http.get.return_value.__enter__.return_value
+        response.iter_content.return_value = [b"abc", b"defg"]
+        destination = tmp_path / "nested" / "file.bin"
+
+        client = ImageKitClient(imagekit_config)
+        bytes_written = client.download_file("file_123", str(destination))
+
+        assert bytes_written == 7
+        assert destination.read_bytes() == b"abcdefg"
+        mock_http.get.assert_called_once_with(
+            "https://ik.imagekit.io/test/file.bin", timeout=(30, 300), stream=True
+        )
+        response.raise_for_status.assert_called_once()
+
+    def test_download_http_error_writes_nothing(
+        self, mock_http, imagekit_config, mock_imagekit_sdk, tmp_path
+    ):
+        """Test an HTTP error is raised before the destination is created"""
+        response = mock_http.get.return_value.__enter__.return_value
+        response.raise_for_status.side_effect = RuntimeError("404 Not Found")
+        destination = tmp_path / "file.bin"
+
+        client = ImageKitClient(imagekit_config)
+        with pytest.raises(RuntimeError, match="404"):
+            client.download_file("file_123", str(destination))
+
+        assert not destination.exists()
+
+    def test_download_creates_directory_once(
+        self, mock_http, imagekit_config, mock_imagekit_sdk, tmp_path
+    ):
+        """Test repeated downloads into one directory call makedirs once"""
+        mock_http.get.return_value.__enter__.return_value.iter_content.return_value = [b"x"]
+        client = ImageKitClient(imagekit_config)
+
+        with patch(
+            "mcp_remote_exec.plugins.imagekit.imagekit_client.os.makedirs",
+            wraps=os.makedirs,
+        ) as mock_makedirs:
+            client.download_file("a", str(tmp_path / "out" / "a.bin"))
+            client.download_file("b", str(tmp_path / "out" / "b.bin"))
+
+        mock_makedirs.assert_called_once_with(str(tmp_path / "out"), exist_ok=True)
+
+    def test_download_recreates_removed_directory(
+        self, mock_http, imagekit_config, mock_imagekit_sdk, tmp_path
+    ):
+        """Test a directory deleted after the first download is created again"""
+        mock_http.get.return_value.__enter__.return_value.iter_content.return_value = [b"x"]
+        client = ImageKitClient(imagekit_config)
+        out = tmp_path / "out"
+
+        client.download_file("a", str(out / "a.bin"))
+        shutil.rmtree(out)
+        client.download_file("b", str(out / "b.bin"))
+
+        assert (out / "b.bin").read_bytes() == b"x"
+
+
+class TestOpenDownloadStream:
+    """Tests for open_download_stream method"""
+
+    def test_yields_decoded_raw_body(self, mock_http, imagekit_config, mock_imagekit_sdk):
+        """Test the raw response body is yielded with content decoding on"""
+        mock_imagekit_sdk.return_value.get_file_details.return_value.url = (
+            "https://ik.imagekit.io/test/file.bin"
+        )
+        response = mock_http.get.return_value.__enter__.return_value
+
+        client = ImageKitClient(imagekit_config)
+        with client.open_download_stream("file_123") as reader:
+            assert reader is response.raw
+            assert reader.decode_content is True
+
+        mock_http.get.assert_called_once_with(
+            "https://ik.imagekit.io/test/file.bin", timeout=(30, 300), stream=True
+        )
+        response.raise_for_status.assert_called_once()
+
+    def test_http_error_is_raised(self, mock_http, imagekit_config, mock_imagekit_sdk):
+        """Test an HTTP error is raised before anything is yielded"""
+        response = mock_http.get.return_value.__enter__.return_value
+        response.raise_for_status.side_effect = RuntimeError("404 Not Found")
+
+        client = ImageKitClient(imagekit_config)
+        with pytest.raises(RuntimeError, match="404"):
+            with client.open_download_stream("file_123"):
+                pass
+
+
+class TestGetFileByName:
+    """Tests for get_file_by_name method"""
+
+    @staticmethod
+    def _file(name):
+        info = MagicMock()
+        info.name = name
+        info.file_id = f"id_{name}"
+        info.url = f"https://ik.imagekit.io/test/{name}"
+        return info
+
+    def test_exact_match_ignores_case(self, imagekit_config, mock_imagekit_sdk):
+        """Test a case-insensitive exact match is preferred over the first result"""
+        mock_imagekit_sdk.return_value.list_files.return_value.list = [
+            self._file("other.txt"),
+            self._file("STRASSE.txt"),
+        ]
+
+        client = ImageKitClient(imagekit_config)
+        result = client.get_file_by_name("straße.txt")
+
+        assert result["name"] == "STRASSE.txt"
+
+    def test_falls_back_to_first_result(self, imagekit_config, mock_imagekit_sdk):
+        """Test the first result is used when nothing matches exactly"""
+        mock_imagekit_sdk.return_value.list_files.return_value.list = [
+            self._file("first.txt"),
+            self._file("second.txt"),
+        ]
+
+        client = ImageKitClient(imagekit_config)
+
+        assert client.get_file_by_name("missing.txt")["file_id"] == "id_first.txt"
+
+    def test_no_results(self, imagekit_config, mock_imagekit_sdk):
+        """Test None is returned when the search finds nothing"""
+        mock_imagekit_sdk.return_value.list_files.return_value.list = []
+
+        client = ImageKitClient(imagekit_config)
+
+        assert client.get_file_by_name("missing.txt") is None
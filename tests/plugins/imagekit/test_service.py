@@ -1,6 +1,7 @@
 """Tests for ImageKit Plugin Service"""
 
 import json
+import threading
 import pytest
 from unittest.mock import MagicMock
 
@@ -33,18 +34,35 @@ def mock_file_service():
     mock = MagicMock()
     # Default: paths are valid
     mock.validate_paths.return_value = (True, None)
+    # Default: remote files do not exist yet
+    mock.exists.return_value = False
     return mock
 
 
 @pytest.fixture
 def imagekit_service(imagekit_config, mock_command_service, mock_file_service):
     """Create an ImageKitService instance with mocks"""
-    return ImageKitService(
+    service = ImageKitService(
         config=imagekit_config,
         command_service=mock_command_service,
         file_service=mock_file_service,
         enabled_plugins=set(),
     )
+    yield service
+    service.close()
+
+
+@pytest.fixture
+def proxmox_imagekit_service(imagekit_config, mock_command_service, mock_file_service):
+    """Create an ImageKitService with the Proxmox plugin enabled"""
+    service = ImageKitService(
+        config=imagekit_config,
+        command_service=mock_command_service,
+        file_service=mock_file_service,
+        enabled_plugins={"proxmox", "imagekit"},
+    )
+    yield service
+    service.close()
 
 
 class TestImageKitServiceInitialization:
@@ -59,16 +77,9 @@ class TestImageKitServiceInitialization:
         assert imagekit_service.client is not None
         assert imagekit_service.transfer_manager is not None
 
-    def test_service_with_enabled_plugins(
-        self, imagekit_config, mock_command_service, mock_file_service
-    ):
+    def test_service_with_enabled_plugins(self, proxmox_imagekit_service):
         """Test service initialization with enabled plugins"""
-        service = ImageKitService(
-            config=imagekit_config,
-            command_service=mock_command_service,
-            file_service=mock_file_service,
-            enabled_plugins={"proxmox", "imagekit"},
-        )
+        service = proxmox_imagekit_service
 
         assert "proxmox" in service.enabled_plugins
         assert "imagekit" in service.enabled_plugins
@@ -130,15 +141,10 @@ class TestRequestUpload:
         assert "proxmox" in parsed["error"].lower()
 
     def test_request_upload_with_container_proxmox_enabled(
-        self, imagekit_config, mock_command_service, mock_file_service
+        self, proxmox_imagekit_service, mock_command_service, mock_file_service
     ):
         """Test upload to container when Proxmox plugin is enabled"""
-        service = ImageKitService(
-            config=imagekit_config,
-            command_service=mock_command_service,
-            file_service=mock_file_service,
-            enabled_plugins={"proxmox"},  # Proxmox enabled
-        )
+        service = proxmox_imagekit_service
 
         result = service.request_upload(
             remote_path="/tmp/test.txt",
@@ -152,6 +158,21 @@ class TestRequestUpload:
         assert "transfer_id" in parsed
         assert "upload_command" in parsed
 
+    @pytest.mark.parametrize("ctid", [None, 100])
+    def test_request_upload_does_not_check_existence(
+        self, proxmox_imagekit_service, mock_command_service, mock_file_service, ctid
+    ):
+        """Test no existence preflight runs; it is done when the file is written"""
+        service = proxmox_imagekit_service
+
+        result = service.request_upload(
+            remote_path="/tmp/test.txt", overwrite=False, ctid=ctid
+        )
+
+        assert "transfer_id" in json.loads(result)
+        mock_file_service.exists.assert_not_called()
+        mock_command_service.execute_command_raw.assert_not_called()
+
 
 class TestRequestDownload:
     """Tests for request_download method"""
@@ -201,6 +222,66 @@ class TestRequestDownload:
         assert "proxmox" in parsed["error"].lower()
 
 
+    def test_request_download_missing_host_file(
+        self, imagekit_service, mock_command_service, mock_file_service
+    ):
+        """Test a missing host file is reported without running a command"""
+        result = imagekit_service.request_download(remote_path="/tmp/missing.txt")
+
+        parsed = json.loads(result)
+        assert parsed["success"] is False
+        assert "not found" in parsed["error"]
+        mock_command_service.execute_command_raw.assert_not_called()
+        mock_file_service.download_file_raw.assert_not_called()
+
+    def test_request_download_container_check_and_pull_in_one_command(
+        self, proxmox_imagekit_service, mock_command_service, mock_file_service
+    ):
+        """Test the container existence check is folded into the pull"""
+        service = proxmox_imagekit_service
+        mock_command_service.execute_command_raw.return_value = MagicMock(
+            exit_code=0, stdout="MISSING\n", stderr=""
+        )
+
+        result = service.request_download(remote_path="/tmp/missing.txt", ctid=100)
+
+        parsed = json.loads(result)
+        assert parsed["success"] is False
+        assert "container 100" in parsed["error"]
+        mock_command_service.execute_command_raw.assert_called_once()
+        command = mock_command_service.execute_command_raw.call_args[0][0]
+        assert "test -f /tmp/missing.txt" in command
+        assert "pct pull 100 /tmp/missing.txt" in command
+        mock_file_service.exists.assert_not_called()
+        assert service.transfer_manager.get_active_count() == 0
+
+    def test_request_download_streams_to_imagekit(
+        self, imagekit_service, mock_file_service
+    ):
+        """Test the remote file is piped to ImageKit without a local temp file"""
+        mock_file_service.exists.return_value = True
+        imagekit_service.client = MagicMock()
+        imagekit_service.client.upload_stream.return_value = {
+            "file_id": "file_123",
+            "url": "https://ik.imagekit.io/test/x",
+            "name": "x",
+        }
+        stream = mock_file_service.open_download_stream_raw.return_value
+        reader = stream.__enter__.return_value
+
+        result = imagekit_service.request_download(remote_path="/tmp/test.txt")
+
+        parsed = json.loads(result)
+        assert parsed["download_url"] == "https://ik.imagekit.io/test/x"
+        mock_file_service.open_download_stream_raw.assert_called_once_with(
+            "/tmp/test.txt"
+        )
+        upload_args = imagekit_service.client.upload_stream.call_args[0]
+        assert upload_args[0] is reader
+        mock_file_service.download_file_raw.assert_not_called()
+        imagekit_service.client.upload_file.assert_not_called()
+
+
 class TestConfirmUpload:
     """Tests for confirm_upload method"""
 
@@ -233,6 +314,162 @@ class TestConfirmUpload:
         parsed = json.loads(result)
         assert parsed["success"] is False
 
+    def test_confirm_upload_streams_to_host(
+        self, imagekit_service, mock_file_service
+    ):
+        """Test the ImageKit body is piped to SFTP without a local temp file"""
+        imagekit_service.client = MagicMock()
+        reader = imagekit_service.client.open_download_stream.return_value.__enter__.return_value
+        mock_file_service.upload_stream_raw.return_value = MagicMock(
+            success=True, bytes_transferred=42
+        )
+        transfer = imagekit_service.transfer_manager.create_transfer(
+            operation=TransferOperation.UPLOAD,
+            remote_path="/tmp/test.txt",
+            permissions=644,
+        )
+
+        result = imagekit_service.confirm_upload(
+            transfer_id=transfer.transfer_id, file_id="file_123"
+        )
+
+        parsed = json.loads(result)
+        assert parsed["success"] is True
+        assert parsed["bytes_transferred"] == 42
+        imagekit_service.client.open_download_stream.assert_called_once_with("file_123")
+        mock_file_service.upload_stream_raw.assert_called_once_with(
+            reader, remote_path="/tmp/test.txt", permissions=644, overwrite=False
+        )
+        mock_file_service.upload_file_raw.assert_not_called()
+        imagekit_service.client.download_file.assert_not_called()
+        imagekit_service._cleanup_executor.shutdown(wait=True)
+        imagekit_service.client.delete_file.assert_called_once_with("file_123")
+
+    def test_confirm_upload_does_not_wait_for_imagekit_delete(
+        self, imagekit_service, mock_command_service, mock_file_service
+    ):
+        """Test the response is returned while the ImageKit delete still runs"""
+        release, finished = threading.Event(), threading.Event()
+
+        def slow_delete(file_id):
+            release.wait(5)
+            finished.set()
+
+        imagekit_service.client = MagicMock()
+        imagekit_service.client.delete_file.side_effect = slow_delete
+        mock_command_service.execute_pipeline.return_value = MagicMock(
+            exit_code=0, stdout="", stderr=""
+        )
+        mock_file_service.upload_stream_raw.return_value = MagicMock(
+            success=True, bytes_transferred=1
+        )
+        transfer = imagekit_service.transfer_manager.create_transfer(
+            operation=TransferOperation.UPLOAD,
+            remote_path="/tmp/test.txt",
+            ctid=100,
+        )
+
+        result = imagekit_service.confirm_upload(
+            transfer_id=transfer.transfer_id, file_id="file_123"
+        )
+
+        assert json.loads(result)["success"] is True
+        assert not finished.is_set()
+        release.set()
+        imagekit_service._cleanup_executor.shutdown(wait=True)
+        imagekit_service.client.delete_file.assert_called_once_with("file_123")
+
+    def test_confirm_upload_container_steps_share_one_command(
+        self, imagekit_service, mock_command_service, mock_file_service
+    ):
+        """Test push, chmod and temp cleanup run as one quoted pipeline"""
+        imagekit_service.client = MagicMock()
+        mock_file_service.upload_stream_raw.return_value = MagicMock(
+            success=True, bytes_transferred=1
+        )
+        mock_command_service.execute_pipeline.return_value = MagicMock(
+            exit_code=0, stdout="", stderr=""
+        )
+        transfer = imagekit_service.transfer_manager.create_transfer(
+            operation=TransferOperation.UPLOAD,
+            remote_path="/srv/my file.txt",
+            permissions=644,
+            overwrite=True,
+            ctid=100,
+        )
+
+        result = imagekit_service.confirm_upload(
+            transfer_id=transfer.transfer_id, file_id="file_123"
+        )
+
+        assert json.loads(result)["success"] is True
+        temp_path = f"/tmp/mcp-imagekit-upload-{transfer.transfer_id}"
+        mock_command_service.execute_pipeline.assert_called_once_with(
+            [
+                f"pct push 100 {temp_path} '/srv/my file.txt'",
+                "{ pct exec 100 -- chmod 644 '/srv/my file.txt' || true; }",
+                f"rm -f {temp_path}",
+            ],
+            30,
+        )
+        mock_command_service.execute_command_raw.assert_not_called()
+
+    def test_confirm_upload_container_refuses_existing_file(
+        self, imagekit_service, mock_command_service, mock_file_service
+    ):
+        """Test the container push is guarded by an existence check"""
+        imagekit_service.client = MagicMock()
+        mock_file_service.upload_stream_raw.return_value = MagicMock(
+            success=True, bytes_transferred=1
+        )
+        mock_command_service.execute_pipeline.return_value = MagicMock(
+            exit_code=1, stdout="EXISTS\n", stderr=""
+        )
+        transfer = imagekit_service.transfer_manager.create_transfer(
+            operation=TransferOperation.UPLOAD,
+            remote_path="/tmp/test.txt",
+            overwrite=False,
+            ctid=100,
+        )
+
+        result = imagekit_service.confirm_upload(
+            transfer_id=transfer.transfer_id, file_id="file_123"
+        )
+
+        parsed = json.loads(result)
+        assert parsed["success"] is False
+        assert "already exists in container 100" in parsed["error"]
+        steps = mock_command_service.execute_pipeline.call_args[0][0]
+        assert steps[0].startswith("if pct exec 100 -- test -f /tmp/test.txt;")
+        assert steps[1].startswith("pct push 100")
+        imagekit_service._cleanup_executor.shutdown(wait=True)
+        imagekit_service.client.delete_file.assert_called_once_with("file_123")
+
+    def test_confirm_upload_host_existing_file_deletes_imagekit_copy(
+        self, imagekit_service, mock_file_service
+    ):
+        """Test a refused host upload still removes the file from ImageKit"""
+        imagekit_service.client = MagicMock()
+        mock_file_service.upload_stream_raw.return_value = MagicMock(
+            success=False,
+            message="Remote file already exists: /tmp/test.txt",
+            error="Remote file already exists: /tmp/test.txt",
+        )
+        transfer = imagekit_service.transfer_manager.create_transfer(
+            operation=TransferOperation.UPLOAD,
+            remote_path="/tmp/test.txt",
+            overwrite=False,
+        )
+
+        result = imagekit_service.confirm_upload(
+            transfer_id=transfer.transfer_id, file_id="file_123"
+        )
+
+        assert json.loads(result)["success"] is False
+        assert imagekit_service.transfer_manager.get_transfer(transfer.transfer_id) is None
+        imagekit_service._cleanup_executor.shutdown(wait=True)
+        imagekit_service.client.delete_file.assert_called_once_with("file_123")
+
 
 class TestConfirmDownload:
     """Tests for confirm_download method"""
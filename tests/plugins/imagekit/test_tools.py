@@ -7,6 +7,8 @@ Tests all ImageKit plugin tools to ensure:
 - Tool functions integrate properly with the ImageKit service
 """
 
+import threading
+
 import pytest
 from unittest.mock import MagicMock
 from fastmcp import FastMCP
@@ -228,6 +230,25 @@ class TestImageKitConfirmUpload:
             file_id="690b82f45c7cd75eb8328078"
         )
 
+    @pytest.mark.asyncio
+    async def test_confirm_upload_runs_off_event_loop_thread(
+        self, mock_mcp, mock_container, tool_functions
+    ):
+        """Test the blocking transfer runs in a worker thread"""
+        register_imagekit_tools(mock_mcp, mock_container)
+        imagekit_service = mock_container.plugin_services["imagekit"]
+        loop_thread = threading.get_ident()
+        call_threads = []
+        imagekit_service.confirm_upload.side_effect = (
+            lambda **kwargs: call_threads.append(threading.get_ident()) or "ok"
+        )
+
+        tool = tool_functions["imagekit_confirm_upload"]
+        result = await tool(transfer_id="test-123")
+
+        assert result == "ok"
+        assert call_threads and call_threads[0] != loop_thread
+
     @pytest.mark.asyncio
     async def test_confirm_upload_with_empty_transfer_id(
         self, mock_mcp, mock_container, tool_functions
@@ -1,6 +1,11 @@
 """Tests for ImageKit Transfer Manager"""
 
+import heapq
+import threading
+import time
+
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
@@ -250,6 +255,110 @@ class TestCleanupExpiredTransfers:
         assert removed_count == 2
         assert transfer_manager.get_active_count() == 0
 
+    def test_cleanup_skips_completed_transfers(self, transfer_manager):
+        """Test expired entries of already completed transfers are not counted"""
+        old_time = datetime.now() - timedelta(seconds=7200)
+
+        with patch("mcp_remote_exec.plugins.imagekit.transfer_manager.datetime") as mock_dt:
+            mock_dt.now.return_value = old_time
+            done = transfer_manager.create_transfer(
+                operation=TransferOperation.UPLOAD,
+                remote_path="/tmp/done.txt",
+            )
+            transfer_manager.create_transfer(
+                operation=TransferOperation.UPLOAD,
+                remote_path="/tmp/stale.txt",
+            )
+        transfer_manager.complete_transfer(done.transfer_id)
+
+        assert transfer_manager.cleanup_expired_transfers() == 1
+        assert transfer_manager.get_active_count() == 0
+        assert transfer_manager._expiry == []
+
+    def test_cleanup_stops_at_first_unexpired_entry(self, transfer_manager):
+        """Test cleanup only inspects entries that are actually expired"""
+        for i in range(3):
+            transfer_manager.create_transfer(
+                operation=TransferOperation.UPLOAD,
+                remote_path=f"/tmp/file{i}.txt",
+            )
+
+        assert transfer_manager.cleanup_expired_transfers() == 0
+        assert len(transfer_manager._expiry) == 3
+
+    def test_concurrent_cleanup_never_removes_live_transfers(self, transfer_manager):
+        """Test racing cleanups only pop expired entries"""
+        old_time = datetime.now() - timedelta(seconds=7200)
+        with patch("mcp_remote_exec.plugins.imagekit.transfer_manager.datetime") as mock_dt:
+            mock_dt.now.return_value = old_time
+            for i in range(20):
+                transfer_manager.create_transfer(
+                    operation=TransferOperation.UPLOAD, remote_path=f"/tmp/old{i}"
+                )
+        live = [
+            transfer_manager.create_transfer(
+                operation=TransferOperation.UPLOAD, remote_path=f"/tmp/live{i}"
+            )
+            for i in range(5)
+        ]
+        barrier = threading.Barrier(8)
+        real_heappop = heapq.heappop
+
+        def slow_heappop(heap):
+            time.sleep(0.001)  # Invite a thread switch between check and pop
+            return real_heappop(heap)
+
+        def cleanup():
+            barrier.wait()
+            return transfer_manager.cleanup_expired_transfers()
+
+        with patch(
+            "mcp_remote_exec.plugins.imagekit.transfer_manager.heapq.heappop",
+            side_effect=slow_heappop,
+        ):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                removed = list(pool.map(lambda _: cleanup(), range(8)))
+
+        assert sum(removed) == 20
+        for transfer in live:
+            assert transfer_manager.get_transfer(transfer.transfer_id) is not None
+
+
+class TestConcurrentAccess:
+    """Tests for thread safety of TransferManager"""
+
+    def test_concurrent_create_and_cleanup(self, transfer_manager):
+        """Test creates racing cleanups keep the transfers and heap consistent"""
+        barrier = threading.Barrier(8)
+
+        def worker(index):
+            barrier.wait()
+            created = []
+            for i in range(50):
+                created.append(
+                    transfer_manager.create_transfer(
+                        operation=TransferOperation.UPLOAD,
+                        remote_path=f"/tmp/{index}-{i}",
+                    )
+                )
+                transfer_manager.cleanup_expired_transfers()
+            return created
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            created = [t for batch in pool.map(worker, range(8)) for t in batch]
+
+        assert transfer_manager.get_active_count() == 400
+        for transfer in created:
+            assert transfer_manager.get_transfer(transfer.transfer_id) is transfer
+        heap = transfer_manager._expiry
+        assert len(heap) == 400
+        assert all(
+            heap[i] <= heap[child]
+            for i in range(len(heap))
+            for child in (2 * i + 1, 2 * i + 2)
+            if child < len(heap)
+        )
+
 
 class TestClearAll:
     """Tests for clear_all method"""
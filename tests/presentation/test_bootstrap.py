@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import MagicMock, patch
 from fastmcp import FastMCP
 
+from mcp_remote_exec.data_access.ssh_pool import get_default_pool
 from mcp_remote_exec.presentation import bootstrap
 from mcp_remote_exec.presentation.service_container import ServiceContainer
 from mcp_remote_exec.config.exceptions import ConfigError
@@ -68,7 +69,7 @@ class TestInitialization:
         mock_config_instance = MagicMock()
         mock_config_instance.validate.return_value = (True, None)
         mock_config_instance.get_host.return_value = MagicMock(name="test.example.com")
-        mock_ssh_config.return_value = mock_config_instance
+        mock_ssh_config.from_env.return_value = mock_config_instance
 
         # Setup mock plugin registry
         mock_registry_instance = MagicMock()
@@ -88,7 +89,7 @@ class TestInitialization:
         # Setup mock config with validation failure
         mock_config_instance = MagicMock()
         mock_config_instance.validate.return_value = (False, "Missing HOST configuration")
-        mock_ssh_config.return_value = mock_config_instance
+        mock_ssh_config.from_env.return_value = mock_config_instance
 
         # Should raise ConfigError
         with pytest.raises(ConfigError) as exc_info:
@@ -119,7 +120,7 @@ class TestInitialization:
         mock_config_instance = MagicMock()
         mock_config_instance.validate.return_value = (True, None)
         mock_config_instance.get_host.return_value = MagicMock(name="test.example.com")
-        mock_ssh_config.return_value = mock_config_instance
+        mock_ssh_config.from_env.return_value = mock_config_instance
 
         mock_registry_instance = MagicMock()
         mock_registry_instance.discover_and_register.return_value = []
@@ -129,8 +130,10 @@ class TestInitialization:
         bootstrap.initialize(mock_mcp_server)
 
         # Verify all services were created
-        mock_ssh_config.assert_called_once()
-        mock_connection_manager.assert_called_once_with(mock_config_instance)
+        mock_ssh_config.from_env.assert_called_once()
+        mock_connection_manager.assert_called_once_with(
+            mock_config_instance, pool=get_default_pool()
+        )
         mock_sftp_manager.assert_called_once()
         mock_command_service.assert_called_once()
         mock_file_service.assert_called_once()
@@ -159,7 +162,7 @@ class TestInitialization:
         mock_config_instance = MagicMock()
         mock_config_instance.validate.return_value = (True, None)
         mock_config_instance.get_host.return_value = MagicMock(name="test.example.com")
-        mock_ssh_config.return_value = mock_config_instance
+        mock_ssh_config.from_env.return_value = mock_config_instance
 
         mock_registry_instance = MagicMock()
         mock_registry_instance.discover_and_register.return_value = ["proxmox", "imagekit"]
@@ -200,7 +203,7 @@ class TestInitialization:
         mock_config_instance = MagicMock()
         mock_config_instance.validate.return_value = (True, None)
         mock_config_instance.get_host.return_value = MagicMock(name="test.example.com")
-        mock_ssh_config.return_value = mock_config_instance
+        mock_ssh_config.from_env.return_value = mock_config_instance
 
         # No ImageKit plugin
         mock_registry_instance = MagicMock()
@@ -238,7 +241,7 @@ class TestInitialization:
         mock_config_instance = MagicMock()
         mock_config_instance.validate.return_value = (True, None)
         mock_config_instance.get_host.return_value = MagicMock(name="test.example.com")
-        mock_ssh_config.return_value = mock_config_instance
+        mock_ssh_config.from_env.return_value = mock_config_instance
 
         # ImageKit plugin enabled - mock registry to populate enabled_plugins
         mock_registry_instance = MagicMock()
@@ -286,7 +289,7 @@ class TestSingletonPattern:
         mock_config_instance = MagicMock()
         mock_config_instance.validate.return_value = (True, None)
         mock_config_instance.get_host.return_value = MagicMock(name="test.example.com")
-        mock_ssh_config.return_value = mock_config_instance
+        mock_ssh_config.from_env.return_value = mock_config_instance
 
         mock_registry_instance = MagicMock()
         mock_registry_instance.discover_and_register.return_value = []
@@ -322,7 +325,7 @@ class TestSingletonPattern:
         mock_config_instance = MagicMock()
         mock_config_instance.validate.return_value = (True, None)
         mock_config_instance.get_host.return_value = MagicMock(name="test.example.com")
-        mock_ssh_config.return_value = mock_config_instance
+        mock_ssh_config.from_env.return_value = mock_config_instance
 
         mock_registry_instance = MagicMock()
         mock_registry_instance.discover_and_register.return_value = []
@@ -336,3 +339,42 @@ class TestSingletonPattern:
 
         # Should be the same instance
         assert container1 is container2
+
+
+class TestShutdown:
+    """Tests for shutdown()"""
+
+    def test_shutdown_before_initialize_is_noop(self):
+        """Test shutdown() does nothing when the application never started"""
+        bootstrap.shutdown()
+
+    def test_shutdown_closes_connections_and_pool(self):
+        """Test shutdown() closes the SFTP channel, SSH client and pool"""
+        container = MagicMock(spec=ServiceContainer)
+        container.sftp_manager = MagicMock()
+        container.connection_manager = MagicMock()
+        container.connection_pool = MagicMock()
+        container.plugin_services = {}
+        bootstrap._app_context = container
+
+        bootstrap.shutdown()
+
+        container.sftp_manager.close_sftp_connection.assert_called_once()
+        container.connection_manager.close_connection.assert_called_once()
+        container.connection_pool.close_all.assert_called_once()
+
+    def test_shutdown_closes_imagekit_before_pool(self):
+        """Test the ImageKit cleanup executor is drained before SSH is closed"""
+        calls = MagicMock()
+        container = MagicMock(spec=ServiceContainer)
+        container.sftp_manager = calls.sftp_manager
+        container.connection_manager = calls.connection_manager
+        container.connection_pool = calls.connection_pool
+        container.plugin_services = {"imagekit": calls.imagekit}
+        bootstrap._app_context = container
+
+        bootstrap.shutdown()
+
+        names = [name for name, _, _ in calls.mock_calls]
+        assert names[0] == "imagekit.close"
+        assert names.index("imagekit.close") < names.index("connection_pool.close_all")
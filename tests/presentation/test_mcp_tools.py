@@ -7,6 +7,8 @@ Tests the ssh_exec_command tool and file transfer tools to ensure:
 - Tool functions integrate properly with services
 """
 
+import threading
+
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -64,7 +66,8 @@ class TestSSHExecCommand:
         mock_container.command_service.execute_command.assert_called_once_with(
             command="ls -la",
             timeout=30,
-            response_format="text"
+            response_format="text",
+            cacheable=False
         )
         assert result == "Success output"
 
@@ -85,7 +88,8 @@ class TestSSHExecCommand:
         mock_container.command_service.execute_command.assert_called_once_with(
             command="whoami",
             timeout=10,
-            response_format="json"
+            response_format="json",
+            cacheable=False
         )
         assert result == '{"status": "ok"}'
 
@@ -161,6 +165,22 @@ class TestSSHExecCommand:
         mock_container.output_formatter.format_error_result.assert_called_once()
         assert "error" in result.lower()
 
+    @pytest.mark.asyncio
+    @patch("mcp_remote_exec.presentation.mcp_tools.bootstrap.get_container")
+    async def test_ssh_exec_command_runs_off_event_loop_thread(self, mock_get_container, mock_container):
+        """Test the blocking command service call runs in a worker thread"""
+        mock_get_container.return_value = mock_container
+        loop_thread = threading.get_ident()
+        call_threads = []
+        mock_container.command_service.execute_command.side_effect = (
+            lambda **kwargs: call_threads.append(threading.get_ident()) or "ok"
+        )
+
+        result = await mcp_tools.ssh_exec_command.fn(command="ls")
+
+        assert result == "ok"
+        assert call_threads and call_threads[0] != loop_thread
+
 
 class TestSSHFileTransferTools:
     """Tests for SSH file transfer tools (upload/download)"""
@@ -205,7 +225,8 @@ class TestSSHFileTransferTools:
             local_path="/tmp/test.txt",
             remote_path="/data/test.txt",
             permissions=644,
-            overwrite=False
+            overwrite=False,
+            verify_sha256=False
         )
         assert result == "Upload successful"
 
@@ -280,7 +301,8 @@ class TestSSHFileTransferTools:
         mock_container.file_service.download_file.assert_called_once_with(
             remote_path="/data/test.txt",
             local_path="/tmp/test.txt",
-            overwrite=True
+            overwrite=True,
+            verify_sha256=False
         )
         assert result == "Download successful"
 
@@ -0,0 +1,83 @@
+"""
+Tests for CommandResultCache
+
+Tests for TTL expiry, LRU eviction and the built-in cacheable command allowlist.
+"""
+
+import pytest
+from unittest.mock import patch
+from mcp_remote_exec.data_access.ssh_connection_manager import ExecutionResult
+from mcp_remote_exec.services.command_cache import (
+    CommandResultCache,
+    is_cacheable_command,
+)
+
+KEY = ("test.example.com", 22, "testuser", "uname -a")
+
+
+def _result(stdout="Linux"):
+    return ExecutionResult(exit_code=0, stdout=stdout, stderr="", command="uname -a")
+
+
+@pytest.mark.parametrize(
+    "command",
+    ["uname", "uname -a", "hostname", "cat /etc/os-release", "lsb_release -a", " hostname "],
+)
+def test_allowlisted_commands_are_cacheable(command):
+    assert is_cacheable_command(command) is True
+
+
+@pytest.mark.parametrize(
+    "command", ["ls", "uname -a; rm -rf /tmp/x", "hostname newname", "cat /etc/passwd"]
+)
+def test_other_commands_are_not_cacheable(command):
+    assert is_cacheable_command(command) is False
+
+
+def test_get_miss_returns_none():
+    assert CommandResultCache().get(KEY) is None
+
+
+def test_get_hit_marks_result_cached():
+    cache = CommandResultCache()
+    original = _result()
+    cache.put(KEY, original)
+
+    hit = cache.get(KEY)
+
+    assert hit is not None
+    assert hit.cached is True
+    assert hit.stdout == "Linux"
+    assert original.cached is False
+
+
+def test_entries_expire_after_ttl():
+    cache = CommandResultCache(ttl=30)
+    with patch("mcp_remote_exec.services.command_cache.time.monotonic") as clock:
+        clock.return_value = 100.0
+        cache.put(KEY, _result())
+        clock.return_value = 129.0
+        assert cache.get(KEY) is not None
+        clock.return_value = 130.0
+        assert cache.get(KEY) is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = CommandResultCache(maxsize=2)
+    keys = [KEY[:3] + (f"cmd{i}",) for i in range(3)]
+    cache.put(keys[0], _result("0"))
+    cache.put(keys[1], _result("1"))
+    cache.get(keys[0])
+    cache.put(keys[2], _result("2"))
+
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+
+
+def test_clear():
+    cache = CommandResultCache()
+    cache.put(KEY, _result())
+    cache.clear()
+    assert len(cache) == 0
@@ -120,3 +120,74 @@ def test_execute_command_raw_propagates_exceptions(
     # Execute and assert exception is raised
     with pytest.raises(CommandExecutionError):
         command_service.execute_command_raw("test", 30)
+
+
+def test_execute_command_reuses_result_for_allowlisted_command(
+    command_service, mock_connection_manager
+):
+    """Test allowlisted discovery commands are answered from the cache"""
+    mock_connection_manager.execute_command.return_value = ExecutionResult(
+        exit_code=0, stdout="Linux", stderr="", command="uname -a"
+    )
+
+    first = command_service.execute_command("uname -a")
+    second = command_service.execute_command("uname -a")
+
+    mock_connection_manager.execute_command.assert_called_once_with("uname -a", 30)
+    assert "[CACHED]" not in first
+    assert "[CACHED]" in second
+
+
+def test_execute_command_does_not_cache_by_default(
+    command_service, mock_connection_manager
+):
+    """Test ordinary commands always run"""
+    mock_connection_manager.execute_command.return_value = ExecutionResult(
+        exit_code=0, stdout="ok", stderr="", command="date"
+    )
+
+    command_service.execute_command("date")
+    command_service.execute_command("date")
+
+    assert mock_connection_manager.execute_command.call_count == 2
+
+
+def test_execute_command_cacheable_opt_in(command_service, mock_connection_manager):
+    """Test cacheable=True enables caching for any command"""
+    mock_connection_manager.execute_command.return_value = ExecutionResult(
+        exit_code=0, stdout="ok", stderr="", command="df -h"
+    )
+
+    command_service.execute_command("df -h", cacheable=True)
+    result = command_service.execute_command(
+        "df -h", response_format="json", cacheable=True
+    )
+
+    mock_connection_manager.execute_command.assert_called_once()
+    assert '"cached": true' in result
+
+
+def test_execute_command_does_not_cache_failures(
+    command_service, mock_connection_manager
+):
+    """Test non-zero exit codes are not cached"""
+    mock_connection_manager.execute_command.return_value = ExecutionResult(
+        exit_code=1, stdout="", stderr="boom", command="hostname"
+    )
+
+    command_service.execute_command("hostname")
+    command_service.execute_command("hostname")
+
+    assert mock_connection_manager.execute_command.call_count == 2
+
+
+def test_execute_pipeline_runs_commands_in_one_exec(
+    command_service, mock_connection_manager
+):
+    """Test that execute_pipeline chains commands with && in a single call"""
+    result = command_service.execute_pipeline(["pct push 1 a b", "rm -f a"], 30)
+
+    mock_connection_manager.execute_command.assert_called_once_with(
+        "pct push 1 a b && rm -f a", 30
+    )
+    assert result is mock_connection_manager.execute_command.return_value
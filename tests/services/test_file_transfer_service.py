@@ -86,3 +86,11 @@ def test_download_file_delegates_to_sftp_manager(
 
     # This verifies the service is properly structured
     assert file_transfer_service.sftp_manager == mock_sftp_manager
+
+
+def test_exists_delegates_to_sftp_manager(file_transfer_service, mock_sftp_manager):
+    """Test that exists uses the SFTP manager's stat check"""
+    mock_sftp_manager.exists.return_value = True
+
+    assert file_transfer_service.exists("/remote/file") is True
+    mock_sftp_manager.exists.assert_called_once_with("/remote/file")
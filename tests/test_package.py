@@ -0,0 +1,65 @@
+"""Tests for the package's lazy top-level exports"""
+
+import subprocess
+import sys
+
+import pytest
+
+import mcp_remote_exec
+
+
+@pytest.mark.parametrize("name", mcp_remote_exec.__all__)
+def test_exported_names_resolve(name):
+    """Test every name in __all__ can be imported from the package"""
+    value = getattr(mcp_remote_exec, name)
+    assert value.__name__ == name
+
+
+def test_unknown_attribute_raises():
+    """Test unknown attributes still raise AttributeError"""
+    with pytest.raises(AttributeError):
+        mcp_remote_exec.DoesNotExist  # noqa: B018
+
+
+def test_import_does_not_load_paramiko():
+    """Test importing the package alone defers heavy dependencies"""
+    code = (
+        "import sys, mcp_remote_exec; "
+        "mcp_remote_exec.__version__; "
+        "print('paramiko' in sys.modules, 'fastmcp' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False False"
+
+
+def test_data_access_and_services_do_not_load_paramiko_on_import():
+    """Test paramiko is only imported when an SSH connection is first needed"""
+    code = (
+        "import sys, mcp_remote_exec.data_access, mcp_remote_exec.services; "
+        "print('paramiko' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_imagekit_plugin_does_not_load_sdk_on_import():
+    """Test the ImageKit SDK and requests are only imported when a client is built"""
+    code = (
+        "import sys, mcp_remote_exec.plugins.imagekit.imagekit_client; "
+        "print('imagekitio' in sys.modules, 'requests' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False False"
+
+
+def test_response_format_is_single_canonical_enum():
+    """Test the package re-exports the common-layer ResponseFormat"""
+    from mcp_remote_exec.common.enums import ResponseFormat
+
+    assert mcp_remote_exec.ResponseFormat is ResponseFormat